@@ -421,6 +421,7 @@ class IncidentGenerator:
                     batch.append({
                         "_op_type": "create",
                         "_index": "incidentiq-incidents",
+                        "_id": incident_id,
                         "_source": incident
                     })
                 
@@ -30,14 +30,17 @@ import asyncio
 import json
 import os
 import random
+import sys
 import time
 import uuid
+from bisect import bisect_left
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional
 
 import numpy as np
 from dotenv import load_dotenv
-from elasticsearch import Elasticsearch
+from elasticsearch import AsyncElasticsearch, helpers
 from rich.console import Console
 from rich.live import Live
 from rich.panel import Panel
@@ -47,6 +50,26 @@ from rich.text import Text
 from rich.layout import Layout
 from rich.align import Align
 
+# Optional uvloop event loop (libuv-based, lower per-callback overhead)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Optional orjson encoding for request and bulk/msearch bodies (the client
+# only defines OrjsonSerializer when orjson is installed)
+try:
+    from elasticsearch.serializer import NdjsonSerializer, OrjsonSerializer
+
+    class OrjsonNdjsonSerializer(OrjsonSerializer, NdjsonSerializer):
+        """Newline-delimited bodies with each line encoded by orjson"""
+        mimetype = "application/x-ndjson"
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Load environment
 load_dotenv()
 
@@ -77,11 +100,18 @@ SERVICES = {
 
 TARGET_SERVICE = "api-gateway"
 
+# HTTP statuses returned by failing requests
+ERROR_STATUSES = (500, 503, 504)
+
 # Elasticsearch indexes
 LOGS_INDEX = "logs-app"
 METRICS_INDEX = "metrics-system"
 INCIDENTS_INDEX = "incidentiq-incidents"
 
+# Bulk flush sizing: chunk_size <= max_chunk_bytes / avg doc size (~0.5-1KB)
+BULK_CHUNK_SIZE = 500
+BULK_MAX_CHUNK_BYTES = 5 * 1024 * 1024
+
 # Simulation phases (durations in seconds at 1x speed)
 PHASES = {
     "normal": {
@@ -116,6 +146,55 @@ PHASES = {
     }
 }
 
+# Event log panel height; two rows go to the border, the rest show events
+EVENT_LOG_HEIGHT = 12
+EVENT_LOG_LINES = EVENT_LOG_HEIGHT - 2
+
+# Dashboard re-renders when state changes, at most every DISPLAY_MIN_INTERVAL
+# seconds and at least every DISPLAY_MAX_INTERVAL so phase progress still ticks
+DISPLAY_MIN_INTERVAL = 0.25
+DISPLAY_MAX_INTERVAL = 1.0
+
+# Static dashboard text per phase, formatted once at import
+PHASE_HEADER_PREFIX = {name: f"{p['icon']} {p['description']} - " for name, p in PHASES.items()}
+TIMELINE_DONE = {name: f"[dim]✓ {p['icon']} {p['description']}[/dim]" for name, p in PHASES.items()}
+TIMELINE_TODO = {name: f"[dim]  {p['icon']} {p['description']}[/dim]" for name, p in PHASES.items()}
+PHASE_NAMES = list(PHASES.keys())
+
+# Dashboard status thresholds: (upper bound, color, status) - a value maps to
+# the first row whose bound it does not exceed
+def _threshold_table(*rows):
+    """Split threshold rows into a bisectable bounds tuple and (color, status) pairs"""
+    return tuple(r[0] for r in rows), tuple(r[1:] for r in rows)
+
+OK_ROW = ("green", "🟢 OK")
+ERROR_RATE_THRESHOLDS = _threshold_table((0.1, *OK_ROW), (0.5, "yellow", "🟡 WARNING"), (float("inf"), "red", "🔴 CRITICAL"))
+LATENCY_THRESHOLDS = _threshold_table((500, *OK_ROW), (2000, "yellow", "🟡 WARNING"), (float("inf"), "red", "🔴 CRITICAL"))
+CPU_THRESHOLDS = _threshold_table((60, *OK_ROW), (float("inf"), "yellow", "🟡 WARNING"))
+POOL_THRESHOLDS = _threshold_table((70, *OK_ROW), (90, "yellow", "🟡 WARNING"), (float("inf"), "red", "🔴 CRITICAL"))
+
+
+def _iso_utc(epoch: float) -> str:
+    """Format an epoch timestamp as ISO-8601 UTC with millisecond precision"""
+    return "%s.%03dZ" % (time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(epoch)), int(epoch % 1 * 1000))
+
+
+async def _sleep(seconds: float):
+    """Sleep for seconds, taking asyncio's sleep(0) fast path for sub-millisecond waits"""
+    await asyncio.sleep(seconds if seconds >= 1e-3 else 0)
+
+
+def _status(value: float, table) -> tuple:
+    """Return the (color, status) pair for value from a threshold table"""
+    bounds, styles = table
+    return styles[bisect_left(bounds, value)]
+
+
+# Whole-simulation totals at 1x speed (~7 logs and 1 metric per second)
+TOTAL_DURATION = sum(p["duration"] for p in PHASES.values())
+ESTIMATED_LOGS = int(TOTAL_DURATION * 7)
+ESTIMATED_METRICS = int(TOTAL_DURATION)
+
 # Incident scenario definitions
 SCENARIOS = {
     "db-pool": {
@@ -197,6 +276,30 @@ SCENARIOS = {
 }
 
 
+class _DrawPool:
+    """Pre-drawn random values handed out by a cursor, redrawn when exhausted"""
+    
+    def __init__(self, draw, size: int = 10000):
+        """
+        Args:
+            draw: Callable taking k and returning k random values
+            size: Number of values drawn per refill
+        """
+        self._draw = draw
+        self._size = size
+        self._pool = draw(size)
+        self._pos = 0
+    
+    def take(self, k: int) -> List:
+        """Return the next k pre-drawn values"""
+        if self._pos + k > len(self._pool):
+            self._pool = self._draw(max(k, self._size))
+            self._pos = 0
+        values = self._pool[self._pos:self._pos + k]
+        self._pos += k
+        return values
+
+
 class IncidentSimulator:
     """Simulates a realistic incident scenario with live data generation"""
     
@@ -216,6 +319,17 @@ class IncidentSimulator:
         self.speed = speed
         self.scenario_key = scenario
         self.scenario = SCENARIOS[scenario]
+        self._err_templates = tuple(self.scenario["error_messages"])
+        self._hosts = tuple(f"{self.scenario['service']}-pod-{i}" for i in range(1, 4))
+        
+        # Private RNG with pre-drawn pools for log generation; amortizes the
+        # per-call overhead of the module-level random functions
+        self._rng = random.Random()
+        rng = self._rng
+        self._uniform_pool = _DrawPool(lambda k: [rng.random() for _ in range(k)])
+        self._status_pool = _DrawPool(lambda k: rng.choices(ERROR_STATUSES, k=k))
+        self._template_pool = _DrawPool(lambda k: rng.choices(self._err_templates, k=k))
+        self._host_pool = _DrawPool(lambda k: rng.choices(self._hosts, k=k))
         self.trigger_agents = trigger_agents
         self.dry_run = dry_run
         self.export_video = export_video
@@ -240,14 +354,45 @@ class IncidentSimulator:
         self.memory = degradation.get("memory", {}).get("start", 50)
         self.disk = degradation.get("disk", {}).get("start", 75)
         
+        # Pending bulk actions (index + partial-update), flushed once per tick
+        self._buffer: List[Dict] = []
+        self._incident_es_id: Optional[str] = None
+        
+        # Per-phase metric update functions, selected once at phase entry
+        self._phase_fn = {
+            "normal": self._m_normal,
+            "degradation": self._m_degradation,
+            "detection": self._m_detection,
+            "analysis": self._m_analysis,
+            "remediation": self._m_remediation,
+            "recovery": self._m_recovery,
+        }
+        self._tick_fn = self._phase_fn[self.current_phase]
+        
+        # Event log panel is re-rendered only when a new event arrives
+        self._event_log_dirty = True
+        self._event_log_panel: Optional[Panel] = None
+        
+        # Header/timeline panels are cached per (phase, progress %)
+        self._header_key = None
+        self._header_panel: Optional[Panel] = None
+        self._timeline_key = None
+        self._timeline_panel: Optional[Panel] = None
+        
+        # Set whenever metrics or events change; update_display waits on it
+        self._dirty = asyncio.Event()
+        
         # Elasticsearch client
         if not dry_run:
             self.es = self._init_elasticsearch()
         else:
             self.es = None
+        
+        # Documents are only generated when there is somewhere to send them
+        self._sink_active = not dry_run and self.es is not None
             
-    def _init_elasticsearch(self) -> Optional[Elasticsearch]:
-        """Initialize Elasticsearch connection"""
+    def _init_elasticsearch(self) -> Optional[AsyncElasticsearch]:
+        """Initialize Elasticsearch connection (verified in _check_elasticsearch)"""
         try:
             cloud_id = os.getenv("ELASTIC_CLOUD_ID")
             api_key = os.getenv("ELASTIC_API_KEY")
@@ -256,138 +401,158 @@ class IncidentSimulator:
                 console.print("[yellow]⚠️  Elasticsearch credentials not found - running in offline mode[/yellow]")
                 return None
                 
-            es = Elasticsearch(
+            es_config = {}
+            if ORJSON_AVAILABLE:
+                # serializer= would only cover application/json; bulk and msearch
+                # bodies are application/x-ndjson
+                es_config["serializers"] = {
+                    "application/json": OrjsonSerializer(),
+                    "application/x-ndjson": OrjsonNdjsonSerializer()
+                }
+            
+            return AsyncElasticsearch(
                 cloud_id=cloud_id,
-                api_key=api_key
+                api_key=api_key,
+                http_compress=True,  # bulk bodies are highly repetitive JSON
+                **es_config
             )
             
-            # Test connection
-            es.info()
-            return es
-            
         except Exception as e:
             console.print(f"[yellow]⚠️  Elasticsearch connection failed: {e}[/yellow]")
             console.print("[yellow]   Running in offline mode[/yellow]")
             return None
     
+    async def _check_elasticsearch(self):
+        """Test the Elasticsearch connection, falling back to offline mode on failure"""
+        if not self.es:
+            return
+            
+        try:
+            await self.es.info()
+        except Exception as e:
+            console.print(f"[yellow]⚠️  Elasticsearch connection failed: {e}[/yellow]")
+            console.print("[yellow]   Running in offline mode[/yellow]")
+            await self.es.close()
+            self.es = None
+            self._sink_active = False
+    
     def _get_phase_progress(self) -> float:
         """Calculate current phase progress (0.0 to 1.0)"""
         duration = PHASES[self.current_phase]["duration"] / self.speed
         return min(1.0, self.phase_elapsed / duration)
     
-    def _update_metrics_for_phase(self):
-        """Update metrics based on current phase and progress"""
-        progress = self._get_phase_progress()
-        deg = self.scenario["degradation"]
-        
-        if self.current_phase == "normal":
-            # Everything healthy
-            self.error_rate = deg["error_rate"]["start"]
-            self.latency = deg["latency"]["start"] + random.uniform(-10, 10)
-            self.cpu = deg["cpu"]["start"] + random.uniform(-5, 5)
-            self.connections_used = deg.get("connections", {}).get("start", 10) + random.randint(-2, 2)
-            self.memory = deg.get("memory", {}).get("start", 50) + random.uniform(-2, 2)
-            self.disk = deg.get("disk", {}).get("start", 75) + random.uniform(-1, 1)
-            
-        elif self.current_phase == "degradation":
-            # Gradual degradation based on scenario
-            error_range = deg["error_rate"]["peak"] - deg["error_rate"]["start"]
-            self.error_rate = deg["error_rate"]["start"] + (error_range * progress) + random.uniform(-0.05, 0.05)
-            
-            latency_range = deg["latency"]["peak"] - deg["latency"]["start"]
-            self.latency = deg["latency"]["start"] + (latency_range * progress) + random.uniform(-100, 200)
-            
-            cpu_range = deg["cpu"]["peak"] - deg["cpu"]["start"]
-            self.cpu = deg["cpu"]["start"] + (cpu_range * progress) + random.uniform(-3, 3)
-            
-            # Scenario-specific metrics
-            if "connections" in deg:
-                conn_range = deg["connections"]["peak"] - deg["connections"]["start"]
-                self.connections_used = int(deg["connections"]["start"] + (conn_range * progress)) + random.randint(-2, 2)
-            
-            if "memory" in deg:
-                mem_range = deg["memory"]["peak"] - deg["memory"]["start"]
-                self.memory = deg["memory"]["start"] + (mem_range * progress) + random.uniform(-2, 2)
-            
-            if "disk" in deg:
-                disk_range = deg["disk"]["peak"] - deg["disk"]["start"]
-                self.disk = deg["disk"]["start"] + (disk_range * progress) + random.uniform(-1, 1)
-            
-        elif self.current_phase == "detection":
-            # Peak degradation
-            self.error_rate = deg["error_rate"]["peak"] + random.uniform(-0.03, 0.03)
-            self.latency = deg["latency"]["peak"] + random.uniform(-200, 500)
-            self.cpu = deg["cpu"]["peak"] + random.uniform(-5, 5)
-            if "connections" in deg:
-                self.connections_used = min(self.max_connections, int(deg["connections"]["peak"] * 0.96) + random.randint(0, 2))
-            if "memory" in deg:
-                self.memory = deg["memory"]["peak"] + random.uniform(-2, 2)
-            if "disk" in deg:
-                self.disk = deg["disk"]["peak"] + random.uniform(-0.5, 0.5)
-            
-        elif self.current_phase == "analysis":
-            # Still degraded while analyzing
+    def _m_normal(self, progress: float, deg: Dict):
+        """Normal phase: everything healthy"""
+        self.error_rate = deg["error_rate"]["start"]
+        self.latency = deg["latency"]["start"] + random.uniform(-10, 10)
+        self.cpu = deg["cpu"]["start"] + random.uniform(-5, 5)
+        self.connections_used = deg.get("connections", {}).get("start", 10) + random.randint(-2, 2)
+        self.memory = deg.get("memory", {}).get("start", 50) + random.uniform(-2, 2)
+        self.disk = deg.get("disk", {}).get("start", 75) + random.uniform(-1, 1)
+    
+    def _m_degradation(self, progress: float, deg: Dict):
+        """Degradation phase: gradual ramp towards scenario peak"""
+        error_range = deg["error_rate"]["peak"] - deg["error_rate"]["start"]
+        self.error_rate = deg["error_rate"]["start"] + (error_range * progress) + random.uniform(-0.05, 0.05)
+
+        latency_range = deg["latency"]["peak"] - deg["latency"]["start"]
+        self.latency = deg["latency"]["start"] + (latency_range * progress) + random.uniform(-100, 200)
+
+        cpu_range = deg["cpu"]["peak"] - deg["cpu"]["start"]
+        self.cpu = deg["cpu"]["start"] + (cpu_range * progress) + random.uniform(-3, 3)
+
+        # Scenario-specific metrics
+        if "connections" in deg:
+            conn_range = deg["connections"]["peak"] - deg["connections"]["start"]
+            self.connections_used = int(deg["connections"]["start"] + (conn_range * progress)) + random.randint(-2, 2)
+
+        if "memory" in deg:
+            mem_range = deg["memory"]["peak"] - deg["memory"]["start"]
+            self.memory = deg["memory"]["start"] + (mem_range * progress) + random.uniform(-2, 2)
+
+        if "disk" in deg:
+            disk_range = deg["disk"]["peak"] - deg["disk"]["start"]
+            self.disk = deg["disk"]["start"] + (disk_range * progress) + random.uniform(-1, 1)
+    
+    def _m_detection(self, progress: float, deg: Dict):
+        """Detection phase: peak degradation"""
+        self.error_rate = deg["error_rate"]["peak"] + random.uniform(-0.03, 0.03)
+        self.latency = deg["latency"]["peak"] + random.uniform(-200, 500)
+        self.cpu = deg["cpu"]["peak"] + random.uniform(-5, 5)
+        if "connections" in deg:
+            self.connections_used = min(self.max_connections, int(deg["connections"]["peak"] * 0.96) + random.randint(0, 2))
+        if "memory" in deg:
+            self.memory = deg["memory"]["peak"] + random.uniform(-2, 2)
+        if "disk" in deg:
+            self.disk = deg["disk"]["peak"] + random.uniform(-0.5, 0.5)
+    
+    def _m_analysis(self, progress: float, deg: Dict):
+        """Analysis phase: still degraded while analyzing"""
+        self.error_rate = deg["error_rate"]["peak"] * 0.98 + random.uniform(-0.05, 0.05)
+        self.latency = deg["latency"]["peak"] * 0.96 + random.uniform(-300, 300)
+        self.cpu = deg["cpu"]["peak"] * 0.97 + random.uniform(-5, 5)
+        if "connections" in deg:
+            self.connections_used = int(deg["connections"]["peak"] * 0.96) + random.randint(-1, 2)
+        if "memory" in deg:
+            self.memory = deg["memory"]["peak"] * 0.98 + random.uniform(-2, 2)
+        if "disk" in deg:
+            self.disk = deg["disk"]["peak"] * 0.99 + random.uniform(-0.5, 0.5)
+    
+    def _m_remediation(self, progress: float, deg: Dict):
+        """Remediation phase: service restart happens midway through"""
+        if progress < 0.5:
+            # Still degraded before restart
             self.error_rate = deg["error_rate"]["peak"] * 0.98 + random.uniform(-0.05, 0.05)
-            self.latency = deg["latency"]["peak"] * 0.96 + random.uniform(-300, 300)
-            self.cpu = deg["cpu"]["peak"] * 0.97 + random.uniform(-5, 5)
+            self.latency = deg["latency"]["peak"] * 0.90 + random.uniform(-500, 500)
+            self.cpu = deg["cpu"]["peak"] + random.uniform(-5, 5)
             if "connections" in deg:
-                self.connections_used = int(deg["connections"]["peak"] * 0.96) + random.randint(-1, 2)
+                self.connections_used = int(deg["connections"]["peak"] * 0.94) + random.randint(-2, 2)
             if "memory" in deg:
                 self.memory = deg["memory"]["peak"] * 0.98 + random.uniform(-2, 2)
             if "disk" in deg:
                 self.disk = deg["disk"]["peak"] * 0.99 + random.uniform(-0.5, 0.5)
-            
-        elif self.current_phase == "remediation":
-            # Service restart happens midway through
-            if progress < 0.5:
-                # Still degraded before restart
-                self.error_rate = deg["error_rate"]["peak"] * 0.98 + random.uniform(-0.05, 0.05)
-                self.latency = deg["latency"]["peak"] * 0.90 + random.uniform(-500, 500)
-                self.cpu = deg["cpu"]["peak"] + random.uniform(-5, 5)
-                if "connections" in deg:
-                    self.connections_used = int(deg["connections"]["peak"] * 0.94) + random.randint(-2, 2)
-                if "memory" in deg:
-                    self.memory = deg["memory"]["peak"] * 0.98 + random.uniform(-2, 2)
-                if "disk" in deg:
-                    self.disk = deg["disk"]["peak"] * 0.99 + random.uniform(-0.5, 0.5)
-            else:
-                # Beginning recovery after restart
-                restart_progress = (progress - 0.5) * 2  # 0 to 1
-                peak_error = deg["error_rate"]["peak"]
-                recovery_error = peak_error * 0.50  # Recover to 50% of peak
-                self.error_rate = peak_error - ((peak_error - recovery_error) * restart_progress)
-                
-                peak_latency = deg["latency"]["peak"]
-                recovery_latency = deg["latency"]["start"] * 6  # Some overhead after restart
-                self.latency = peak_latency - ((peak_latency - recovery_latency) * restart_progress)
-                
-                self.cpu = deg["cpu"]["peak"] - ((deg["cpu"]["peak"] - deg["cpu"]["start"]) * restart_progress)
-                
-                if "connections" in deg:
-                    self.connections_used = int(deg["connections"]["peak"] - ((deg["connections"]["peak"] - deg["connections"]["start"]) * restart_progress))
-                if "memory" in deg:
-                    self.memory = deg["memory"]["peak"] - ((deg["memory"]["peak"] - deg["memory"]["start"]) * restart_progress)
-                if "disk" in deg:
-                    # Disk recovers after cleanup
-                    self.disk = deg["disk"]["peak"] - ((deg["disk"]["peak"] - deg["disk"]["start"]) * restart_progress)
-                
-        elif self.current_phase == "recovery":
-            # Full recovery back to baseline
-            recovery_error = deg["error_rate"]["peak"] * 0.50
-            self.error_rate = recovery_error - ((recovery_error - deg["error_rate"]["start"]) * progress)
-            
-            recovery_latency = deg["latency"]["start"] * 6
-            self.latency = recovery_latency - ((recovery_latency - deg["latency"]["start"]) * progress)
-            
-            self.cpu = deg["cpu"]["start"] + (2 * (1 - progress))  # Slight overhead, normalizing
-            
+        else:
+            # Beginning recovery after restart
+            restart_progress = (progress - 0.5) * 2  # 0 to 1
+            peak_error = deg["error_rate"]["peak"]
+            recovery_error = peak_error * 0.50  # Recover to 50% of peak
+            self.error_rate = peak_error - ((peak_error - recovery_error) * restart_progress)
+
+            peak_latency = deg["latency"]["peak"]
+            recovery_latency = deg["latency"]["start"] * 6  # Some overhead after restart
+            self.latency = peak_latency - ((peak_latency - recovery_latency) * restart_progress)
+
+            self.cpu = deg["cpu"]["peak"] - ((deg["cpu"]["peak"] - deg["cpu"]["start"]) * restart_progress)
+
             if "connections" in deg:
-                self.connections_used = int(deg["connections"]["start"] + (5 * (1 - progress)))
+                self.connections_used = int(deg["connections"]["peak"] - ((deg["connections"]["peak"] - deg["connections"]["start"]) * restart_progress))
             if "memory" in deg:
-                self.memory = deg["memory"]["start"] + (3 * (1 - progress))
+                self.memory = deg["memory"]["peak"] - ((deg["memory"]["peak"] - deg["memory"]["start"]) * restart_progress)
             if "disk" in deg:
-                self.disk = deg["disk"]["start"] + (2 * (1 - progress))
-            
+                # Disk recovers after cleanup
+                self.disk = deg["disk"]["peak"] - ((deg["disk"]["peak"] - deg["disk"]["start"]) * restart_progress)
+    
+    def _m_recovery(self, progress: float, deg: Dict):
+        """Recovery phase: full recovery back to baseline"""
+        recovery_error = deg["error_rate"]["peak"] * 0.50
+        self.error_rate = recovery_error - ((recovery_error - deg["error_rate"]["start"]) * progress)
+
+        recovery_latency = deg["latency"]["start"] * 6
+        self.latency = recovery_latency - ((recovery_latency - deg["latency"]["start"]) * progress)
+
+        self.cpu = deg["cpu"]["start"] + (2 * (1 - progress))  # Slight overhead, normalizing
+
+        if "connections" in deg:
+            self.connections_used = int(deg["connections"]["start"] + (5 * (1 - progress)))
+        if "memory" in deg:
+            self.memory = deg["memory"]["start"] + (3 * (1 - progress))
+        if "disk" in deg:
+            self.disk = deg["disk"]["start"] + (2 * (1 - progress))
+    
+    def _update_metrics_for_phase(self):
+        """Update metrics based on current phase and progress"""
+        self._tick_fn(self._get_phase_progress(), self.scenario["degradation"])
+        
         # Add realistic jitter and bounds
         self.error_rate = max(0, min(1, self.error_rate))
         self.latency = max(50, self.latency)
@@ -395,66 +560,83 @@ class IncidentSimulator:
         self.connections_used = max(0, min(self.max_connections, self.connections_used))
         self.memory = max(0, min(100, self.memory))
         self.disk = max(0, min(100, self.disk))
+        self._dirty.set()
     
-    def _generate_log_entry(self) -> Dict:
-        """Generate a realistic log entry based on current metrics"""
-        timestamp = datetime.utcnow()
+    def _generate_log_entries(self, count: int, ts_base: float, span: float) -> List[Dict]:
+        """
+        Generate a batch of realistic log entries based on current metrics
         
-        # Determine if this request errors based on current error rate
-        is_error = random.random() < self.error_rate
+        Random values are taken in slices from pre-drawn pools rather than
+        drawn once per entry.
         
-        if is_error:
-            level = "ERROR"
-            status = random.choice([500, 503, 504])
-            
-            # Use scenario-specific error messages
-            messages = self.scenario["error_messages"].copy()
-            message_template = random.choice(messages)
-            
-            # Format message with current metrics
-            message = message_template.format(
-                used=self.connections_used,
-                max=self.max_connections,
-                memory=self.memory,
-                disk=self.disk,
-                rps=100 + random.uniform(-20, 20)
-            )
-            
-            error_type = self.scenario["error_type"]
-        else:
-            level = "INFO"
-            status = 200
-            message = "Request completed successfully"
-            error_type = None
-            
+        Args:
+            count: Number of log entries to generate
+            ts_base: Epoch timestamp of the first entry
+            span: Seconds the entries' timestamps are spread across
+        """
         service_name = self.scenario["service"]
-        return {
-            "@timestamp": timestamp.isoformat() + "Z",
-            "service": service_name,
-            "level": level,
-            "message": message,
-            "error_type": error_type,
-            "http_status": status,
-            "response_time": self.latency + random.uniform(-50, 50),
-            "environment": "production",
-            "host": f"{service_name}-pod-{random.randint(1, 3)}",
-            "trace_id": uuid.uuid4().hex,
-            "simulation": True,
-            "incident_id": self.incident_id if self.current_phase != "normal" else None
-        }
+        error_type = self.scenario["error_type"]
+        incident_id = self.incident_id if self.current_phase != "normal" else None
+        
+        # Determine which requests error based on current error rate
+        error_rate = self.error_rate
+        is_error = [u < error_rate for u in self._uniform_pool.take(count)]
+        error_count = sum(is_error)
+        statuses = iter(self._status_pool.take(error_count))
+        templates = iter(self._template_pool.take(error_count))
+        hosts = self._host_pool.take(count)
+        jitter = self._uniform_pool.take(count)
+        
+        logs = []
+        for i in range(count):
+            if is_error[i]:
+                level = "ERROR"
+                status = next(statuses)
+                
+                # Format scenario-specific error message with current metrics
+                message = next(templates).format(
+                    used=self.connections_used,
+                    max=self.max_connections,
+                    memory=self.memory,
+                    disk=self.disk,
+                    rps=80 + 40 * self._rng.random()
+                )
+                entry_error_type = error_type
+            else:
+                level = "INFO"
+                status = 200
+                message = "Request completed successfully"
+                entry_error_type = None
+            
+            logs.append({
+                "@timestamp": _iso_utc(ts_base + i * span / count),
+                "service": service_name,
+                "level": level,
+                "message": message,
+                "error_type": entry_error_type,
+                "http_status": status,
+                "response_time": self.latency - 50 + 100 * jitter[i],
+                "environment": "production",
+                "host": hosts[i],
+                "trace_id": uuid.uuid4().hex,
+                "simulation": True,
+                "incident_id": incident_id
+            })
+        
+        return logs
     
-    def _generate_metric_entry(self) -> Dict:
+    def _generate_metric_entry(self, timestamp: str) -> Dict:
         """Generate a system metric entry"""
         service_name = self.scenario["service"]
         metric = {
-            "@timestamp": datetime.utcnow().isoformat() + "Z",
+            "@timestamp": timestamp,
             "service": service_name,
             "metric_type": "system",
-            "cpu_percent": self.cpu + random.uniform(-2, 2),
-            "memory_percent": self.memory + random.uniform(-2, 2),
+            "cpu_percent": self.cpu + self._rng.uniform(-2, 2),
+            "memory_percent": self.memory + self._rng.uniform(-2, 2),
             "error_rate": self.error_rate,
             "avg_response_time": self.latency,
-            "requests_per_second": 100 + random.uniform(-20, 20),
+            "requests_per_second": 100 + self._rng.uniform(-20, 20),
             "environment": "production",
             "host": f"{service_name}-pod-1",
             "simulation": True,
@@ -466,18 +648,48 @@ class IncidentSimulator:
             metric["connection_pool_used"] = self.connections_used
             metric["connection_pool_max"] = self.max_connections
         if "disk" in self.scenario["degradation"]:
-            metric["disk_percent"] = self.disk + random.uniform(-1, 1)
+            metric["disk_percent"] = self.disk + self._rng.uniform(-1, 1)
         
         return metric
     
-    def _write_to_elasticsearch(self, index: str, document: Dict):
-        """Write a document to Elasticsearch"""
-        if self.dry_run or not self.es:
+    def _build_tick_batch(self, ts_base: float, tick: float) -> List[Dict]:
+        """
+        Build one tick's worth of bulk actions (5-10 logs plus a metric)
+        
+        Pure CPU work with no I/O, so run_phase can hand it to a worker
+        thread while the event loop keeps servicing the dashboard.
+        
+        Args:
+            ts_base: Epoch seconds at the start of the tick
+            tick: Tick length in seconds; log timestamps are spread across it
+        
+        Returns:
+            List of bulk index actions
+        """
+        documents = [(LOGS_INDEX, log) for log in
+                     self._generate_log_entries(self._rng.randint(5, 10), ts_base, tick)]
+        documents.append((METRICS_INDEX, self._generate_metric_entry(_iso_utc(ts_base))))
+        
+        # Null fields index the same as missing ones, so don't ship them
+        return [
+            {"_index": index, "_source": {k: v for k, v in doc.items() if v is not None}}
+            for index, doc in documents
+        ]
+    
+    async def _flush_buffer(self):
+        """Send all queued actions to Elasticsearch via the async bulk helper"""
+        if not self._buffer:
             return
             
+        actions, self._buffer = self._buffer, []
         try:
-            self.es.index(index=index, document=document)
-        except Exception as e:
+            await helpers.async_bulk(
+                self.es, actions,
+                chunk_size=BULK_CHUNK_SIZE,
+                max_chunk_bytes=BULK_MAX_CHUNK_BYTES,
+                raise_on_error=False
+            )
+        except Exception:
             # Silently fail to avoid disrupting simulation
             pass
     
@@ -500,27 +712,34 @@ class IncidentSimulator:
             "simulation": True
         }
         
-        self._write_to_elasticsearch(INCIDENTS_INDEX, incident)
+        if self._sink_active:
+            # Index under the incident ID so later status changes can target it directly
+            self._buffer.append({
+                "_op_type": "index",
+                "_index": INCIDENTS_INDEX,
+                "_id": self.incident_id,
+                "_source": incident
+            })
+            self._incident_es_id = self.incident_id
         return incident
     
     def _update_incident_status(self, status: str, **kwargs):
-        """Update incident status in Elasticsearch"""
-        if self.dry_run or not self.es:
+        """Queue a partial update of the incident status for the next bulk flush"""
+        if not self._sink_active or not self._incident_es_id:
             return
             
-        try:
-            # Update incident document
-            update_doc = {
-                "status": status,
-                "updated_at": datetime.utcnow().isoformat() + "Z"
-            }
-            update_doc.update(kwargs)
-            
-            # In real implementation, we'd use update API
-            # For demo, we'll just log it
-            console.print(f"[dim]   → Incident {self.incident_id} status: {status}[/dim]")
-        except Exception:
-            pass
+        update_doc = {
+            "status": status,
+            "updated_at": datetime.utcnow().isoformat() + "Z"
+        }
+        update_doc.update(kwargs)
+        
+        self._buffer.append({
+            "_op_type": "update",
+            "_index": INCIDENTS_INDEX,
+            "_id": self._incident_es_id,
+            "doc": update_doc
+        })
     
     def _create_dashboard_table(self) -> Table:
         """Create a rich table showing current metrics"""
@@ -533,110 +752,101 @@ class IncidentSimulator:
         table.add_column("Status", justify="center", width=15)
         
         # Error Rate
-        error_status = "🔴 CRITICAL" if self.error_rate > 0.5 else ("🟡 WARNING" if self.error_rate > 0.1 else "🟢 OK")
-        error_color = "red" if self.error_rate > 0.5 else ("yellow" if self.error_rate > 0.1 else "green")
-        table.add_row(
-            "Error Rate",
-            f"[{error_color}]{self.error_rate*100:.1f}%[/{error_color}]",
-            "2.0%",
-            error_status
-        )
+        color, status = _status(self.error_rate, ERROR_RATE_THRESHOLDS)
+        table.add_row("Error Rate", "[%s]%.1f%%[/%s]" % (color, self.error_rate * 100, color), "2.0%", status)
         
         # Latency
-        latency_status = "🔴 CRITICAL" if self.latency > 2000 else ("🟡 WARNING" if self.latency > 500 else "🟢 OK")
-        latency_color = "red" if self.latency > 2000 else ("yellow" if self.latency > 500 else "green")
-        table.add_row(
-            "Avg Latency",
-            f"[{latency_color}]{self.latency:.0f}ms[/{latency_color}]",
-            "150ms",
-            latency_status
-        )
+        color, status = _status(self.latency, LATENCY_THRESHOLDS)
+        table.add_row("Avg Latency", "[%s]%.0fms[/%s]" % (color, self.latency, color), "150ms", status)
         
         # CPU
-        cpu_status = "🟡 WARNING" if self.cpu > 60 else "🟢 OK"
-        cpu_color = "yellow" if self.cpu > 60 else "green"
-        table.add_row(
-            "CPU Usage",
-            f"[{cpu_color}]{self.cpu:.0f}%[/{cpu_color}]",
-            "40%",
-            cpu_status
-        )
+        color, status = _status(self.cpu, CPU_THRESHOLDS)
+        table.add_row("CPU Usage", "[%s]%.0f%%[/%s]" % (color, self.cpu, color), "40%", status)
         
         # Connection Pool
         pool_pct = (self.connections_used / self.max_connections) * 100
-        pool_status = "🔴 CRITICAL" if pool_pct > 90 else ("🟡 WARNING" if pool_pct > 70 else "🟢 OK")
-        pool_color = "red" if pool_pct > 90 else ("yellow" if pool_pct > 70 else "green")
+        color, status = _status(pool_pct, POOL_THRESHOLDS)
         table.add_row(
             "Connection Pool",
-            f"[{pool_color}]{self.connections_used}/{self.max_connections}[/{pool_color}]",
+            "[%s]%d/%d[/%s]" % (color, self.connections_used, self.max_connections, color),
             "10/50",
-            pool_status
+            status
         )
         
         return table
     
+    def _create_header_panel(self) -> Panel:
+        """Create the phase header, re-rendered only when the progress % changes"""
+        key = (self.current_phase, int(self._get_phase_progress() * 100))
+        if key != self._header_key:
+            header_text = Text(f"{PHASE_HEADER_PREFIX[key[0]]}{key[1]}%", style="bold", justify="center")
+            self._header_panel = Panel(header_text, border_style="blue")
+            self._header_key = key
+        
+        return self._header_panel
+    
     def _create_timeline_panel(self) -> Panel:
         """Create a timeline showing phase progression"""
-        timeline_parts = []
+        progress_pct = int(self._get_phase_progress() * 100)
+        key = (self.current_phase, progress_pct)
+        if key == self._timeline_key:
+            return self._timeline_panel
         
-        for phase_name, phase_info in PHASES.items():
-            icon = phase_info["icon"]
-            desc = phase_info["description"]
-            
-            if phase_name == self.current_phase:
-                # Current phase - highlighted
-                progress_pct = int(self._get_phase_progress() * 100)
-                timeline_parts.append(f"[bold yellow]► {icon} {desc} ({progress_pct}%)[/bold yellow]")
-            else:
-                # Determine if completed or upcoming
-                phase_order = list(PHASES.keys())
-                current_idx = phase_order.index(self.current_phase)
-                phase_idx = phase_order.index(phase_name)
-                
-                if phase_idx < current_idx:
-                    timeline_parts.append(f"[dim]✓ {icon} {desc}[/dim]")
-                else:
-                    timeline_parts.append(f"[dim]  {icon} {desc}[/dim]")
+        current_idx = PHASE_NAMES.index(self.current_phase)
+        phase_info = PHASES[self.current_phase]
+        timeline_parts = [TIMELINE_DONE[name] for name in PHASE_NAMES[:current_idx]]
+        # Current phase - highlighted
+        timeline_parts.append(f"[bold yellow]► {phase_info['icon']} {phase_info['description']} ({progress_pct}%)[/bold yellow]")
+        timeline_parts.extend(TIMELINE_TODO[name] for name in PHASE_NAMES[current_idx + 1:])
         
         timeline_text = "\n".join(timeline_parts)
-        return Panel(timeline_text, title="[bold]Incident Timeline[/bold]", 
-                    border_style="cyan", expand=False)
+        self._timeline_panel = Panel(timeline_text, title="[bold]Incident Timeline[/bold]", 
+                                     border_style="cyan", expand=False)
+        self._timeline_key = key
+        return self._timeline_panel
     
-    def _create_event_log(self, events: List[str]) -> Panel:
+    def _log_event(self, events: Deque[str], message: str):
+        """Append an event and mark the event log panel for re-render"""
+        events.append(message)
+        self._event_log_dirty = True
+        self._dirty.set()
+    
+    def _create_event_log(self, events: Deque[str]) -> Panel:
         """Create event log panel"""
-        # Show last 10 events
-        recent_events = events[-10:] if len(events) > 10 else events
-        event_text = "\n".join(recent_events)
+        if self._event_log_dirty or self._event_log_panel is None:
+            self._event_log_panel = Panel("\n".join(events), title="[bold]Event Log[/bold]", 
+                                          border_style="green", expand=True, height=EVENT_LOG_HEIGHT)
+            self._event_log_dirty = False
         
-        return Panel(event_text, title="[bold]Event Log[/bold]", 
-                    border_style="green", expand=True, height=12)
+        return self._event_log_panel
     
-    async def run_phase(self, phase_name: str, events: List[str]):
+    async def run_phase(self, phase_name: str, events: Deque[str]):
         """Execute a single phase of the simulation"""
         self.current_phase = phase_name
+        self._tick_fn = self._phase_fn[phase_name]
         phase = PHASES[phase_name]
         duration = phase["duration"] / self.speed
         
         # Phase-specific setup
         if phase_name == "detection":
-            events.append(f"[red]🚨 ANOMALY DETECTED - Error rate: {self.error_rate*100:.0f}%[/red]")
+            self._log_event(events, f"[red]🚨 ANOMALY DETECTED - Error rate: {self.error_rate*100:.0f}%[/red]")
             incident = self._create_incident_document()
-            events.append(f"[yellow]📋 Incident created: {self.incident_id}[/yellow]")
+            self._log_event(events, f"[yellow]📋 Incident created: {self.incident_id}[/yellow]")
             
         elif phase_name == "analysis":
-            events.append("[cyan]🔍 Detective Agent analyzing root cause...[/cyan]")
-            await asyncio.sleep(2 / self.speed)
-            events.append("[cyan]   → Searching for similar incidents...[/cyan]")
-            await asyncio.sleep(2 / self.speed)
+            self._log_event(events, "[cyan]🔍 Detective Agent analyzing root cause...[/cyan]")
+            await _sleep(2 / self.speed)
+            self._log_event(events, "[cyan]   → Searching for similar incidents...[/cyan]")
+            await _sleep(2 / self.speed)
             
             similar = self.scenario["similar_incidents"]
-            events.append(f"[green]   ✓ Found {len(similar)} matches: {similar[0]} (0.94 confidence), {similar[1] if len(similar) > 1 else 'INC-XXX'} (0.89)[/green]")
-            await asyncio.sleep(1 / self.speed)
-            events.append(f"[cyan]   → Root cause: {self.scenario['root_cause']}[/cyan]")
-            events.append(f"[cyan]   → Recommended action: {self.scenario['remediation']}[/cyan]")
+            self._log_event(events, f"[green]   ✓ Found {len(similar)} matches: {similar[0]} (0.94 confidence), {similar[1] if len(similar) > 1 else 'INC-XXX'} (0.89)[/green]")
+            await _sleep(1 / self.speed)
+            self._log_event(events, f"[cyan]   → Root cause: {self.scenario['root_cause']}[/cyan]")
+            self._log_event(events, f"[cyan]   → Recommended action: {self.scenario['remediation']}[/cyan]")
             
             if not self.trigger_agents:
-                events.append("[dim]   → Agent execution skipped (--no-agents)[/dim]")
+                self._log_event(events, "[dim]   → Agent execution skipped (--no-agents)[/dim]")
             
             self._update_incident_status("analyzing", 
                                         root_cause=self.scenario["root_cause"],
@@ -647,176 +857,232 @@ class IncidentSimulator:
             service_name = self.scenario["service"]
             
             if not self.trigger_agents:
-                events.append("[dim]🔧 Remediation skipped (--no-agents)[/dim]")
-                events.append(f"[dim]   Would execute: {remediation}[/dim]")
+                self._log_event(events, "[dim]🔧 Remediation skipped (--no-agents)[/dim]")
+                self._log_event(events, f"[dim]   Would execute: {remediation}[/dim]")
             else:
-                events.append(f"[yellow]🔧 Remediation Agent executing {remediation}...[/yellow]")
+                self._log_event(events, f"[yellow]🔧 Remediation Agent executing {remediation}...[/yellow]")
             
-            await asyncio.sleep(3 / self.speed)
+            await _sleep(3 / self.speed)
             
             if "restart" in remediation:
-                events.append("[cyan]   → Running pre-restart health checks...[/cyan]")
-                await asyncio.sleep(2 / self.speed)
-                events.append("[green]   ✓ Health checks passed[/green]")
-                await asyncio.sleep(2 / self.speed)
-                events.append(f"[cyan]   → Initiating rolling restart of {service_name}...[/cyan]")
+                self._log_event(events, "[cyan]   → Running pre-restart health checks...[/cyan]")
+                await _sleep(2 / self.speed)
+                self._log_event(events, "[green]   ✓ Health checks passed[/green]")
+                await _sleep(2 / self.speed)
+                self._log_event(events, f"[cyan]   → Initiating rolling restart of {service_name}...[/cyan]")
                 
                 # Wait until midpoint for restart
-                await asyncio.sleep(duration * 0.4)
-                events.append("[yellow]   → Restarting pod 1/3...[/yellow]")
-                await asyncio.sleep(duration * 0.1)
-                events.append("[yellow]   → Restarting pod 2/3...[/yellow]")
-                await asyncio.sleep(duration * 0.1)
-                events.append("[yellow]   → Restarting pod 3/3...[/yellow]")
-                await asyncio.sleep(duration * 0.1)
-                events.append("[green]   ✓ All pods restarted successfully[/green]")
+                await _sleep(duration * 0.4)
+                self._log_event(events, "[yellow]   → Restarting pod 1/3...[/yellow]")
+                await _sleep(duration * 0.1)
+                self._log_event(events, "[yellow]   → Restarting pod 2/3...[/yellow]")
+                await _sleep(duration * 0.1)
+                self._log_event(events, "[yellow]   → Restarting pod 3/3...[/yellow]")
+                await _sleep(duration * 0.1)
+                self._log_event(events, "[green]   ✓ All pods restarted successfully[/green]")
             elif "cleanup" in remediation:
-                events.append("[cyan]   → Identifying old log files...[/cyan]")
-                await asyncio.sleep(duration * 0.3)
-                events.append("[yellow]   → Removing logs older than 30 days...[/yellow]")
-                await asyncio.sleep(duration * 0.4)
-                events.append("[green]   ✓ Freed 24GB disk space[/green]")
+                self._log_event(events, "[cyan]   → Identifying old log files...[/cyan]")
+                await _sleep(duration * 0.3)
+                self._log_event(events, "[yellow]   → Removing logs older than 30 days...[/yellow]")
+                await _sleep(duration * 0.4)
+                self._log_event(events, "[green]   ✓ Freed 24GB disk space[/green]")
             elif "increase" in remediation:
-                events.append("[cyan]   → Updating rate limit configuration...[/cyan]")
-                await asyncio.sleep(duration * 0.3)
-                events.append("[yellow]   → Deploying new limits: 1000 -> 2000 req/s...[/yellow]")
-                await asyncio.sleep(duration * 0.4)
-                events.append("[green]   ✓ Rate limits updated[/green]")
+                self._log_event(events, "[cyan]   → Updating rate limit configuration...[/cyan]")
+                await _sleep(duration * 0.3)
+                self._log_event(events, "[yellow]   → Deploying new limits: 1000 -> 2000 req/s...[/yellow]")
+                await _sleep(duration * 0.4)
+                self._log_event(events, "[green]   ✓ Rate limits updated[/green]")
             
-            events.append("[cyan]   → Monitoring recovery metrics...[/cyan]")
+            self._log_event(events, "[cyan]   → Monitoring recovery metrics...[/cyan]")
             self._update_incident_status("remediating", 
                                         remediation_action=remediation,
                                         remediation_started_at=datetime.utcnow().isoformat() + "Z")
+            await self._flush_buffer()
             return  # Phase timing handled above
             
         elif phase_name == "recovery":
-            events.append("[green]✅ Service recovering...[/green]")
-            await asyncio.sleep(duration * 0.5)
-            events.append("[green]   → Error rate normalizing...[/green]")
-            await asyncio.sleep(duration * 0.3)
-            events.append("[green]   → Latency returning to baseline...[/green]")
-            await asyncio.sleep(duration * 0.15)
-            events.append("[green]   ✓ Service fully recovered[/green]")
-            events.append(f"[bold green]🎉 Incident {self.incident_id} RESOLVED[/bold green]")
+            self._log_event(events, "[green]✅ Service recovering...[/green]")
+            await _sleep(duration * 0.5)
+            self._log_event(events, "[green]   → Error rate normalizing...[/green]")
+            await _sleep(duration * 0.3)
+            self._log_event(events, "[green]   → Latency returning to baseline...[/green]")
+            await _sleep(duration * 0.15)
+            self._log_event(events, "[green]   ✓ Service fully recovered[/green]")
+            self._log_event(events, f"[bold green]🎉 Incident {self.incident_id} RESOLVED[/bold green]")
             self._update_incident_status("resolved",
                                         resolved_at=datetime.utcnow().isoformat() + "Z",
-                                        resolution_time_seconds=int(sum(p["duration"] for p in PHASES.values()) / self.speed))
+                                        resolution_time_seconds=int(TOTAL_DURATION / self.speed))
+            await self._flush_buffer()
             return
         
-        # Run phase with live metrics
-        start_time = time.time()
+        # Run phase with live metrics on a fixed tick grid (monotonic loop clock)
+        loop = asyncio.get_running_loop()
+        tick = 1 / self.speed
+        start_time = loop.time()
+        next_tick = start_time
         self.phase_start_time = start_time
         
-        while time.time() - start_time < duration:
-            self.phase_elapsed = time.time() - start_time
+        while loop.time() - start_time < duration:
+            self.phase_elapsed = loop.time() - start_time
             
             # Update metrics
             self._update_metrics_for_phase()
             
-            # Generate data every second (compressed by speed)
-            if phase_name in ["normal", "degradation", "recovery"]:
-                # Generate 5-10 log entries per second
-                for _ in range(random.randint(5, 10)):
-                    log = self._generate_log_entry()
-                    self._write_to_elasticsearch(LOGS_INDEX, log)
-                
-                # Generate metrics
-                metric = self._generate_metric_entry()
-                self._write_to_elasticsearch(METRICS_INDEX, metric)
+            # Generate data every second (compressed by speed); metric state
+            # above is still updated in dry-run so the dashboard stays accurate
+            if self._sink_active and phase_name in ["normal", "degradation", "recovery"]:
+                # Generate 5-10 log entries per second plus a metric, with
+                # timestamps spread across the tick from a single clock read.
+                # The build runs off-loop so dashboard refreshes aren't starved
+                batch = await asyncio.to_thread(self._build_tick_batch, time.time(), tick)
+                self._buffer.extend(batch)
             
-            # Wait for next update
-            await asyncio.sleep(1 / self.speed)
+            await self._flush_buffer()
+            
+            # Sleep only the residual until the next tick; if we're behind,
+            # _sleep just yields so work time doesn't accumulate as drift
+            next_tick += tick
+            delay = next_tick - loop.time()
+            await _sleep(delay)
     
     async def run(self):
         """Run the complete incident simulation"""
-        events = []
+        # Start gathered tasks eagerly, skipping a scheduler hop (Python 3.12+)
+        if hasattr(asyncio, "eager_task_factory"):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+        
+        # Keep only as many events as the event log can display
+        events: Deque[str] = deque(maxlen=EVENT_LOG_LINES)
         
         # Header
         console.clear()
+        await self._check_elasticsearch()
         
         # Start recording if export requested
         if self.export_video:
             console.print(f"[dim]Recording to {self.export_video}... (requires asciinema)[/dim]")
         
-        console.print(Panel.fit(
-            f"[bold red]🚨 INCIDENT SIMULATION[/bold red]\n\n"
-            f"[cyan]Scenario:[/cyan] {self.scenario['name']}\n"
-            f"[cyan]Service:[/cyan] {self.scenario['service']}\n"
-            f"[cyan]Incident ID:[/cyan] {self.incident_id}\n"
-            f"[cyan]Speed:[/cyan] {self.speed}x\n"
-            f"[cyan]Mode:[/cyan] {'DRY RUN' if self.dry_run else 'LIVE'}\n"
-            f"[cyan]Agents:[/cyan] {'Enabled' if self.trigger_agents else 'Disabled'}\n"
-            f"[cyan]Estimated Duration:[/cyan] {sum(p['duration'] for p in PHASES.values()) / self.speed / 60:.1f} minutes",
-            border_style="red",
-            padding=(1, 2)
-        ))
+        start_markup = "\n".join([
+            "[bold red]🚨 INCIDENT SIMULATION[/bold red]",
+            "",
+            f"[cyan]Scenario:[/cyan] {self.scenario['name']}",
+            f"[cyan]Service:[/cyan] {self.scenario['service']}",
+            f"[cyan]Incident ID:[/cyan] {self.incident_id}",
+            f"[cyan]Speed:[/cyan] {self.speed}x",
+            f"[cyan]Mode:[/cyan] {'DRY RUN' if self.dry_run else 'LIVE'}",
+            f"[cyan]Agents:[/cyan] {'Enabled' if self.trigger_agents else 'Disabled'}",
+            f"[cyan]Estimated Duration:[/cyan] {TOTAL_DURATION / self.speed / 60:.1f} minutes",
+        ])
+        console.print(Panel.fit(Text.from_markup(start_markup), border_style="red", padding=(1, 2)))
         
         console.print()
-        events.append(f"[dim]{datetime.now().strftime('%H:%M:%S')} Simulation started[/dim]")
+        self._log_event(events, f"[dim]{datetime.now().strftime('%H:%M:%S')} Simulation started[/dim]")
         
         # Run each phase with live dashboard
-        with Live(console=console, refresh_per_second=4) as live:
+        # Build the dashboard layout once; phases only swap leaf renderables
+        layout = Layout()
+        layout.split_column(
+            Layout(name="header", size=3),
+            Layout(name="body"),
+            Layout(name="footer", size=14)
+        )
+        
+        layout["body"].split_row(
+            Layout(name="metrics", ratio=2),
+            Layout(name="timeline", ratio=1)
+        )
+        
+        header_pane = layout["header"]
+        metrics_pane = layout["body"]["metrics"]
+        timeline_pane = layout["body"]["timeline"]
+        footer_pane = layout["footer"]
+        
+        # Rendering is driven explicitly from update_display (one render per
+        # tick) rather than by Live's background auto-refresh thread
+        with Live(layout, console=console, auto_refresh=False) as live:
             for phase_name in PHASES.keys():
-                # Create layout
-                layout = Layout()
-                layout.split_column(
-                    Layout(name="header", size=3),
-                    Layout(name="body"),
-                    Layout(name="footer", size=14)
-                )
+                phase_task = asyncio.ensure_future(self.run_phase(phase_name, events))
+                # Wake the display once more when the phase ends for a final render
+                phase_task.add_done_callback(lambda _: self._dirty.set())
                 
-                layout["body"].split_row(
-                    Layout(name="metrics", ratio=2),
-                    Layout(name="timeline", ratio=1)
-                )
+                # Re-render only when state changed (or progress is due a tick)
+                def render():
+                    # Update header
+                    header_pane.update(self._create_header_panel())
+                    
+                    # Update metrics table
+                    metrics_pane.update(self._create_dashboard_table())
+                    
+                    # Update timeline
+                    timeline_pane.update(self._create_timeline_panel())
+                    
+                    # Update event log
+                    footer_pane.update(self._create_event_log(events))
+                    
+                    # Render all panes in a single refresh
+                    live.refresh()
                 
-                # Update display continuously during phase
                 async def update_display():
-                    while self.current_phase == phase_name:
-                        # Update header
-                        phase = PHASES[phase_name]
-                        progress_pct = int(self._get_phase_progress() * 100)
-                        header_text = Text(
-                            f"{phase['icon']} {phase['description']} - {progress_pct}%",
-                            style="bold",
-                            justify="center"
-                        )
-                        layout["header"].update(Panel(header_text, border_style="blue"))
-                        
-                        # Update metrics table
-                        layout["body"]["metrics"].update(self._create_dashboard_table())
-                        
-                        # Update timeline
-                        layout["body"]["timeline"].update(self._create_timeline_panel())
+                    while not phase_task.done():
+                        try:
+                            await asyncio.wait_for(self._dirty.wait(), DISPLAY_MAX_INTERVAL)
+                        except asyncio.TimeoutError:
+                            pass
+                        self._dirty.clear()
+                        render()
                         
-                        # Update event log
-                        layout["footer"].update(self._create_event_log(events))
-                        
-                        # Refresh display
-                        live.update(layout)
-                        
-                        await asyncio.sleep(0.25)
+                        # Coalesce bursts of changes into one frame
+                        await asyncio.sleep(DISPLAY_MIN_INTERVAL)
+                    
+                    # The phase may have finished mid-sleep; draw its final state
+                    render()
                 
                 # Run phase and display updates concurrently
-                await asyncio.gather(
-                    self.run_phase(phase_name, events),
-                    update_display()
-                )
+                await asyncio.gather(phase_task, update_display())
                 
         # Final summary
         console.print()
-        console.print(Panel.fit(
-            f"[bold green]✅ SIMULATION COMPLETE[/bold green]\n\n"
-            f"[cyan]Incident ID:[/cyan] {self.incident_id}\n"
-            f"[cyan]Status:[/cyan] RESOLVED\n"
-            f"[cyan]Total Duration:[/cyan] {sum(p['duration'] for p in PHASES.values()) / self.speed:.0f}s\n"
-            f"[cyan]Logs Generated:[/cyan] ~{int(sum(p['duration'] for p in PHASES.values()) * 7)} entries\n"
-            f"[cyan]Metrics Generated:[/cyan] ~{int(sum(p['duration'] for p in PHASES.values()))} entries\n\n"
+        summary_markup = "\n".join([
+            "[bold green]✅ SIMULATION COMPLETE[/bold green]",
+            "",
+            f"[cyan]Incident ID:[/cyan] {self.incident_id}",
+            "[cyan]Status:[/cyan] RESOLVED",
+            f"[cyan]Total Duration:[/cyan] {TOTAL_DURATION / self.speed:.0f}s",
+            f"[cyan]Logs Generated:[/cyan] ~{ESTIMATED_LOGS} entries",
+            f"[cyan]Metrics Generated:[/cyan] ~{ESTIMATED_METRICS} entries",
+            "",
             f"[yellow]{'📝 DRY RUN - No data written to Elasticsearch' if self.dry_run else '✓ Data written to Elasticsearch'}[/yellow]",
-            border_style="green",
-            padding=(1, 2)
-        ))
+        ])
+        console.print(Panel.fit(Text.from_markup(summary_markup), border_style="green", padding=(1, 2)))
         
+        if self.es:
+            await self.es.close()
+        
+
+def run_async(coro):
+    """Run a coroutine to completion, on uvloop when it is installed"""
+    if not UVLOOP_AVAILABLE:
+        return asyncio.run(coro)
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    uvloop.install()
+    return asyncio.run(coro)
+
+
+def _strip_export_video(argv: List[str]) -> List[str]:
+    """Remove --export-video FILE / --export-video=FILE from CLI arguments"""
+    stripped = []
+    skip_next = False
+    for arg in argv:
+        if skip_next:
+            skip_next = False
+        elif arg == "--export-video":
+            skip_next = True
+        elif not arg.startswith("--export-video="):
+            stripped.append(arg)
+    return stripped
+
 
 def main():
     """Main entry point"""
@@ -904,37 +1170,27 @@ Examples:
     console.print(f"\n[dim]Available scenarios: {', '.join(SCENARIOS.keys())}[/dim]")
     console.print(f"[dim]Selected: {args.scenario} - {SCENARIOS[args.scenario]['name']}[/dim]\n")
     
-    # Run simulation
-    simulator = IncidentSimulator(
-        speed=args.speed,
-        scenario=args.scenario,
-        trigger_agents=trigger_agents,
-        dry_run=args.dry_run,
-        export_video=args.export_video
-    )
-    
     try:
-        # If export video, wrap in asciinema recording
+        # If export video, replace this process with an asciinema recording
+        # of the same command line (minus --export-video to avoid recursion)
         if args.export_video:
-            import subprocess
+            import shlex
             console.print(f"[green]🎥 Starting asciinema recording to {args.export_video}[/green]")
-            console.print("[dim]   Recording will start in 2 seconds...[/dim]\n")
-            time.sleep(2)
+            console.print(f"[dim]   Play with: asciinema play {args.export_video}[/dim]\n")
             
-            # Run simulation in asciinema
-            result = subprocess.run(
-                ["asciinema", "rec", "-c", f"python {__file__} --speed {args.speed} --scenario {args.scenario}", 
-                 args.export_video],
-                check=False
-            )
-            
-            if result.returncode == 0:
-                console.print(f"\n[green]✅ Recording saved to {args.export_video}[/green]")
-                console.print(f"[dim]   Play with: asciinema play {args.export_video}[/dim]")
-            return result.returncode
-        else:
-            asyncio.run(simulator.run())
-            return 0
+            command = shlex.join([sys.executable, os.path.abspath(__file__), *_strip_export_video(sys.argv[1:])])
+            os.execvp("asciinema", ["asciinema", "rec", "--idle-time-limit", "2", "-c", command, args.export_video])
+        
+        # Run simulation
+        simulator = IncidentSimulator(
+            speed=args.speed,
+            scenario=args.scenario,
+            trigger_agents=trigger_agents,
+            dry_run=args.dry_run,
+            export_video=args.export_video
+        )
+        run_async(simulator.run())
+        return 0
     except KeyboardInterrupt:
         console.print("\n[yellow]Simulation interrupted by user[/yellow]")
         return 1
@@ -10,8 +10,14 @@ import time
 import json
 import argparse
 import asyncio
+import importlib
+import inspect
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -21,7 +27,7 @@ load_dotenv()
 # Add src to path for imports
 sys.path.append(str(Path(__file__).parent))
 
-from elasticsearch import Elasticsearch
+from elasticsearch import AsyncElasticsearch, NotFoundError, helpers
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
@@ -32,14 +38,153 @@ from rich.layout import Layout
 from rich.align import Align
 from rich import print as rprint
 
-# Import all agents
-from detective_agent import DetectiveAgent
-from analyst_agent import AnalystAgent
-from remediation_agent import RemediationAgent
-from documentation_agent import DocumentationAgent
+# Agents are imported on first use (see _AgentSlot)
 from workflow_executor import WorkflowExecutor
 from integrations.slack_bot import SlackBot
 
+# Optional: Redis for Slack thread state shared across orchestrator processes
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Optional: Celery task queue for running pipelines on worker processes
+try:
+    from celery_app import run_orchestration
+    CELERY_AVAILABLE = True
+except ImportError:
+    CELERY_AVAILABLE = False
+
+# Worker threads for blocking agent, Slack and workflow calls
+THREAD_POOL_WORKERS = 16
+
+
+def _silent(*args, **kwargs):
+    """Stand-in for console.print in quiet mode"""
+
+
+def _mtime(path: str) -> Optional[float]:
+    """File modification time, or None if the file doesn't exist"""
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+class _AgentSlot:
+    """Lazily imported agent instance with last-use and in-flight tracking"""
+    
+    def __init__(self, module_path: str, class_name: str):
+        self.module_path = module_path
+        self.class_name = class_name
+        self.instance: Optional[Any] = None
+        self.last_used = 0.0
+        self.lock = asyncio.Lock()
+        # In-flight calls per agent object; an unloaded agent that still has
+        # calls running waits in _retired and is closed when the last returns
+        self._in_flight: Dict[int, int] = {}
+        self._retired: Dict[int, Any] = {}
+    
+    def load(self) -> Any:
+        """Import the agent module and construct (or share) the agent (blocking)"""
+        agent_class = getattr(importlib.import_module(self.module_path), self.class_name)
+        factory = getattr(agent_class, "instance", agent_class)
+        return factory(verbose=False)
+    
+    def adopt(self, agent: Any):
+        """Install a loaded agent (a shared instance may come back while retired)"""
+        self._retired.pop(id(agent), None)
+        self.instance = agent
+    
+    def acquire(self) -> Any:
+        """Take a reference on the current instance for one call"""
+        agent = self.instance
+        self._in_flight[id(agent)] = self._in_flight.get(id(agent), 0) + 1
+        return agent
+    
+    async def release(self, agent: Any):
+        """Drop a call's reference, closing the agent if it was unloaded meanwhile"""
+        key = id(agent)
+        remaining = self._in_flight[key] - 1
+        if remaining:
+            self._in_flight[key] = remaining
+            return
+        del self._in_flight[key]
+        if self._retired.pop(key, None) is not None:
+            await self._close(agent)
+    
+    async def unload(self):
+        """Drop the instance; close it now, or once its in-flight calls return"""
+        agent, self.instance = self.instance, None
+        if agent is None:
+            return
+        if self._in_flight.get(id(agent)):
+            self._retired[id(agent)] = agent
+        else:
+            await self._close(agent)
+    
+    @staticmethod
+    async def _close(agent: Any):
+        """Close async agents' connection pools"""
+        close = getattr(agent, "close", None)
+        if inspect.iscoroutinefunction(close):
+            await close()
+
+
+class BreakerOpen(Exception):
+    """Raised instead of calling an agent whose circuit breaker is open"""
+
+
+class _Breaker:
+    """
+    Per-agent circuit breaker
+    
+    Closed: calls go through. After failure_threshold consecutive failures
+    (exceptions or empty results) it opens and rejects calls immediately.
+    Once cooldown seconds pass, a single half-open probe call decides
+    whether it closes again or re-opens.
+    """
+    
+    def __init__(self, name: str, failure_threshold: int = 5, cooldown: float = 60.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+    
+    async def call(self, fn, *args) -> Any:
+        """Await fn(*args) through the breaker, raising BreakerOpen if it's open"""
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < self.cooldown:
+                raise BreakerOpen(f"{self.name} agent circuit open after {self.failures} consecutive failures")
+            self.state = "half_open"
+        elif self.state == "half_open":
+            raise BreakerOpen(f"{self.name} agent circuit half-open (probe in progress)")
+        
+        try:
+            result = await fn(*args)
+        except BaseException:
+            self._record(False)
+            raise
+        
+        self._record(bool(result))
+        return result
+    
+    def _record(self, success: bool):
+        """Update breaker state with the outcome of a call"""
+        if success:
+            self.failures = 0
+            self.state = "closed"
+            return
+        
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+
 class AgentOrchestrator:
     """
     Master orchestrator coordinating the complete incident management pipeline
@@ -60,7 +205,7 @@ class AgentOrchestrator:
     """
     
     # Pipeline status transitions
-    STATUS_TRANSITIONS = {
+    STATUS_TRANSITIONS = MappingProxyType({
         "active": "analyzing",        # Detective → Analyst
         "analyzing": "analyzed",      # Analyst complete
         "analyzed": "planning",       # Analyst → Remediation  
@@ -70,32 +215,128 @@ class AgentOrchestrator:
         "executed": "documenting",    # Execution → Documentation
         "documenting": "documented",  # Documentation complete
         "approval_required": "pending_approval"  # Manual approval needed
+    })
+    
+    # Status after remediation planning, keyed by the plan's auto-approval
+    PLAN_STATUS = MappingProxyType({True: "plan_ready", False: "approval_required"})
+    
+    # Fields every orchestrator status update carries
+    _BASE_UPDATE = MappingProxyType({"orchestrator_updated": True})
+    _EMPTY = MappingProxyType({})
+    
+    # Agent name -> (module, class), loaded on first use
+    AGENT_MODULES = {
+        "detective": ("detective_agent", "DetectiveAgent"),
+        "analyst": ("analyst_agent", "AnalystAgent"),
+        "remediation": ("remediation_agent", "RemediationAgent"),
+        "documentation": ("documentation_agent", "DocumentationAgent")
     }
     
-    def __init__(self, verbose: bool = True, polling_interval: int = 30):
-        self.console = Console()
+    # How often monitor mode checks for idle agents to unload (seconds)
+    AGENT_CLEANUP_INTERVAL = 60
+    
+    # Statuses written through immediately; others are buffered until one of
+    # these (or the end of the pipeline) flushes the incident's merged update
+    FLUSH_STATUSES = frozenset({"approval_required", "escalated", "documented", "execution_complete"})
+    
+    # Slack thread ids shared via Redis (when REDIS_URL is set)
+    SLACK_THREAD_KEY = "slack:thread:{}"
+    SLACK_THREAD_TTL = 7 * 24 * 3600
+    
+    # Append-only audit trail, one document per pipeline run
+    AUDIT_INDEX = "incidentiq-incident-events"
+    
+    # Pending Slack posts per incident before new ones are dropped
+    SLACK_QUEUE_LIMIT = 20
+    
+    # Workflow definitions loaded by WorkflowExecutor
+    WORKFLOW_PATH = "tools/workflows/{}.yaml"
+    
+    # Buffered incidents that force a flush regardless of status
+    UPDATE_BUFFER_LIMIT = 16
+    
+    # Active-incident polling: page size and max incidents picked up per poll
+    ACTIVE_PAGE_SIZE = 200
+    ACTIVE_POLL_BUDGET = 1000
+    
+    # Active-incident page body; each page only adds pit, size and search_after
+    _ACTIVE_QUERY = MappingProxyType({
+        "query": {"term": {"status.keyword": "active"}},
+        "sort": [
+            {"@timestamp": {"order": "asc"}},  # Process oldest first
+            {"_shard_doc": "asc"}              # Tiebreaker for search_after
+        ],
+        "track_total_hits": False
+    })
+    
+    # Stored search template for incident_id lookups (registered by connect)
+    INCIDENT_BY_ID_TEMPLATE = "incidentiq-incident-by-id"
+    _INCIDENT_BY_ID_SOURCE = (
+        '{"query": {"term": {"incident_id.keyword": "{{incident_id}}"}}, '
+        '"size": {{size}}{{^source}}, "_source": false{{/source}}}'
+    )
+    
+    def __init__(self, verbose: bool = True, polling_interval: int = 30, max_parallel: Optional[int] = None,
+                 use_queue: bool = False):
+        self.console = Console(highlight=False, log_time=False, log_path=False, soft_wrap=True)
         self.verbose = verbose
+        
+        # Verbose-only output; a no-op when quiet so markup is never parsed
+        self._print = self.console.print if verbose else _silent
         self.polling_interval = polling_interval
         
+        # Bound on incidents orchestrated at once in monitor mode
+        if max_parallel is None:
+            max_parallel = int(os.getenv("ORCH_MAX_PARALLEL", "5"))
+        self.max_parallel = max(1, max_parallel)
+        self._sem = asyncio.Semaphore(self.max_parallel)
+        
+        # Hand incidents to Celery workers instead of running them in-process
+        if use_queue and not CELERY_AVAILABLE:
+            raise RuntimeError("Celery queue requested but celery is not installed (pip install 'celery[redis]')")
+        self.use_queue = use_queue
+        
         # Initialize connections
         self._setup_elasticsearch()
         
+        # Pending status updates: incident_id -> merged partial document
+        self._update_buffer: Dict[str, Dict[str, Any]] = {}
+        
+        # Stage events per in-flight pipeline run, indexed as one audit record
+        self._audit: Dict[str, List[Dict[str, Any]]] = {}
+        
         # Pipeline tracking
         self.incidents_processed = 0
         self.successful_completions = 0
         self.failed_incidents = 0
         self.escalated_incidents = 0
         
-        # Agent instances (lazy loading)
-        self._detective_agent = None
-        self._analyst_agent = None
-        self._remediation_agent = None
-        self._documentation_agent = None
+        # Agent instances (lazy loading, unloaded when idle or over the cap)
+        self._agent_slots = {name: _AgentSlot(*spec) for name, spec in self.AGENT_MODULES.items()}
+        self.agent_idle_timeout = float(os.getenv("ORCH_AGENT_IDLE_SECONDS", "900"))
+        self.max_loaded_agents = max(1, int(os.getenv("ORCH_MAX_LOADED_AGENTS", str(len(self._agent_slots)))))
+        
+        # Fail fast on agents that keep failing (e.g. LLM provider outage)
+        self._breakers = {name: _Breaker(name) for name in self.AGENT_MODULES}
         
         # Workflow execution and notifications
         self.executor = WorkflowExecutor(verbose=False)
         self.slack = SlackBot(verbose=False)
-        self.slack_thread_mapping = {}  # Map incident_id to Slack thread
+        self.slack_thread_mapping = {}  # Map incident_id to Slack thread (local cache)
+        self._setup_thread_store()
+        
+        # Background Slack delivery: one ordered queue + sender per incident
+        self._slack_queues: Dict[str, asyncio.Queue] = {}
+        self._slack_senders: set = set()
+        
+        # Set once connect() has stored the incident lookup template
+        self._templates_stored = False
+        
+        # Parsed workflows: name -> (resolved path, mtime, definition)
+        self._workflow_cache: Dict[str, Tuple[Optional[str], Optional[float], Optional[Dict]]] = {}
+        
+        # Step 3 dispatch: workflow name -> handler with the workflow's constants bound
+        self._plan_handlers = self._build_plan_handlers()
         
         # Pipeline statistics
         self.pipeline_stats = {
@@ -106,124 +347,331 @@ class AgentOrchestrator:
             "failed": 0
         }
         
-        # Error tracking
-        self.recent_errors = []
+        # Error tracking (last 10 errors)
+        self.recent_errors: deque = deque(maxlen=10)
         
-        if self.verbose:
-            self.console.print("🎯 [bold green]Agent Orchestrator initialized[/bold green]")
+        self._print("🎯 [bold green]Agent Orchestrator initialized[/bold green]")
     
     def _setup_elasticsearch(self):
-        """Setup Elasticsearch connection"""
+        """Setup Elasticsearch client (connection is verified in connect())"""
+        # Keep-alive pool sized for max_parallel pipelines plus Slack/status
+        # traffic; gzip bodies since incident _source is large. Elastic Cloud
+        # doesn't need sniffing
+        self.es = AsyncElasticsearch(
+            cloud_id=os.getenv("ELASTIC_CLOUD_ID"),
+            api_key=os.getenv("ELASTIC_API_KEY"),
+            http_compress=True,
+            connections_per_node=16,
+            request_timeout=10,
+            max_retries=3,
+            retry_on_timeout=True,
+            sniff_on_start=False
+        )
+    
+    def _setup_thread_store(self):
+        """Use Redis for the Slack thread mapping if configured, else keep it in-process"""
+        self._redis = None
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url and REDIS_AVAILABLE:
+            self._redis = aioredis.Redis.from_url(redis_url, decode_responses=True)
+        elif redis_url:
+            self._print("[yellow]⚠️  REDIS_URL set but redis not installed - Slack threads tracked in-process[/yellow]")
+    
+    async def _get_slack_thread(self, incident_id: str) -> Optional[str]:
+        """Look up the incident's Slack thread, locally first, then in Redis"""
+        thread_ts = self.slack_thread_mapping.get(incident_id)
+        if thread_ts is None and self._redis is not None:
+            try:
+                thread_ts = await self._redis.get(self.SLACK_THREAD_KEY.format(incident_id))
+            except Exception as e:
+                self._print(f"[yellow]⚠️  Redis lookup failed: {e}[/yellow]")
+            if thread_ts:
+                self.slack_thread_mapping[incident_id] = thread_ts
+        return thread_ts
+    
+    async def _set_slack_thread(self, incident_id: str, thread_ts: str):
+        """Remember the incident's Slack thread locally and in Redis (with TTL)"""
+        self.slack_thread_mapping[incident_id] = thread_ts
+        if self._redis is not None:
+            try:
+                await self._redis.set(self.SLACK_THREAD_KEY.format(incident_id), thread_ts, ex=self.SLACK_THREAD_TTL)
+            except Exception as e:
+                self._print(f"[yellow]⚠️  Redis write failed: {e}[/yellow]")
+    
+    async def connect(self):
+        """Verify the Elasticsearch connection; call once inside the event loop"""
         try:
-            self.es = Elasticsearch(
-                cloud_id=os.getenv("ELASTIC_CLOUD_ID"),
-                api_key=os.getenv("ELASTIC_API_KEY")
-            )
-            
             # Test connection
-            if self.es.ping():
-                if self.verbose:
-                    self.console.print("✅ [green]Elasticsearch connected[/green]")
+            if await self.es.ping():
+                self._print("✅ [green]Elasticsearch connected[/green]")
             else:
                 raise Exception("Elasticsearch ping failed")
                 
         except Exception as e:
             self.console.print(f"❌ [red]Elasticsearch setup failed: {e}[/red]")
+            await self.close()
             raise
+        
+        try:
+            await self.es.put_script(
+                id=self.INCIDENT_BY_ID_TEMPLATE,
+                script={"lang": "mustache", "source": self._INCIDENT_BY_ID_SOURCE}
+            )
+            self._templates_stored = True
+        except Exception as e:
+            # Lookups send the template inline instead
+            self._print(f"⚠️  [yellow]Could not store search templates: {e}[/yellow]")
+    
+    async def _search_by_incident_id(self, incident_id: str, size: int, source: bool = True) -> Dict[str, Any]:
+        """
+        Search incidents by incident_id field via the stored lookup template
+        
+        Args:
+            incident_id: Incident ID to match
+            size: Max hits to return
+            source: Include _source in hits
+            
+        Returns:
+            Search response
+        """
+        params = {"incident_id": incident_id, "size": size, "source": source}
+        if self._templates_stored:
+            return await self.es.search_template(
+                index="incidentiq-incidents", id=self.INCIDENT_BY_ID_TEMPLATE, params=params
+            )
+        return await self.es.search_template(
+            index="incidentiq-incidents", source=self._INCIDENT_BY_ID_SOURCE, params=params
+        )
+    
+    async def close(self):
+        """Send pending notifications, flush status updates and release the Elasticsearch connection pool"""
+        try:
+            await self.wait_for_notifications()
+            await self.flush_status_updates()
+        finally:
+            for slot in self._agent_slots.values():
+                await slot.unload()
+            await self.es.close()
+            if self._redis is not None:
+                await self._redis.aclose()
+    
+    async def _get_agent(self, name: str) -> Any:
+        """
+        Get an agent instance, importing and constructing it on first use
+        
+        Loading happens in a worker thread (agents connect to Elasticsearch
+        and set up LLM clients). If max_loaded_agents are already resident,
+        the least recently used one is unloaded first; it is closed once any
+        calls still running on it return.
+        
+        The returned agent is acquired for one call; release it with
+        self._agent_slots[name].release(agent) when the call is done.
+        
+        Args:
+            name: Agent name (key of AGENT_MODULES)
+            
+        Returns:
+            Agent instance
+        """
+        slot = self._agent_slots[name]
+        async with slot.lock:
+            if slot.instance is None:
+                loaded = [other for other in self._agent_slots.values() if other.instance is not None]
+                if len(loaded) >= self.max_loaded_agents:
+                    await min(loaded, key=lambda other: other.last_used).unload()
+                agent = await asyncio.to_thread(slot.load)
+                # Async agents verify their connection on this event loop
+                if inspect.iscoroutinefunction(getattr(agent, "connect", None)):
+                    await agent.connect()
+                slot.adopt(agent)
+            slot.last_used = time.monotonic()
+            return slot.acquire()
+    
+    async def _call_agent(self, name: str, method: str, *args) -> Any:
+        """
+        Call an agent method, guarded by the agent's breaker
+        
+        Async methods are awaited on the event loop; blocking ones run in a
+        worker thread.
+        
+        Args:
+            name: Agent name (key of AGENT_MODULES)
+            method: Agent method to call
+            *args: Arguments for the method
+            
+        Returns:
+            The method's result
+            
+        Raises:
+            BreakerOpen: The agent's circuit is open; nothing was called
+        """
+        async def invoke():
+            agent = await self._get_agent(name)
+            try:
+                fn = getattr(agent, method)
+                if inspect.iscoroutinefunction(fn):
+                    return await fn(*args)
+                return await asyncio.to_thread(fn, *args)
+            finally:
+                await self._agent_slots[name].release(agent)
+        
+        return await self._breakers[name].call(invoke)
+    
+    async def _unload_idle_agents(self):
+        """Drop agents unused for longer than agent_idle_timeout"""
+        cutoff = time.monotonic() - self.agent_idle_timeout
+        for name, slot in self._agent_slots.items():
+            # Under the slot lock so _get_agent can't hand out an agent being closed
+            async with slot.lock:
+                if slot.instance is None or slot.last_used >= cutoff:
+                    continue
+                await slot.unload()
+            self._print(f"[dim]💤 Unloaded idle {name} agent[/dim]")
     
-    @property
-    def detective_agent(self) -> DetectiveAgent:
-        """Lazy load Detective Agent"""
-        if self._detective_agent is None:
-            self._detective_agent = DetectiveAgent(verbose=False)
-        return self._detective_agent
-    
-    @property
-    def analyst_agent(self) -> AnalystAgent:
-        """Lazy load Analyst Agent"""
-        if self._analyst_agent is None:
-            self._analyst_agent = AnalystAgent(verbose=False)
-        return self._analyst_agent
-    
-    @property
-    def remediation_agent(self) -> RemediationAgent:
-        """Lazy load Remediation Agent"""
-        if self._remediation_agent is None:
-            self._remediation_agent = RemediationAgent(verbose=False)
-        return self._remediation_agent
-    
-    @property
-    def documentation_agent(self) -> DocumentationAgent:
-        """Lazy load Documentation Agent"""
-        if self._documentation_agent is None:
-            self._documentation_agent = DocumentationAgent(verbose=False)
-        return self._documentation_agent
-    
-    def update_incident_status(self, incident_id: str, status: str, metadata: Dict[str, Any] = None) -> bool:
+    async def _agent_cleanup_loop(self):
+        """Periodically unload idle agents (runs for the life of monitor mode)"""
+        while True:
+            await asyncio.sleep(self.AGENT_CLEANUP_INTERVAL)
+            await self._unload_idle_agents()
+    
+    async def update_incident_status(self, incident_id: str, status: str, metadata: Dict[str, Any] = None) -> bool:
         """
         Update incident status in Elasticsearch
         
+        Updates are buffered per incident and written by flush_status_updates
+        on FLUSH_STATUSES, when the buffer fills, or when the pipeline ends.
+        
         Args:
             incident_id: Incident ID to update
             status: New status value
             metadata: Additional metadata to include
             
         Returns:
-            True if successful, False otherwise
+            True if queued or written successfully, False otherwise
+        """
+        self._print(f"🔄 Updating {incident_id} status: {status}")
+        
+        # Record the stage for the run's audit trail (written once at the end)
+        audit = self._audit.get(incident_id)
+        if audit is not None:
+            audit.append({"stage": status, "ts": datetime.now(timezone.utc).isoformat(), **(metadata or self._EMPTY)})
+        
+        # Merge into the incident's pending update; later stages overwrite
+        # earlier values, so one partial-doc write carries the whole sequence.
+        # last_updated is stamped once per flush
+        pending = self._update_buffer.get(incident_id)
+        if pending is None:
+            self._update_buffer[incident_id] = {**self._BASE_UPDATE, "status": status, **(metadata or self._EMPTY)}
+        else:
+            pending["status"] = status
+            if metadata:
+                pending.update(metadata)
+        
+        if status in self.FLUSH_STATUSES or len(self._update_buffer) > self.UPDATE_BUFFER_LIMIT:
+            return await self.flush_status_updates()
+        return True
+    
+    async def flush_status_updates(self, incident_id: Optional[str] = None) -> bool:
+        """
+        Write buffered status updates to Elasticsearch in a single bulk request
+        
+        Args:
+            incident_id: Flush only this incident (default: all pending)
+            
+        Returns:
+            True if every pending update was applied, False otherwise
         """
+        if incident_id is not None:
+            pending = {incident_id: self._update_buffer.pop(incident_id)} if incident_id in self._update_buffer else {}
+        else:
+            pending, self._update_buffer = self._update_buffer, {}
+        
+        if not pending:
+            return True
+        
         try:
-            if self.verbose:
-                self.console.print(f"🔄 Updating {incident_id} status: {status}")
-            
-            # Prepare update document
-            update_doc = {
-                "status": status,
-                "last_updated": datetime.now(timezone.utc).isoformat(),
-                "orchestrator_updated": True
-            }
+            last_updated = datetime.now(timezone.utc).isoformat()
+            for doc in pending.values():
+                doc["last_updated"] = last_updated
             
-            # Add metadata if provided
-            if metadata:
-                update_doc.update(metadata)
+            actions = [
+                {"_op_type": "update", "_index": "incidentiq-incidents", "_id": iid,
+                 "doc": doc, "retry_on_conflict": 3}
+                for iid, doc in pending.items()
+            ]
+            _, errors = await helpers.async_bulk(self.es, actions, raise_on_error=False)
             
-            # Update incident in Elasticsearch
-            query = {
-                "query": {
-                    "term": {
-                        "incident_id.keyword": incident_id
-                    }
-                },
-                "script": {
-                    "source": """
-                    for (entry in params.updates.entrySet()) {
-                        ctx._source[entry.getKey()] = entry.getValue();
-                    }
-                    """,
-                    "params": {
-                        "updates": update_doc
-                    }
-                }
-            }
+            # Incidents indexed before _id == incident_id was enforced are
+            # missing by _id; update those by query instead
+            ok = True
+            for error in errors:
+                item = error.get("update", {})
+                iid = item.get("_id")
+                if item.get("status") == 404 and iid in pending:
+                    ok = await self._update_by_incident_id(iid, pending[iid]) and ok
+                else:
+                    ok = False
+                    error_msg = f"Error updating {iid} status: {item.get('error')}"
+                    self.console.print(f"❌ [red]{error_msg}[/red]")
+                    self._log_error(iid, "status_update", error_msg)
             
-            result = self.es.update_by_query(
-                index="incidentiq-incidents",
-                body=query
-            )
+            if ok and self.verbose:
+                for iid, doc in pending.items():
+                    self.console.print(f"✅ [green]Status updated: {iid} → {doc['status']}[/green]")
+            return ok
             
-            if result.get("updated", 0) > 0:
-                if self.verbose:
-                    self.console.print(f"✅ [green]Status updated: {incident_id} → {status}[/green]")
-                return True
-            else:
-                self.console.print(f"⚠️  [yellow]No updates for {incident_id}[/yellow]")
-                return False
-                
         except Exception as e:
-            error_msg = f"Error updating {incident_id} status: {e}"
-            self.console.print(f"❌ [red]{error_msg}[/red]")
-            self._log_error(incident_id, "status_update", error_msg)
+            for iid in pending:
+                error_msg = f"Error updating {iid} status: {e}"
+                self.console.print(f"❌ [red]{error_msg}[/red]")
+                self._log_error(iid, "status_update", error_msg)
             return False
     
+    async def _write_audit_record(self, incident_id: str, outcome: str):
+        """
+        Index the pipeline run's stage events as a single audit document
+        
+        Args:
+            incident_id: Incident the run processed
+            outcome: Final pipeline status ("complete", "escalated", ...)
+        """
+        events = self._audit.pop(incident_id, None)
+        if not events:
+            return
+        
+        try:
+            await self.es.index(
+                index=self.AUDIT_INDEX,
+                document={
+                    "@timestamp": datetime.now(timezone.utc).isoformat(),
+                    "incident_id": incident_id,
+                    "outcome": outcome,
+                    "events": events
+                }
+            )
+        except Exception as e:
+            error_msg = f"Error writing audit record for {incident_id}: {e}"
+            self.console.print(f"❌ [red]{error_msg}[/red]")
+            self._log_error(incident_id, "audit", error_msg)
+    
+    async def _update_by_incident_id(self, incident_id: str, update_doc: Dict[str, Any]) -> bool:
+        """Apply a partial-doc update to incidents matched by incident_id rather than _id"""
+        result = await self._search_by_incident_id(incident_id, size=10, source=False)
+        
+        updated = 0
+        for hit in result["hits"]["hits"]:
+            try:
+                await self.es.update(index=hit["_index"], id=hit["_id"], doc=update_doc, retry_on_conflict=3)
+                updated += 1
+            except NotFoundError:
+                pass
+        
+        if updated > 0:
+            return True
+        
+        self.console.print(f"⚠️  [yellow]No updates for {incident_id}[/yellow]")
+        return False
+    
     def _log_error(self, incident_id: str, stage: str, error: str):
         """Log error for tracking and debugging"""
         error_entry = {
@@ -234,12 +682,8 @@ class AgentOrchestrator:
         }
         
         self.recent_errors.append(error_entry)
-        
-        # Keep only last 10 errors
-        if len(self.recent_errors) > 10:
-            self.recent_errors = self.recent_errors[-10:]
     
-    def escalate_to_human(self, incident_id: str, reason: str) -> str:
+    async def escalate_to_human(self, incident_id: str, reason: str) -> str:
         """
         Escalate incident to human intervention
         
@@ -251,8 +695,7 @@ class AgentOrchestrator:
             Escalation status
         """
         try:
-            if self.verbose:
-                self.console.print(f"🚨 Escalating {incident_id}: {reason}")
+            self._print(f"🚨 Escalating {incident_id}: {reason}")
             
             # Update incident with escalation
             metadata = {
@@ -262,7 +705,7 @@ class AgentOrchestrator:
                 "requires_human_intervention": True
             }
             
-            self.update_incident_status(incident_id, "escalated", metadata)
+            await self.update_incident_status(incident_id, "escalated", metadata)
             self.escalated_incidents += 1
             self.pipeline_stats["escalated"] += 1
             
@@ -274,63 +717,206 @@ class AgentOrchestrator:
             self._log_error(incident_id, "escalation", error_msg)
             return "escalation_failed"
     
-    def orchestrate_incident(self, incident_id: str) -> str:
+    async def _get_incident(self, incident_id: str, cache: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Fetch an incident document, reusing the copy cached for this pipeline run
+        
+        Incidents are indexed with _id == incident_id, so this is a direct GET;
+        documents indexed without that id fall back to a term search.
+        
+        Args:
+            incident_id: Incident ID to fetch
+            cache: Per-orchestration cache of incident_id -> _source
+            
+        Returns:
+            Incident _source (empty dict if not found)
+        """
+        if incident_id in cache:
+            return cache[incident_id]
+        
+        try:
+            response = await self.es.get(index="incidentiq-incidents", id=incident_id)
+            incident_data = response["_source"]
+        except NotFoundError:
+            response = await self._search_by_incident_id(incident_id, size=1)
+            
+            incident_data = {}
+            if response["hits"]["hits"]:
+                incident_data = response["hits"]["hits"][0]["_source"]
+        
+        cache[incident_id] = incident_data
+        return incident_data
+    
+    def _load_workflow_cached(self, workflow_name: str) -> Optional[Dict]:
+        """
+        Load a workflow definition, parsing each file once per process
+        
+        Tries workflow_name, then the {workflow_name}_demo variant used for
+        testing. A cached definition is reloaded if its file's mtime changes.
+        
+        Args:
+            workflow_name: Workflow to load
+            
+        Returns:
+            Workflow dictionary or None if neither file exists
+        """
+        cached = self._workflow_cache.get(workflow_name)
+        if cached is not None:
+            path, mtime, workflow_def = cached
+            if path is None or _mtime(path) == mtime:
+                return workflow_def
+        
+        for candidate in (workflow_name, f"{workflow_name}_demo"):
+            path = self.WORKFLOW_PATH.format(candidate)
+            mtime = _mtime(path)
+            if mtime is not None:
+                workflow_def = self.executor.load_workflow(workflow_file=path)
+                self._workflow_cache[workflow_name] = (path, mtime, workflow_def)
+                return workflow_def
+        
+        self._workflow_cache[workflow_name] = (None, None, None)
+        return None
+    
+    def _notify(self, method, **kwargs):
+        """
+        Queue a Slack post for the incident's background sender
+        
+        Each incident has its own queue and sender task, so posts reach its
+        thread in order without the pipeline waiting on Slack. Posts beyond
+        SLACK_QUEUE_LIMIT pending for one incident are dropped.
+        
+        Args:
+            method: SlackBot method to call
+            **kwargs: Arguments for the method (must include incident_id)
+        """
+        incident_id = kwargs["incident_id"]
+        queue = self._slack_queues.get(incident_id)
+        if queue is None:
+            queue = self._slack_queues[incident_id] = asyncio.Queue()
+            worker = asyncio.create_task(self._slack_sender(incident_id, queue))
+            self._slack_senders.add(worker)
+            worker.add_done_callback(self._slack_senders.discard)
+        
+        if queue.qsize() >= self.SLACK_QUEUE_LIMIT:
+            self._print(f"[yellow]⚠️  Slack queue full for {incident_id}, dropping {method.__name__}[/yellow]")
+            return
+        queue.put_nowait((method, kwargs))
+    
+    async def _slack_sender(self, incident_id: str, queue: asyncio.Queue):
+        """Send an incident's queued Slack posts in order until told to stop"""
+        while True:
+            item = await queue.get()
+            try:
+                if item is None:
+                    return
+                method, kwargs = item
+                await asyncio.to_thread(method, **kwargs)
+            except Exception as e:
+                self._print(f"[yellow]⚠️  Slack notification failed: {e}[/yellow]")
+            finally:
+                queue.task_done()
+    
+    async def _drain_notifications(self, incident_id: str):
+        """Wait until the incident's queued Slack posts have been sent"""
+        queue = self._slack_queues.get(incident_id)
+        if queue is not None:
+            await queue.join()
+    
+    def _finish_notifications(self, incident_id: str):
+        """Let the incident's sender exit once its remaining posts are sent"""
+        queue = self._slack_queues.pop(incident_id, None)
+        if queue is not None:
+            queue.put_nowait(None)
+    
+    async def wait_for_notifications(self):
+        """Wait for every background Slack sender to finish"""
+        for incident_id in list(self._slack_queues):
+            self._finish_notifications(incident_id)
+        if self._slack_senders:
+            await asyncio.gather(*self._slack_senders, return_exceptions=True)
+    
+    async def orchestrate_incident(self, incident_id: str, incident: Optional[Dict[str, Any]] = None) -> str:
         """
         Execute complete incident management pipeline for a single incident
         
+        At most max_parallel incidents run the pipeline concurrently.
+        
         Args:
             incident_id: Incident ID to process
+            incident: Incident _source if the caller already has it (skips the fetch)
             
         Returns:
             Final status ("complete", "escalated", "failed")
         """
+        async with self._sem:
+            self._audit[incident_id] = []
+            result = "failed"
+            try:
+                result = await self._run_pipeline(incident_id, incident)
+                return result
+            finally:
+                # Write whatever this run left buffered
+                self._finish_notifications(incident_id)
+                await self.flush_status_updates(incident_id)
+                await self._write_audit_record(incident_id, result)
+                
+                # Redis holds the mapping, so the local copy needn't outlive the run
+                if self._redis is not None:
+                    self.slack_thread_mapping.pop(incident_id, None)
+    
+    async def _run_pipeline(self, incident_id: str, incident: Optional[Dict[str, Any]] = None) -> str:
+        """Pipeline body for orchestrate_incident (caller holds the semaphore)"""
+        # Incident document fetched at most once per pipeline run
+        cache: Dict[str, Dict[str, Any]] = {}
+        if incident is not None:
+            cache[incident_id] = incident
+        
         try:
             self.incidents_processed += 1
             
-            if self.verbose:
-                self.console.print(f"\n🎯 [bold blue]Processing incident: {incident_id}[/bold blue]")
+            self._print(f"\n🎯 [bold blue]Processing incident: {incident_id}[/bold blue]")
             
             # Get incident data for Slack notifications
             try:
-                incident_response = self.es.search(
-                    index="incidentiq-incidents",
-                    body={
-                        "query": {"term": {"incident_id.keyword": incident_id}},
-                        "size": 1
-                    }
-                )
+                incident_data = await self._get_incident(incident_id, cache)
                 
-                incident_data = {}
-                if incident_response["hits"]["hits"]:
-                    incident_data = incident_response["hits"]["hits"][0]["_source"]
-                
-                # Post initial incident detection to Slack (if not already posted)
-                if incident_id not in self.slack_thread_mapping:
-                    thread_ts = self.slack.post_incident_detected(
+                # Post initial incident detection to Slack (if not already posted,
+                # by this or any other orchestrator process)
+                if not await self._get_slack_thread(incident_id):
+                    thread_ts = await asyncio.to_thread(
+                        self.slack.post_incident_detected,
                         incident_id=incident_id,
                         service=incident_data.get('service', 'Unknown'),
                         error_type=incident_data.get('error_type', 'Unknown'),
                         severity=incident_data.get('severity', 'MEDIUM')
                     )
                     if thread_ts:
-                        self.slack_thread_mapping[incident_id] = thread_ts
+                        await self._set_slack_thread(incident_id, thread_ts)
                         
             except Exception as e:
-                if self.verbose:
-                    self.console.print(f"[yellow]⚠️  Slack initial notification failed: {e}[/yellow]")
+                self._print(f"[yellow]⚠️  Slack initial notification failed: {e}[/yellow]")
             
             # Step 1: Analysis with Analyst Agent
             try:
-                if self.verbose:
-                    self.console.print("🔬 [cyan]Running Analyst Agent...[/cyan]")
+                self._print("🔬 [cyan]Running Analyst Agent...[/cyan]")
                 
-                self.update_incident_status(incident_id, "analyzing")
+                await self.update_incident_status(incident_id, "analyzing")
                 
-                analysis = self.analyst_agent.analyze_incident(incident_id)
+                analysis = await self._call_agent("analyst", "analyze_incident", incident_id)
                 if not analysis:
-                    return self.escalate_to_human(incident_id, "Analysis failed - no recommendations generated")
+                    return await self.escalate_to_human(incident_id, "Analysis failed - no recommendations generated")
                 
-                self.update_incident_status(incident_id, "analyzed", {
+                # Post analysis to Slack (sent in the background)
+                self._notify(
+                    self.slack.post_analysis_complete,
+                    incident_id=incident_id,
+                    root_cause=analysis.get('root_cause', 'Analysis in progress'),
+                    recommended_workflow=analysis.get('recommended_workflow', 'TBD'),
+                    confidence=analysis.get('confidence', 0),
+                    thread_ts=self.slack_thread_mapping.get(incident_id)
+                )
+                
+                await self.update_incident_status(incident_id, "analyzed", {
                     "analysis_complete": True,
                     "recommended_workflow": analysis.get("recommended_workflow"),
                     "confidence": analysis.get("confidence")
@@ -343,40 +929,25 @@ class AgentOrchestrator:
                     confidence = analysis.get("confidence", 0)
                     self.console.print(f"✅ [green]Analysis complete: {workflow} ({confidence:.1%} confidence)[/green]")
                 
-                # Post analysis to Slack
-                try:
-                    thread_ts = self.slack_thread_mapping.get(incident_id)
-                    self.slack.post_analysis_complete(
-                        incident_id=incident_id,
-                        root_cause=analysis.get('root_cause', 'Analysis in progress'),
-                        recommended_workflow=analysis.get('recommended_workflow', 'TBD'),
-                        confidence=analysis.get('confidence', 0),
-                        thread_ts=thread_ts
-                    )
-                except Exception as e:
-                    if self.verbose:
-                        self.console.print(f"[yellow]⚠️  Slack notification failed: {e}[/yellow]")
-                
             except Exception as e:
                 error_msg = f"Analyst Agent failed: {e}"
                 self._log_error(incident_id, "analysis", error_msg)
-                return self.escalate_to_human(incident_id, error_msg)
+                return await self.escalate_to_human(incident_id, error_msg)
             
             # Step 2: Remediation Planning with Remediation Agent
             try:
-                if self.verbose:
-                    self.console.print("🔧 [cyan]Running Remediation Agent...[/cyan]")
+                self._print("🔧 [cyan]Running Remediation Agent...[/cyan]")
                 
-                self.update_incident_status(incident_id, "planning")
+                await self.update_incident_status(incident_id, "planning")
                 
-                plan = self.remediation_agent.generate_remediation_plan_for_incident(incident_id)
+                plan = await self._call_agent("remediation", "generate_remediation_plan_for_incident", incident_id)
                 if not plan:
-                    return self.escalate_to_human(incident_id, "Remediation planning failed")
+                    return await self.escalate_to_human(incident_id, "Remediation planning failed")
                 
                 # Determine next status based on auto-approval
-                next_status = "plan_ready" if plan.get("auto_approved") else "approval_required"
+                next_status = self.PLAN_STATUS[bool(plan.get("auto_approved"))]
                 
-                self.update_incident_status(incident_id, next_status, {
+                await self.update_incident_status(incident_id, next_status, {
                     "remediation_plan_ready": True,
                     "auto_approved": plan.get("auto_approved"),
                     "risk_level": plan.get("risk_level"),
@@ -395,157 +966,25 @@ class AgentOrchestrator:
             except Exception as e:
                 error_msg = f"Remediation Agent failed: {e}"
                 self._log_error(incident_id, "remediation", error_msg)
-                return self.escalate_to_human(incident_id, error_msg)
+                return await self.escalate_to_human(incident_id, error_msg)
             
-            # Step 3: Workflow Execution
+            # Step 3: Workflow Execution, via the workflow's specialized handler
             workflow_name = plan.get("workflow_name", "manual_intervention")
-            workflow_success = False
-            execution_result = None
-            
-            try:
-                # Check if requires approval for high-risk workflows
-                if not plan.get("auto_approved", False):
-                    if self.verbose:
-                        self.console.print("🔒 [yellow]Requesting approval for high-risk workflow...[/yellow]")
-                    
-                    # Get incident data for approval request
-                    incident_response = self.es.search(
-                        index="incidentiq-incidents",
-                        body={
-                            "query": {"term": {"incident_id.keyword": incident_id}},
-                            "size": 1
-                        }
-                    )
-                    
-                    incident_data = {}
-                    if incident_response["hits"]["hits"]:
-                        incident_data = incident_response["hits"]["hits"][0]["_source"]
-                    
-                    approved = self.slack.request_approval(
-                        incident_id=incident_id,
-                        workflow_name=workflow_name,
-                        service=incident_data.get('service', 'Unknown'),
-                        risk_level=plan.get('risk_level', 'High'),
-                        timeout_seconds=600,
-                        thread_ts=self.slack_thread_mapping.get(incident_id)
-                    )
-                    
-                    if not approved:
-                        if self.verbose:
-                            self.console.print("[yellow]⏸️  Workflow not approved - escalating to human[/yellow]")
-                        
-                        self.slack.post_escalation(
-                            incident_id=incident_id,
-                            reason="High-risk workflow denied by approver",
-                            thread_ts=self.slack_thread_mapping.get(incident_id)
-                        )
-                        
-                        return self.escalate_to_human(incident_id, "Human approval denied")
-                
-                # Execute workflow
-                if self.verbose:
-                    self.console.print(f"⚡ [cyan]Executing workflow: {workflow_name}[/cyan]")
-                
-                # Post execution start notification
-                self.slack.post_workflow_executing(
-                    incident_id=incident_id,
-                    workflow_name=workflow_name,
-                    estimated_duration=plan.get('estimated_duration_seconds', 180),
-                    thread_ts=self.slack_thread_mapping.get(incident_id)
-                )
-                
-                # Load and execute workflow
-                workflow_def = self.executor.load_workflow(workflow_name=workflow_name)
-                if not workflow_def:
-                    # Try with demo suffix for testing
-                    workflow_def = self.executor.load_workflow(workflow_name=f"{workflow_name}_demo")
-                
-                if workflow_def:
-                    # Get incident data for parameters
-                    incident_response = self.es.search(
-                        index="incidentiq-incidents",
-                        body={
-                            "query": {"term": {"incident_id.keyword": incident_id}},
-                            "size": 1
-                        }
-                    )
-                    
-                    incident_data = {}
-                    if incident_response["hits"]["hits"]:
-                        incident_data = incident_response["hits"]["hits"][0]["_source"]
-                    
-                    execution_result = self.executor.execute_workflow(
-                        workflow=workflow_def,
-                        params={
-                            'incident_id': incident_id,
-                            'service': incident_data.get('service', 'unknown-service'),
-                            'namespace': 'incidentiq-demo',
-                            'timeout_seconds': 120
-                        }
-                    )
-                    
-                    workflow_success = execution_result.get('success', False)
-                    
-                    if workflow_success:
-                        self.update_incident_status(incident_id, "executed", {
-                            "execution_complete": True,
-                            "workflow_executed": workflow_name,
-                            "execution_duration": execution_result.get('total_duration_seconds', 0)
-                        })
-                        
-                        if self.verbose:
-                            duration = execution_result.get('total_duration_seconds', 0)
-                            self.console.print(f"✅ [green]Workflow executed successfully ({duration:.1f}s)[/green]")
-                    else:
-                        if self.verbose:
-                            self.console.print(f"❌ [red]Workflow execution failed[/red]")
-                        
-                        # Post failure and escalate
-                        self.slack.post_escalation(
-                            incident_id=incident_id,
-                            reason=f"Workflow execution failed: {execution_result.get('message', 'Unknown error')}",
-                            thread_ts=self.slack_thread_mapping.get(incident_id)
-                        )
-                        
-                        return self.escalate_to_human(incident_id, "Workflow execution failed")
-                
-                else:
-                    if self.verbose:
-                        self.console.print(f"❌ [red]Workflow definition not found: {workflow_name}[/red]")
-                    
-                    # Simulate execution for unknown workflows
-                    self.update_incident_status(incident_id, "executed", {
-                        "execution_note": f"Simulated execution of {workflow_name}",
-                        "execution_simulated": True
-                    })
-                    
-                    workflow_success = True  # Assume success for simulation
-                    execution_result = {"success": True, "total_duration_seconds": 30, "message": "Simulated execution"}
-                
-            except Exception as e:
-                error_msg = f"Workflow execution failed: {e}"
-                self._log_error(incident_id, "execution", error_msg)
-                
-                self.slack.post_escalation(
-                    incident_id=incident_id,
-                    reason=error_msg,
-                    thread_ts=self.slack_thread_mapping.get(incident_id)
-                )
-                
-                return self.escalate_to_human(incident_id, error_msg)
+            handler = self._plan_handlers.get(workflow_name, self._execute_generic_plan)
+            final_status, workflow_success, execution_result = await handler(incident_id, plan, cache)
+            if final_status is not None:
+                return final_status
             
             # Step 4: Documentation with Documentation Agent
             try:
-                if self.verbose:
-                    self.console.print("📚 [cyan]Running Documentation Agent...[/cyan]")
+                self._print("📚 [cyan]Running Documentation Agent...[/cyan]")
                 
-                self.update_incident_status(incident_id, "documenting")
+                await self.update_incident_status(incident_id, "documenting")
                 
-                documentation = self.documentation_agent.generate_documentation_for_incident(incident_id)
+                documentation = await self._call_agent("documentation", "generate_documentation_for_incident", incident_id)
                 if not documentation:
                     # Don't escalate for documentation failures - not critical
-                    if self.verbose:
-                        self.console.print("⚠️  [yellow]Documentation generation failed - continuing[/yellow]")
+                    self._print("⚠️  [yellow]Documentation generation failed - continuing[/yellow]")
                 else:
                     self.pipeline_stats["documented"] += 1
                     if self.verbose:
@@ -555,7 +994,7 @@ class AgentOrchestrator:
                 
                 # Final status
                 final_status = "documented" if documentation else "execution_complete"
-                self.update_incident_status(incident_id, final_status, {
+                await self.update_incident_status(incident_id, final_status, {
                     "pipeline_complete": True,
                     "documentation_generated": bool(documentation)
                 })
@@ -564,8 +1003,7 @@ class AgentOrchestrator:
                 error_msg = f"Documentation Agent failed: {e}"
                 self._log_error(incident_id, "documentation", error_msg)
                 # Don't escalate for documentation failures
-                if self.verbose:
-                    self.console.print(f"⚠️  [yellow]Documentation failed but continuing: {error_msg}[/yellow]")
+                self._print(f"⚠️  [yellow]Documentation failed but continuing: {error_msg}[/yellow]")
             
             # Success!
             self.successful_completions += 1
@@ -573,7 +1011,8 @@ class AgentOrchestrator:
             # Post resolution to Slack
             try:
                 if execution_result:
-                    self.slack.post_resolution(
+                    self._notify(
+                        self.slack.post_resolution,
                         incident_id=incident_id,
                         workflow_name=workflow_name,
                         duration_seconds=int(execution_result.get('total_duration_seconds', 0)),
@@ -581,11 +1020,9 @@ class AgentOrchestrator:
                         thread_ts=self.slack_thread_mapping.get(incident_id)
                     )
             except Exception as e:
-                if self.verbose:
-                    self.console.print(f"[yellow]⚠️  Final Slack notification failed: {e}[/yellow]")
+                self._print(f"[yellow]⚠️  Final Slack notification failed: {e}[/yellow]")
             
-            if self.verbose:
-                self.console.print(f"🎉 [bold green]Pipeline complete for {incident_id}![/bold green]")
+            self._print(f"🎉 [bold green]Pipeline complete for {incident_id}![/bold green]")
             
             return "complete"
             
@@ -596,73 +1033,308 @@ class AgentOrchestrator:
             self.failed_incidents += 1
             self.pipeline_stats["failed"] += 1
             
-            return self.escalate_to_human(incident_id, error_msg)
+            return await self.escalate_to_human(incident_id, error_msg)
     
-    def find_active_incidents(self) -> List[Dict[str, Any]]:
+    async def _execute_plan(self, incident_id: str, plan: Dict[str, Any], cache: Dict[str, Dict[str, Any]], *,
+                            workflow_name: str, estimated_duration: int,
+                            force_approval: bool = False) -> Tuple[Optional[str], bool, Optional[Dict]]:
         """
-        Find incidents ready for processing
+        Pipeline step 3: get approval if needed, then execute the plan's workflow
         
+        Known workflows are bound to this method with their YAML constants in
+        _plan_handlers; _execute_generic_plan reads them from the plan instead.
+        
+        Args:
+            incident_id: Incident being processed
+            plan: Remediation plan
+            cache: Per-run incident cache
+            workflow_name: Workflow to execute
+            estimated_duration: Expected run time in seconds (for Slack)
+            force_approval: Always request human approval (workflow not auto-approvable)
+            
         Returns:
-            List of incidents with status="active"
+            (final status if the pipeline must stop here, workflow success, execution result)
         """
+        workflow_success = False
+        execution_result = None
+        
+        # Load the workflow and incident data in the background so they're
+        # ready by the time approval (up to 10 minutes) comes back
+        workflow_task = asyncio.ensure_future(asyncio.to_thread(self._load_workflow_cached, workflow_name))
+        incident_task = asyncio.ensure_future(self._get_incident(incident_id, cache))
+        
         try:
-            query = {
-                "query": {
-                    "term": {
-                        "status.keyword": "active"
+            # Check if requires approval for high-risk workflows
+            if force_approval or not plan.get("auto_approved", False):
+                self._print("🔒 [yellow]Requesting approval for high-risk workflow...[/yellow]")
+                
+                # Get incident data for approval request; earlier notifications
+                # go out first so the approval lands after them in the thread
+                incident_data = await incident_task
+                await self._drain_notifications(incident_id)
+                
+                approved = await asyncio.to_thread(
+                    self.slack.request_approval,
+                    incident_id=incident_id,
+                    workflow_name=workflow_name,
+                    service=incident_data.get('service', 'Unknown'),
+                    risk_level=plan.get('risk_level', 'High'),
+                    timeout_seconds=600,
+                    thread_ts=self.slack_thread_mapping.get(incident_id)
+                )
+                
+                if not approved:
+                    self._print("[yellow]⏸️  Workflow not approved - escalating to human[/yellow]")
+                    
+                    self._notify(
+                        self.slack.post_escalation,
+                        incident_id=incident_id,
+                        reason="High-risk workflow denied by approver",
+                        thread_ts=self.slack_thread_mapping.get(incident_id)
+                    )
+                    
+                    return await self.escalate_to_human(incident_id, "Human approval denied"), False, execution_result
+            
+            # Execute workflow
+            self._print(f"⚡ [cyan]Executing workflow: {workflow_name}[/cyan]")
+            
+            # Post execution start notification
+            self._notify(
+                self.slack.post_workflow_executing,
+                incident_id=incident_id,
+                workflow_name=workflow_name,
+                estimated_duration=estimated_duration,
+                thread_ts=self.slack_thread_mapping.get(incident_id)
+            )
+            
+            # Load and execute workflow
+            workflow_def = await workflow_task
+            
+            if workflow_def:
+                # Get incident data for parameters
+                incident_data = await incident_task
+                
+                execution_result = await asyncio.to_thread(
+                    self.executor.execute_workflow,
+                    workflow=workflow_def,
+                    params={
+                        'incident_id': incident_id,
+                        'service': incident_data.get('service', 'unknown-service'),
+                        'namespace': 'incidentiq-demo',
+                        'timeout_seconds': 120
                     }
-                },
-                "sort": [
-                    {"@timestamp": {"order": "asc"}}  # Process oldest first
-                ],
-                "size": 50  # Limit batch size
-            }
+                )
+                
+                workflow_success = execution_result.get('success', False)
+                
+                if workflow_success:
+                    await self.update_incident_status(incident_id, "executed", {
+                        "execution_complete": True,
+                        "workflow_executed": workflow_name,
+                        "execution_duration": execution_result.get('total_duration_seconds', 0)
+                    })
+                    
+                    if self.verbose:
+                        duration = execution_result.get('total_duration_seconds', 0)
+                        self.console.print(f"✅ [green]Workflow executed successfully ({duration:.1f}s)[/green]")
+                else:
+                    self._print(f"❌ [red]Workflow execution failed[/red]")
+                    
+                    # Post failure and escalate
+                    self._notify(
+                        self.slack.post_escalation,
+                        incident_id=incident_id,
+                        reason=f"Workflow execution failed: {execution_result.get('message', 'Unknown error')}",
+                        thread_ts=self.slack_thread_mapping.get(incident_id)
+                    )
+                    
+                    return await self.escalate_to_human(incident_id, "Workflow execution failed"), False, execution_result
             
-            result = self.es.search(
-                index="incidentiq-incidents",
-                body=query
+            else:
+                self._print(f"❌ [red]Workflow definition not found: {workflow_name}[/red]")
+                
+                # Simulate execution for unknown workflows
+                await self.update_incident_status(incident_id, "executed", {
+                    "execution_note": f"Simulated execution of {workflow_name}",
+                    "execution_simulated": True
+                })
+                
+                workflow_success = True  # Assume success for simulation
+                execution_result = {"success": True, "total_duration_seconds": 30, "message": "Simulated execution"}
+            
+        except Exception as e:
+            error_msg = f"Workflow execution failed: {e}"
+            self._log_error(incident_id, "execution", error_msg)
+            
+            self._notify(
+                self.slack.post_escalation,
+                incident_id=incident_id,
+                reason=error_msg,
+                thread_ts=self.slack_thread_mapping.get(incident_id)
             )
             
-            incidents = []
-            for hit in result["hits"]["hits"]:
-                incident = hit["_source"]
-                incidents.append(incident)
+            return await self.escalate_to_human(incident_id, error_msg), False, execution_result
+        
+        finally:
+            # Drop preloads an early exit (e.g. approval denied) never used
+            for task in (workflow_task, incident_task):
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # Mark retrieved; errors surface where awaited
+        
+        return None, workflow_success, execution_result
+    
+    async def _execute_generic_plan(self, incident_id: str, plan: Dict[str, Any],
+                                    cache: Dict[str, Dict[str, Any]]) -> Tuple[Optional[str], bool, Optional[Dict]]:
+        """Pipeline step 3 for workflows without a specialized handler"""
+        return await self._execute_plan(
+            incident_id, plan, cache,
+            workflow_name=plan.get("workflow_name", "manual_intervention"),
+            estimated_duration=plan.get("estimated_duration", 180)
+        )
+    
+    def _build_plan_handlers(self) -> Dict[str, Any]:
+        """
+        Bind _execute_plan to each workflow file's constants
+        
+        Returns:
+            Workflow name -> step 3 handler
+        """
+        handlers = {}
+        for path in sorted(Path(self.WORKFLOW_PATH.format("*")).parent.glob("*.yaml")):
+            workflow_def = self._load_workflow_cached(path.stem)
+            if not workflow_def:
+                continue
+            handlers[path.stem] = functools.partial(
+                self._execute_plan,
+                workflow_name=path.stem,
+                estimated_duration=workflow_def.get("estimated_duration_seconds", 180),
+                force_approval=not workflow_def.get("auto_approve", False)
+            )
+        return handlers
+    
+    async def find_active_incidents(self, max_incidents: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Find incidents ready for processing, oldest first
+        
+        Pages through a point-in-time snapshot with search_after, so a backlog
+        larger than one page is drained in a single poll.
+        
+        Args:
+            max_incidents: Per-poll budget (default: ACTIVE_POLL_BUDGET)
             
-            if self.verbose and incidents:
-                self.console.print(f"🔍 [blue]Found {len(incidents)} active incident(s)[/blue]")
+        Yields:
+            Incidents with status="active"
+        """
+        budget = max_incidents or self.ACTIVE_POLL_BUDGET
+        pit_id = None
+        found = 0
+        
+        try:
+            pit = await self.es.open_point_in_time(index="incidentiq-incidents", keep_alive="1m")
+            pit_id = pit["id"]
+            search_after = None
             
-            return incidents
+            while found < budget:
+                size = min(self.ACTIVE_PAGE_SIZE, budget - found)
+                query = {**self._ACTIVE_QUERY, "pit": {"id": pit_id, "keep_alive": "1m"}, "size": size}
+                if search_after is not None:
+                    query["search_after"] = search_after
+                
+                result = await self.es.search(body=query)
+                pit_id = result.get("pit_id", pit_id)
+                hits = result["hits"]["hits"]
+                
+                for hit in hits:
+                    yield hit["_source"]
+                
+                found += len(hits)
+                if len(hits) < size:
+                    break
+                search_after = hits[-1]["sort"]
             
         except Exception as e:
             self.console.print(f"❌ [red]Error finding active incidents: {e}[/red]")
-            return []
+        finally:
+            if pit_id is not None:
+                try:
+                    await self.es.close_point_in_time(id=pit_id)
+                except Exception:
+                    pass  # Expires on its own after keep_alive
+        
+        if self.verbose and found:
+            self.console.print(f"🔍 [blue]Found {found} active incident(s)[/blue]")
+    
+    async def _enqueue_incidents(self, incident_ids: List[str]):
+        """
+        Queue incidents for Celery workers and mark them "queued"
+        
+        The status change keeps the next poll from re-enqueueing them; workers
+        retry failed pipelines, so delivery is at-least-once. "queued" is
+        written before the task is sent so it can't overwrite a fast worker's
+        later status.
+        
+        Args:
+            incident_ids: Incidents to hand off
+        """
+        self.console.print(f"\n📤 [cyan]Queueing {len(incident_ids)} incident(s) for workers...[/cyan]")
+        
+        for incident_id in incident_ids:
+            await self.update_incident_status(incident_id, "queued", {
+                "queued_at": datetime.now(timezone.utc).isoformat()
+            })
+            if not await self.flush_status_updates(incident_id):
+                continue  # Still active; the next poll retries it
+            
+            try:
+                await asyncio.to_thread(run_orchestration.delay, incident_id)
+            except Exception as e:
+                error_msg = f"Failed to queue {incident_id}: {e}"
+                self.console.print(f"  • {incident_id}: [red]{error_msg}[/red]")
+                self._log_error(incident_id, "queue", error_msg)
+                # Hand it back to the poller
+                await self.update_incident_status(incident_id, "active")
+                await self.flush_status_updates(incident_id)
     
-    def monitor_and_process(self) -> None:
+    async def monitor_and_process(self) -> None:
         """
         Continuous monitoring mode - process incidents as they become active
         """
-        self.console.print(f"🔄 [bold yellow]Starting continuous monitoring (polling every {self.polling_interval}s)[/bold yellow]")
+        self.console.print(f"🔄 [bold yellow]Starting continuous monitoring (polling every {self.polling_interval}s, "
+                           f"up to {self.max_parallel} in parallel)[/bold yellow]")
+        
+        cleanup_task = asyncio.create_task(self._agent_cleanup_loop())
         
         try:
             while True:
                 start_time = datetime.now()
                 
                 # Find active incidents
-                incidents = self.find_active_incidents()
+                incidents = [incident async for incident in self.find_active_incidents()]
+                
+                if incidents and self.use_queue:
+                    await self._enqueue_incidents([incident.get("incident_id", "Unknown") for incident in incidents])
                 
-                if incidents:
+                elif incidents:
                     self.console.print(f"\n📋 [cyan]Processing {len(incidents)} incident(s)...[/cyan]")
                     
-                    # Process each incident
-                    for incident in incidents:
-                        incident_id = incident.get("incident_id", "Unknown")
-                        try:
-                            result = self.orchestrate_incident(incident_id)
-                            if self.verbose:
-                                status_color = "green" if result == "complete" else "yellow"
-                                self.console.print(f"  • {incident_id}: [{status_color}]{result}[/{status_color}]")
-                        except Exception as e:
-                            self.console.print(f"  • {incident_id}: [red]error - {e}[/red]")
+                    # Process incidents concurrently (bounded by the semaphore);
+                    # each touches only its own incident document
+                    # Polled sources seed each pipeline's cache, so no per-incident fetch
+                    incident_ids = [incident.get("incident_id", "Unknown") for incident in incidents]
+                    results = await asyncio.gather(
+                        *(self.orchestrate_incident(incident_id, incident)
+                          for incident_id, incident in zip(incident_ids, incidents)),
+                        return_exceptions=True
+                    )
+                    
+                    for incident_id, result in zip(incident_ids, results):
+                        if isinstance(result, Exception):
+                            self.console.print(f"  • {incident_id}: [red]error - {result}[/red]")
+                        elif self.verbose:
+                            status_color = "green" if result == "complete" else "yellow"
+                            self.console.print(f"  • {incident_id}: [{status_color}]{result}[/{status_color}]")
                 
                 # Show statistics
                 if self.verbose and self.incidents_processed > 0:
@@ -673,12 +1345,14 @@ class AgentOrchestrator:
                 sleep_time = max(0, self.polling_interval - elapsed)
                 
                 if sleep_time > 0:
-                    time.sleep(sleep_time)
+                    await asyncio.sleep(sleep_time)
                 
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
             self.console.print("\n🛑 [yellow]Monitoring stopped by user[/yellow]")
         except Exception as e:
             self.console.print(f"\n💥 [red]Monitoring error: {e}[/red]")
+        finally:
+            cleanup_task.cancel()
     
     def _show_monitoring_stats(self):
         """Show monitoring statistics"""
@@ -702,37 +1376,28 @@ class AgentOrchestrator:
             "escalated_incidents": self.escalated_incidents,
             "success_rate": success_rate,
             "pipeline_stats": self.pipeline_stats.copy(),
-            "recent_errors": self.recent_errors[-5:],  # Last 5 errors
+            "recent_errors": list(self.recent_errors)[-5:],  # Last 5 errors
             "agent_stats": {
                 "analyst_analyses": self.pipeline_stats["analyzed"],
                 "remediation_plans": self.pipeline_stats["planned"],
                 "documentation_generated": self.pipeline_stats["documented"]
-            }
+            },
+            "circuit_breakers": {name: breaker.state for name, breaker in self._breakers.items()}
         }
 
 
-def main():
-    """Main function for testing and demonstration"""
-    parser = argparse.ArgumentParser(description="IncidentIQ Agent Orchestrator")
-    parser.add_argument("--incident", "-i", help="Process specific incident ID")
-    parser.add_argument("--monitor", "-m", action="store_true", help="Continuous monitoring mode")
-    parser.add_argument("--interval", "-t", type=int, default=30, help="Polling interval (seconds)")
-    parser.add_argument("--quiet", "-q", action="store_true", help="Quiet mode")
-    parser.add_argument("--stats", "-s", action="store_true", help="Show detailed statistics")
-    args = parser.parse_args()
+async def run(args: argparse.Namespace, parser: argparse.ArgumentParser, console: Console) -> int:
+    """Run the requested orchestrator mode inside the event loop"""
+    # Blocking agent/Slack/workflow calls run via asyncio.to_thread; size the
+    # pool so concurrent incidents don't queue behind each other
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=THREAD_POOL_WORKERS))
     
-    console = Console()
-    
-    # Header
-    console.print(Panel.fit(
-        "🎯 [bold blue]IncidentIQ - Agent Orchestrator[/bold blue]",
-        subtitle="Master Pipeline Controller"
-    ))
+    # Initialize orchestrator
+    orchestrator = AgentOrchestrator(verbose=not args.quiet, polling_interval=args.interval,
+                                     max_parallel=args.parallel, use_queue=args.queue)
+    await orchestrator.connect()
     
     try:
-        # Initialize orchestrator
-        orchestrator = AgentOrchestrator(verbose=not args.quiet, polling_interval=args.interval)
-        
         # Show statistics if requested
         if args.stats:
             stats = orchestrator.get_detailed_stats()
@@ -768,7 +1433,7 @@ def main():
         # Single incident mode
         if args.incident:
             console.print(f"\n🎯 Processing single incident: {args.incident}")
-            result = orchestrator.orchestrate_incident(args.incident)
+            result = await orchestrator.orchestrate_incident(args.incident)
             
             console.print(f"\n📋 [bold green]Pipeline Result:[/bold green]")
             console.print(f"  • Incident: {args.incident}")
@@ -784,13 +1449,44 @@ def main():
         
         # Monitoring mode
         if args.monitor:
-            orchestrator.monitor_and_process()
+            await orchestrator.monitor_and_process()
             return 0
         
         # Default: show help
         parser.print_help()
         return 0
         
+    finally:
+        await orchestrator.close()
+
+
+def main():
+    """Main function for testing and demonstration"""
+    parser = argparse.ArgumentParser(description="IncidentIQ Agent Orchestrator")
+    parser.add_argument("--incident", "-i", help="Process specific incident ID")
+    parser.add_argument("--monitor", "-m", action="store_true", help="Continuous monitoring mode")
+    parser.add_argument("--interval", "-t", type=int, default=30, help="Polling interval (seconds)")
+    parser.add_argument("--queue", action="store_true",
+                        help="Monitor mode: enqueue incidents for Celery workers (see src/celery_app.py)")
+    parser.add_argument("--parallel", "-p", type=int, default=None,
+                        help="Max incidents processed concurrently (default: $ORCH_MAX_PARALLEL or 5)")
+    parser.add_argument("--quiet", "-q", action="store_true", help="Quiet mode")
+    parser.add_argument("--stats", "-s", action="store_true", help="Show detailed statistics")
+    args = parser.parse_args()
+    
+    console = Console()
+    
+    # Header
+    console.print(Panel.fit(
+        "🎯 [bold blue]IncidentIQ - Agent Orchestrator[/bold blue]",
+        subtitle="Master Pipeline Controller"
+    ))
+    
+    try:
+        return asyncio.run(run(args, parser, console))
+        
+    except KeyboardInterrupt:
+        return 0
     except Exception as e:
         console.print(f"\n💥 [bold red]Fatal error: {e}[/bold red]")
         return 1
@@ -6,12 +6,22 @@ Analyzes incidents to find root causes and recommend workflows
 
 import os
 import sys
+import asyncio
 import json
+import re
 import time
+import hashlib
+import sqlite3
 import argparse
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from itertools import zip_longest
+from contextlib import nullcontext
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, ClassVar
 from pathlib import Path
+import numpy as np
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -20,7 +30,7 @@ load_dotenv()
 # Add src to path for imports
 sys.path.append(str(Path(__file__).parent))
 
-from elasticsearch import Elasticsearch
+from elasticsearch import AsyncElasticsearch, NotFoundError, helpers
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -30,6 +40,86 @@ from rich import print as rprint
 
 from utils.llm_client import LLMClient
 
+# Optional sentence transformer for vector similarity search
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_MODEL_AVAILABLE = True
+except ImportError:
+    SENTENCE_MODEL_AVAILABLE = False
+
+# Optional orjson for faster prompt/response (de)serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(data: Any) -> str:
+    """Serialize to indented JSON text (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON text (orjson when installed); raises json.JSONDecodeError"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# Placeholders for fields missing from the LLM's analysis
+_REQUIRED_DEFAULTS = {
+    field: f"Unknown {field}"
+    for field in ("root_cause", "recommended_workflow", "confidence", "reasoning")
+}
+
+
+@dataclass(slots=True)
+class IncidentView:
+    """Incident fields the LLM prompt needs"""
+    id: str
+    title: str
+    description: str
+    affected_service: str
+    severity: str
+    timestamp: str
+    
+    @classmethod
+    def from_incident(cls, incident: Dict[str, Any]) -> "IncidentView":
+        get = incident.get
+        return cls(
+            id=get("incident_id", ""),
+            title=get("title", ""),
+            description=get("description", ""),
+            affected_service=get("affected_service", ""),
+            severity=get("severity", ""),
+            timestamp=get("timestamp", "")
+        )
+
+
+@dataclass(slots=True)
+class SimilarIncidentView:
+    """Past-incident fields the LLM prompt needs"""
+    id: str
+    title: str
+    root_cause: str
+    resolution: str
+    score: float
+    
+    @classmethod
+    def from_incident(cls, incident: Dict[str, Any]) -> "SimilarIncidentView":
+        get = incident.get
+        return cls(
+            id=get("incident_id", ""),
+            title=get("title", ""),
+            root_cause=get("root_cause", ""),
+            resolution=get("resolution", ""),
+            score=get("_score", 0)
+        )
+
+
 class AnalystAgent:
     """
     Autonomous agent for incident analysis and root cause determination
@@ -42,6 +132,65 @@ class AnalystAgent:
     - Update incidents with findings
     """
     
+    # The query's time-range WHERE line, replaced by the incident's filters
+    TIME_FILTER_PATTERN = re.compile(r"^[ \t]*\| WHERE @timestamp .*$", re.MULTILINE)
+    DEFAULT_TIME_FILTER = "| WHERE @timestamp > NOW() - 1h"
+    INCIDENT_TIME_FILTER = "| WHERE @timestamp >= TO_DATETIME(?ts) - 30 minutes AND @timestamp <= TO_DATETIME(?ts) + 30 minutes"
+    SERVICE_FILTER = "\n| WHERE service == ?svc"
+    
+    # Incident fields analysis reads; everything else stays on the server
+    INCIDENT_FIELDS = ["incident_id", "title", "description", "affected_service", "severity", "timestamp", "tags",
+                       "error_message"]
+    SIMILAR_FIELDS = ["incident_id", "title", "root_cause", "resolution"]
+    
+    # Similar incidents used by the analysis (prompt context and stored IDs)
+    SIMILAR_TOP_K = 3
+    
+    # kNN over the error_signature_embedding vectors written at ingest
+    # (same model as data/generate_incidents.py)
+    EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+    EMBEDDING_FIELD = "error_signature_embedding"
+    KNN_NUM_CANDIDATES = 50
+    
+    # Batches score similarity locally against the resolved incidents'
+    # vectors when there are at most this many (refetched after the TTL)
+    LOCAL_CORPUS_LIMIT = 50_000
+    LOCAL_CORPUS_TTL = 300
+    
+    # Correlation results cached per (service, 5-minute bucket of incident time)
+    CORRELATION_CACHE_SIZE = 512
+    CORRELATION_BUCKET_MINUTES = 5
+    
+    # Parsed-OK LLM responses, keyed by prompt hash (ANALYST_LLM_CACHE="" disables)
+    LLM_CACHE_PATH = os.getenv("ANALYST_LLM_CACHE", ".cache/llm.sqlite")
+    LLM_CACHE_TTL = 7 * 24 * 3600
+    
+    # Set after the first successful ping; later agents in this process skip it
+    _ping_ok = False
+    
+    # Max incident updates written per background bulk request
+    UPDATE_BATCH_SIZE = 500
+    
+    # Process-wide shared agent (see instance())
+    _instance: ClassVar[Optional["AnalystAgent"]] = None
+    _instance_lock = threading.Lock()
+    
+    @classmethod
+    def instance(cls, **kwargs) -> "AnalystAgent":
+        """
+        Get the process-wide agent, constructing it on first call
+        
+        Reuses the Elasticsearch pool, LLM client and loaded queries across
+        callers. The instance is forgotten once closed.
+        
+        Args:
+            **kwargs: Constructor arguments (used on first call only)
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(**kwargs)
+            return cls._instance
+    
     def __init__(self, verbose: bool = True):
         self.console = Console()
         self.verbose = verbose
@@ -49,33 +198,105 @@ class AnalystAgent:
         # Initialize connections
         self._setup_elasticsearch()
         self._setup_llm()
+        self._setup_llm_cache()
         self._load_esql_queries()
         
         # Analysis tracking
         self.analyses_performed = 0
         self.successful_analyses = 0
         
+        # incident_id -> document _id, recorded by load_incident for update_incident
+        self._doc_ids: Dict[str, str] = {}
+        
+        # (service, time bucket) -> correlation rows, least recently used first
+        self._correlation_cache: "OrderedDict[Tuple[str, str], Tuple[Dict[str, Any], ...]]" = OrderedDict()
+        
+        # Sentence transformer, loaded on first similarity search (in a worker thread)
+        self._embedding_model = None
+        self._embedding_lock = threading.Lock()
+        
+        # Filter cache warm-up started by connect()
+        self._warmup_task: Optional[asyncio.Task] = None
+        
+        # Incident updates awaiting the background bulk writer (created on
+        # first use, since asyncio objects bind to the running loop)
+        self._update_queue: Optional[asyncio.Queue] = None
+        self._update_task: Optional[asyncio.Task] = None
+        
+        # Resolved-incident vectors for batch scoring:
+        # (doc _ids, incident_ids, unit (M, dims) float32 matrix, fetched at)
+        self._corpus: Optional[Tuple[List[str], List[str], Optional[np.ndarray], float]] = None
+        
         if self.verbose:
             self.console.print("🔬 [bold green]Analyst Agent initialized[/bold green]")
     
     def _setup_elasticsearch(self):
-        """Setup Elasticsearch connection"""
+        """Setup Elasticsearch client (connection is verified in connect())"""
+        # Keep-alive pool shared by concurrent analyses (the orchestrator
+        # runs several pipelines at once, each overlapping two searches);
+        # gzip bodies since correlation and similar-incident results are
+        # repetitive JSON. Elastic Cloud doesn't need sniffing
+        self.es = AsyncElasticsearch(
+            cloud_id=os.getenv("ELASTIC_CLOUD_ID"),
+            api_key=os.getenv("ELASTIC_API_KEY"),
+            http_compress=True,
+            connections_per_node=25,
+            request_timeout=30,
+            max_retries=2,
+            retry_on_timeout=True,
+            sniff_on_start=False
+        )
+    
+    async def connect(self):
+        """
+        Verify the Elasticsearch connection and warm the resolved-incident
+        filter; call once inside the event loop
+        
+        Only the first call in a process pings the cluster; after that,
+        query errors surface through each method's own error handling.
+        """
+        if not AnalystAgent._ping_ok:
+            try:
+                # Test connection
+                if await self.es.ping():
+                    AnalystAgent._ping_ok = True
+                    if self.verbose:
+                        self.console.print("✅ [green]Elasticsearch connected[/green]")
+                else:
+                    raise Exception("Elasticsearch ping failed")
+                    
+            except Exception as e:
+                self.console.print(f"❌ [red]Elasticsearch setup failed: {e}[/red]")
+                await self.close()
+                raise
+        
+        # Runs in the background; the first analysis needn't wait for it
+        self._warmup_task = asyncio.ensure_future(self._warm_filter_cache())
+    
+    async def _warm_filter_cache(self):
+        """Build the cached status:resolved filter that similar-incident kNN searches apply"""
         try:
-            self.es = Elasticsearch(
-                cloud_id=os.getenv("ELASTIC_CLOUD_ID"),
-                api_key=os.getenv("ELASTIC_API_KEY")
+            await self.es.search(
+                index="incidentiq-incidents",
+                query={"bool": {"filter": [{"term": {"status.keyword": "resolved"}}]}},
+                size=0,
+                track_total_hits=False
             )
-            
-            # Test connection
-            if self.es.ping():
-                if self.verbose:
-                    self.console.print("✅ [green]Elasticsearch connected[/green]")
-            else:
-                raise Exception("Elasticsearch ping failed")
-                
-        except Exception as e:
-            self.console.print(f"❌ [red]Elasticsearch setup failed: {e}[/red]")
-            raise
+        except Exception:
+            pass  # Only an optimization; the first real search builds it instead
+    
+    async def close(self):
+        """Write queued updates and release the Elasticsearch connection pool"""
+        with AnalystAgent._instance_lock:
+            if AnalystAgent._instance is self:
+                AnalystAgent._instance = None
+        try:
+            await self.flush()
+        finally:
+            for task in (self._update_task, self._warmup_task):
+                if task is not None:
+                    task.cancel()
+            await self.es.close()
     
     def _setup_llm(self):
         """Setup LLM client"""
@@ -87,6 +308,112 @@ class AnalystAgent:
             self.console.print(f"❌ [red]LLM setup failed: {e}[/red]")
             raise
     
+    def _setup_llm_cache(self):
+        """Open the on-disk LLM response cache (analysis runs without it on failure)"""
+        self._llm_cache = None
+        self._llm_cache_lock = threading.Lock()
+        if not self.LLM_CACHE_PATH:
+            return
+        
+        try:
+            Path(self.LLM_CACHE_PATH).parent.mkdir(parents=True, exist_ok=True)
+            self._llm_cache = sqlite3.connect(self.LLM_CACHE_PATH, check_same_thread=False)
+            self._llm_cache.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses (key TEXT PRIMARY KEY, response TEXT, created REAL)"
+            )
+            self._llm_cache.execute(
+                "DELETE FROM llm_responses WHERE created < ?", (time.time() - self.LLM_CACHE_TTL,)
+            )
+            self._llm_cache.commit()
+        except sqlite3.Error as e:
+            self.console.print(f"⚠️  [yellow]LLM cache unavailable: {e}[/yellow]")
+            self._llm_cache = None
+    
+    def _llm_cache_key(self, system_prompt: str, user_prompt: str, temperature: float, max_tokens: int) -> str:
+        """Hash everything that determines the LLM's answer"""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (self.llm.provider, str(temperature), str(max_tokens), system_prompt, user_prompt):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+    
+    def _generate_cached(self, user_prompt: str, system_prompt: str, temperature: float, max_tokens: int) -> str:
+        """
+        Generate a JSON LLM response, reusing the stored answer for an identical prompt
+        
+        Only responses that parse as a JSON object are stored, so fallback
+        analyses are retried on the next run.
+        """
+        key = self._llm_cache_key(system_prompt, user_prompt, temperature, max_tokens)
+        
+        if self._llm_cache is not None:
+            with self._llm_cache_lock:
+                row = self._llm_cache.execute(
+                    "SELECT response FROM llm_responses WHERE key = ? AND created >= ?",
+                    (key, time.time() - self.LLM_CACHE_TTL)
+                ).fetchone()
+            if row:
+                if self.verbose:
+                    self.console.print("♻️  [dim]Reusing cached AI analysis[/dim]")
+                return row[0]
+        
+        response = self._generate_streamed(user_prompt, system_prompt, temperature, max_tokens)
+        
+        if self._llm_cache is not None:
+            try:
+                # Only cache what generate_analysis can use: a JSON object
+                if not isinstance(_loads(response), dict):
+                    return response
+                with self._llm_cache_lock:
+                    self._llm_cache.execute(
+                        "INSERT OR REPLACE INTO llm_responses VALUES (?, ?, ?)", (key, response, time.time())
+                    )
+                    self._llm_cache.commit()
+            except (ValueError, sqlite3.Error):
+                pass
+        
+        return response
+    
+    def _generate_streamed(self, user_prompt: str, system_prompt: str, temperature: float, max_tokens: int) -> str:
+        """
+        Stream a JSON LLM response, stopping early if it starts as prose
+        
+        A response that doesn't open with '{' or '[' would fail to parse
+        anyway, so generation is cut off there instead of paying for the rest.
+        Stream errors fall back to generate(), which retries and can switch
+        provider.
+        """
+        chunks = []
+        stream = self.llm.stream(
+            prompt=user_prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format="json"
+        )
+        try:
+            started = False
+            for text in stream:
+                chunks.append(text)
+                if not started and text.strip():
+                    started = True
+                    if text.lstrip()[0] not in "{[":
+                        break
+        except Exception as e:
+            if self.verbose:
+                self.console.print(f"⚠️  [yellow]LLM stream failed ({e}), retrying without streaming[/yellow]")
+            return self.llm.generate(
+                prompt=user_prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format="json"
+            )
+        finally:
+            stream.close()
+        
+        return "".join(chunks)
+    
     def _load_esql_queries(self):
         """Load ES|QL query templates"""
         try:
@@ -115,8 +442,26 @@ class AnalystAgent:
             | SORT count DESC
             | LIMIT 5
             """
+        
+        # Turn the time-range line into a {where_clause} slot once, so each
+        # call is a single format() (literal braces escaped first)
+        escaped = self.correlate_query.replace("{", "{{").replace("}", "}}")
+        self._correlate_tmpl, replaced = self.TIME_FILTER_PATTERN.subn("{where_clause}", escaped, count=1)
+        if not replaced:
+            self.console.print("⚠️  [yellow]Correlation query has no @timestamp filter; incident time ignored[/yellow]")
+        
+        # Render the four filter combinations once; incident values are bound
+        # as ES|QL params, so the text sent is identical across incidents
+        self._correlate_queries = {
+            (has_time, has_service): self._correlate_tmpl.format(
+                where_clause=(self.INCIDENT_TIME_FILTER if has_time else self.DEFAULT_TIME_FILTER)
+                + (self.SERVICE_FILTER if has_service else "")
+            )
+            for has_time in (True, False)
+            for has_service in (True, False)
+        }
     
-    def load_incident(self, incident_id: str) -> Optional[Dict[str, Any]]:
+    async def load_incident(self, incident_id: str) -> Optional[Dict[str, Any]]:
         """
         Load incident from Elasticsearch
         
@@ -130,22 +475,32 @@ class AnalystAgent:
             if self.verbose:
                 self.console.print(f"📥 Loading incident: {incident_id}")
             
-            # Search for incident by ID
-            query = {
-                "query": {
-                    "term": {
-                        "incident_id.keyword": incident_id
-                    }
+            # Incidents are indexed with _id == incident_id; older documents
+            # without that id are found by searching the incident_id field
+            try:
+                hit = await self.es.get(index="incidentiq-incidents", id=incident_id,
+                                        source_includes=self.INCIDENT_FIELDS)
+            except NotFoundError:
+                query = {
+                    "query": {
+                        "term": {
+                            "incident_id.keyword": incident_id
+                        }
+                    },
+                    "_source": self.INCIDENT_FIELDS,
+                    "size": 1
                 }
-            }
-            
-            result = self.es.search(
-                index="incidentiq-incidents",
-                body=query
-            )
+                
+                result = await self.es.search(
+                    index="incidentiq-incidents",
+                    body=query
+                )
+                hits = result["hits"]["hits"]
+                hit = hits[0] if hits else None
             
-            if result["hits"]["total"]["value"] > 0:
-                incident = result["hits"]["hits"][0]["_source"]
+            if hit:
+                incident = hit["_source"]
+                self._doc_ids[incident_id] = hit["_id"]
                 if self.verbose:
                     self.console.print(f"✅ [green]Incident found: {incident.get('title', 'No title')}[/green]")
                 return incident
@@ -157,10 +512,163 @@ class AnalystAgent:
             self.console.print(f"❌ [red]Error loading incident: {e}[/red]")
             return None
     
-    def find_similar_incidents(self, incident: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _embed(self, text: str) -> Optional[List[float]]:
+        """
+        Embed text with the ingest-time sentence model
+        
+        Returns:
+            384-dim vector, or None if sentence_transformers isn't installed
+        """
+        if not SENTENCE_MODEL_AVAILABLE or not text:
+            return None
+        
+        with self._embedding_lock:
+            return self._get_embedding_model().encode(text).tolist()
+    
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        """Embed texts in one model call as unit-length float32 rows"""
+        with self._embedding_lock:
+            vectors = np.asarray(self._get_embedding_model().encode(texts), dtype=np.float32)
+        return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+    
+    def _get_embedding_model(self):
+        """Load the sentence model on first use (caller holds _embedding_lock)"""
+        if self._embedding_model is None:
+            if self.verbose:
+                self.console.print("🤖 Loading sentence transformer model...")
+            self._embedding_model = SentenceTransformer(self.EMBEDDING_MODEL)
+        return self._embedding_model
+    
+    def _embedding_text(self, incident: Dict[str, Any]) -> str:
+        """Text embedded for an incident's similarity search"""
+        return incident.get("error_message") or f"{incident.get('title', '')} {incident.get('description', '')}".strip()
+    
+    async def _load_corpus(self) -> Optional[Tuple[List[str], List[str], np.ndarray]]:
+        """
+        Fetch resolved incidents' vectors for local scoring, reusing them for LOCAL_CORPUS_TTL
+        
+        Returns:
+            (document _ids, incident IDs, unit-length (M, dims) matrix), or
+            None if the corpus is larger than LOCAL_CORPUS_LIMIT or no resolved
+            incident has an embedding
+        """
+        if self._corpus is not None and time.monotonic() - self._corpus[3] < self.LOCAL_CORPUS_TTL:
+            return None if self._corpus[2] is None else self._corpus[:3]
+        
+        embedded_resolved = {"bool": {"filter": [
+            {"term": {"status.keyword": "resolved"}},
+            {"exists": {"field": self.EMBEDDING_FIELD}}
+        ]}}
+        count = await self.es.count(index="incidentiq-incidents", query=embedded_resolved)
+        if count["count"] > self.LOCAL_CORPUS_LIMIT:
+            return None
+        
+        doc_ids, incident_ids, vectors = [], [], []
+        async for hit in helpers.async_scan(
+            self.es,
+            index="incidentiq-incidents",
+            query={
+                "query": embedded_resolved,
+                "_source": ["incident_id", self.EMBEDDING_FIELD]
+            },
+            size=1000
+        ):
+            vector = hit["_source"].get(self.EMBEDDING_FIELD)
+            if vector:
+                doc_ids.append(hit["_id"])
+                incident_ids.append(hit["_source"].get("incident_id", hit["_id"]))
+                vectors.append(vector)
+        
+        if not vectors:
+            # Embeddings are only written when the model was available at ingest;
+            # remember that for the TTL so callers fall back to hybrid search
+            self._corpus = ([], [], None, time.monotonic())
+            return None
+        
+        matrix = np.asarray(vectors, dtype=np.float32).reshape(len(vectors), -1)
+        matrix /= np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+        self._corpus = (doc_ids, incident_ids, matrix, time.monotonic())
+        return doc_ids, incident_ids, matrix
+    
+    async def find_similar_incidents_batch(
+        self, incidents: Dict[str, Dict[str, Any]]
+    ) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """
+        Find similar resolved incidents for a batch with one local matrix product
+        
+        Scores cosine similarity of every incident against the cached
+        resolved-incident vectors instead of one kNN search per incident.
+        
+        Args:
+            incidents: incident_id -> incident
+            
+        Returns:
+            incident_id -> top SIMILAR_TOP_K similar incidents (with _score),
+            or None when local scoring isn't available (no sentence model, no
+            embedded resolved incidents, or corpus too large); callers then
+            search per incident
+        """
+        if not SENTENCE_MODEL_AVAILABLE or not incidents:
+            return None
+        
+        try:
+            corpus = await self._load_corpus()
+            if corpus is None:
+                return None
+            doc_ids, corpus_ids, corpus_vecs = corpus
+            
+            texts = [self._embedding_text(incident) or incident_id for incident_id, incident in incidents.items()]
+            query_vecs = await asyncio.to_thread(self._embed_batch, texts)
+            
+            # (M, N) cosine similarities; the current incident never matches itself
+            scores = corpus_vecs @ query_vecs.T
+            position = {incident_id: i for i, incident_id in enumerate(corpus_ids)}
+            for column, incident_id in enumerate(incidents):
+                if incident_id in position:
+                    scores[position[incident_id], column] = -np.inf
+            
+            k = min(self.SIMILAR_TOP_K, len(corpus_ids))
+            matches: Dict[str, List[Tuple[str, float]]] = {}
+            for column, incident_id in enumerate(incidents):
+                if k == 0:
+                    matches[incident_id] = []
+                    continue
+                column_scores = scores[:, column]
+                top = np.argpartition(-column_scores, k - 1)[:k]
+                top = top[np.argsort(-column_scores[top])]
+                matches[incident_id] = [
+                    (doc_ids[row], float(column_scores[row]))
+                    for row in top if np.isfinite(column_scores[row])
+                ]
+            
+            # One mget for every matched incident's prompt fields
+            wanted = list({match_id for found in matches.values() for match_id, _ in found})
+            sources = {}
+            if wanted:
+                response = await self.es.mget(index="incidentiq-incidents", ids=wanted,
+                                              source_includes=self.SIMILAR_FIELDS)
+                sources = {doc["_id"]: doc["_source"] for doc in response["docs"] if doc.get("found")}
+            
+            return {
+                incident_id: [
+                    {**sources[match_id], "_score": score}
+                    for match_id, score in found if match_id in sources
+                ]
+                for incident_id, found in matches.items()
+            }
+            
+        except Exception as e:
+            self.console.print(f"⚠️  [yellow]Local similarity scoring failed, searching per incident: {e}[/yellow]")
+            return None
+    
+    async def find_similar_incidents(self, incident: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Find similar past incidents using hybrid search
         
+        BM25 text/service matching is combined with an approximate kNN search
+        over the incidents' error embeddings when sentence_transformers is
+        installed.
+        
         Args:
             incident: Current incident to analyze
             
@@ -220,10 +728,25 @@ class AnalystAgent:
                         ]
                     }
                 },
-                "size": 5
+                "_source": self.SIMILAR_FIELDS,
+                "size": self.SIMILAR_TOP_K
             }
             
-            result = self.es.search(
+            # Semantic match on the error embedding (HNSW, resolved incidents only)
+            query_vector = await asyncio.to_thread(self._embed, self._embedding_text(incident))
+            if query_vector is not None:
+                query["knn"] = {
+                    "field": self.EMBEDDING_FIELD,
+                    "query_vector": query_vector,
+                    "k": query["size"],
+                    "num_candidates": self.KNN_NUM_CANDIDATES,
+                    "filter": [
+                        {"term": {"status.keyword": "resolved"}},
+                        {"bool": {"must_not": {"term": {"incident_id.keyword": incident.get("incident_id", "")}}}}
+                    ]
+                }
+            
+            result = await self.es.search(
                 index="incidentiq-incidents",
                 body=query
             )
@@ -243,7 +766,7 @@ class AnalystAgent:
             self.console.print(f"❌ [red]Error finding similar incidents: {e}[/red]")
             return []
     
-    def correlate_root_causes(self, incident: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def correlate_root_causes(self, incident: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Run ES|QL correlation to find root cause patterns
         
@@ -261,34 +784,40 @@ class AnalystAgent:
             affected_service = incident.get("affected_service", "")
             incident_time = incident.get("timestamp", "")
             
-            # Build time range around incident
+            # Incidents on the same service within a few minutes correlate
+            # over (nearly) the same ±30m window, so reuse the earlier result
+            cache_key = None
             if incident_time:
-                time_filter = f"| WHERE @timestamp >= \"{incident_time}\" - 30m AND @timestamp <= \"{incident_time}\" + 30m"
-            else:
-                time_filter = "| WHERE @timestamp > NOW() - 1h"
+                cache_key = (affected_service, self._time_bucket(incident_time))
+                cached = self._correlation_cache.get(cache_key)
+                if cached is not None:
+                    self._correlation_cache.move_to_end(cache_key)
+                    if self.verbose:
+                        self.console.print(f"✅ [green]Found {len(cached)} correlation patterns (cached)[/green]")
+                    return [dict(row) for row in cached]
             
-            # Add service filter if available
-            service_filter = ""
+            # Time range around the incident and service filter, as bound params
+            query = self._correlate_queries[(bool(incident_time), bool(affected_service))]
+            params = []
+            if incident_time:
+                params.append({"ts": incident_time})
             if affected_service:
-                service_filter = f"| WHERE service == \"{affected_service}\""
-            
-            # Customize the base query
-            custom_query = self.correlate_query.replace(
-                "WHERE @timestamp > NOW() - 1h",
-                f"{time_filter}{service_filter}"
-            )
+                params.append({"svc": affected_service})
             
             # Execute ES|QL query
-            result = self.es.esql.query(body={"query": custom_query})
+            result = await self.es.esql.query(query=query, params=params or None)
             
-            correlation_data = []
-            if result.get("values"):
-                columns = result.get("columns", [])
-                for row in result["values"]:
-                    row_dict = {}
-                    for i, col in enumerate(columns):
-                        row_dict[col["name"]] = row[i] if i < len(row) else None
-                    correlation_data.append(row_dict)
+            # Short rows are padded with None for the missing columns
+            names = [col["name"] for col in result.get("columns", [])]
+            correlation_data = [
+                dict(zip_longest(names, row[:len(names)]))
+                for row in result.get("values") or []
+            ]
+            
+            if cache_key is not None:
+                self._correlation_cache[cache_key] = tuple(dict(row) for row in correlation_data)
+                if len(self._correlation_cache) > self.CORRELATION_CACHE_SIZE:
+                    self._correlation_cache.popitem(last=False)
             
             if self.verbose:
                 self.console.print(f"✅ [green]Found {len(correlation_data)} correlation patterns[/green]")
@@ -300,7 +829,33 @@ class AnalystAgent:
             # Return empty results for graceful degradation
             return []
     
-    def generate_analysis(
+    async def gather_context(self, incident: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Run the similarity search and root cause correlation concurrently
+        
+        Both only need the loaded incident, so their Elasticsearch round-trips
+        overlap instead of running back to back.
+        
+        Args:
+            incident: Incident to analyze
+            
+        Returns:
+            (similar incidents, correlation results)
+        """
+        return await asyncio.gather(
+            self.find_similar_incidents(incident),
+            self.correlate_root_causes(incident)
+        )
+    
+    def _time_bucket(self, timestamp: str) -> str:
+        """Truncate an ISO timestamp to CORRELATION_BUCKET_MINUTES resolution"""
+        try:
+            minute = int(timestamp[14:16])
+        except ValueError:
+            return timestamp
+        return f"{timestamp[:14]}{minute - minute % self.CORRELATION_BUCKET_MINUTES:02d}"
+    
+    async def generate_analysis(
         self, 
         incident: Dict[str, Any], 
         similar_incidents: List[Dict[str, Any]], 
@@ -317,32 +872,21 @@ class AnalystAgent:
         Returns:
             Analysis results with root cause and recommendations
         """
+        # One clock read stamps every outcome of this analysis
+        analyzed_at = datetime.now(timezone.utc).isoformat()
+        top_similar = similar_incidents[:self.SIMILAR_TOP_K]
+        similar_ids = [sim.get("incident_id", "") for sim in top_similar]
+        
         try:
             if self.verbose:
                 self.console.print("🤖 Generating AI analysis...")
             
             # Build context for LLM
-            context = {
-                "incident": {
-                    "id": incident.get("incident_id", ""),
-                    "title": incident.get("title", ""),
-                    "description": incident.get("description", ""),
-                    "affected_service": incident.get("affected_service", ""),
-                    "severity": incident.get("severity", ""),
-                    "timestamp": incident.get("timestamp", "")
-                },
-                "similar_incidents": [
-                    {
-                        "id": sim.get("incident_id", ""),
-                        "title": sim.get("title", ""),
-                        "root_cause": sim.get("root_cause", ""),
-                        "resolution": sim.get("resolution", ""),
-                        "score": sim.get("_score", 0)
-                    }
-                    for sim in similar_incidents[:3]  # Top 3
-                ],
-                "correlation_data": correlation_data[:10]  # Top 10 patterns
-            }
+            incident_view = asdict(IncidentView.from_incident(incident))
+            similar_views = [
+                asdict(SimilarIncidentView.from_incident(sim))
+                for sim in top_similar
+            ]
             
             system_prompt = """You are an expert SRE analyzing incidents to determine root causes and recommend workflows.
 
@@ -359,39 +903,34 @@ Respond with valid JSON only."""
             user_prompt = f"""Analyze this incident:
 
 CURRENT INCIDENT:
-{json.dumps(context['incident'], indent=2)}
+{_dumps(incident_view)}
 
 SIMILAR PAST INCIDENTS:
-{json.dumps(context['similar_incidents'], indent=2)}
+{_dumps(similar_views)}
 
 CORRELATION DATA:
-{json.dumps(context['correlation_data'], indent=2)}
+{_dumps(correlation_data[:10])}
 
 Determine root cause and recommend workflow. Respond in JSON with: root_cause, recommended_workflow, confidence, reasoning, similar_incidents (list of IDs)"""
             
-            # Generate analysis
-            response = self.llm.generate(
-                prompt=user_prompt,
-                system_prompt=system_prompt,
-                temperature=0.3,
-                max_tokens=1024,
-                response_format="json"
+            # Generate analysis (identical prompts reuse the stored response);
+            # the LLM SDKs and the SQLite cache block, so run off the event loop
+            response = await asyncio.to_thread(
+                self._generate_cached, user_prompt, system_prompt, temperature=0.3, max_tokens=1024
             )
             
             # Parse response
             try:
-                analysis = json.loads(response)
+                analysis = _loads(response)
                 
                 # Validate required fields
-                required_fields = ["root_cause", "recommended_workflow", "confidence", "reasoning"]
-                for field in required_fields:
-                    if field not in analysis:
-                        analysis[field] = f"Unknown {field}"
+                for field, default in _REQUIRED_DEFAULTS.items():
+                    analysis.setdefault(field, default)
                 
                 # Add metadata
-                analysis["analyzed_at"] = datetime.now(timezone.utc).isoformat()
+                analysis["analyzed_at"] = analyzed_at
                 analysis["analyst"] = "ai_analyst_agent"
-                analysis["similar_incidents"] = [sim.get("incident_id", "") for sim in similar_incidents[:3]]
+                analysis["similar_incidents"] = similar_ids
                 
                 if self.verbose:
                     self.console.print(f"✅ [green]Analysis generated - Root cause: {analysis.get('root_cause', 'Unknown')}[/green]")
@@ -405,9 +944,9 @@ Determine root cause and recommend workflow. Respond in JSON with: root_cause, r
                     "recommended_workflow": "manual_intervention", 
                     "confidence": 0.1,
                     "reasoning": f"JSON parsing error: {e}",
-                    "analyzed_at": datetime.now(timezone.utc).isoformat(),
+                    "analyzed_at": analyzed_at,
                     "analyst": "ai_analyst_agent",
-                    "similar_incidents": [sim.get("incident_id", "") for sim in similar_incidents[:3]]
+                    "similar_incidents": similar_ids
                 }
                 
         except Exception as e:
@@ -417,12 +956,25 @@ Determine root cause and recommend workflow. Respond in JSON with: root_cause, r
                 "recommended_workflow": "manual_intervention",
                 "confidence": 0.0,
                 "reasoning": f"Error: {str(e)}",
-                "analyzed_at": datetime.now(timezone.utc).isoformat(),
+                "analyzed_at": analyzed_at,
                 "analyst": "ai_analyst_agent",
-                "similar_incidents": []
+                "similar_incidents": similar_ids
             }
     
-    def update_incident(self, incident: Dict[str, Any], analysis: Dict[str, Any]) -> bool:
+    def _build_update_doc(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Fields written back to the incident once it has been analyzed"""
+        return {
+            "root_cause": analysis.get("root_cause"),
+            "recommended_workflow": analysis.get("recommended_workflow"),
+            "confidence": analysis.get("confidence"),
+            "reasoning": analysis.get("reasoning"),
+            "similar_incidents": analysis.get("similar_incidents", []),
+            "analyzed_at": analysis.get("analyzed_at"),
+            "analyst": analysis.get("analyst"),
+            "status": "analyzed"  # Update status to indicate analysis complete
+        }
+    
+    async def update_incident(self, incident: Dict[str, Any], analysis: Dict[str, Any]) -> bool:
         """
         Update incident with analysis results
         
@@ -438,56 +990,80 @@ Determine root cause and recommend workflow. Respond in JSON with: root_cause, r
                 self.console.print("💾 Updating incident with analysis...")
             
             incident_id = incident.get("incident_id", "")
+            update_doc = self._build_update_doc(analysis)
             
-            # Prepare update document
-            update_doc = {
-                "root_cause": analysis.get("root_cause"),
-                "recommended_workflow": analysis.get("recommended_workflow"),
-                "confidence": analysis.get("confidence"),
-                "reasoning": analysis.get("reasoning"),
-                "similar_incidents": analysis.get("similar_incidents", []),
-                "analyzed_at": analysis.get("analyzed_at"),
-                "analyst": analysis.get("analyst"),
-                "status": "analyzed"  # Update status to indicate analysis complete
-            }
-            
-            # Update incident in Elasticsearch
-            query = {
-                "query": {
-                    "term": {
-                        "incident_id.keyword": incident_id
-                    }
-                },
-                "script": {
-                    "source": """
-                    for (entry in params.updates.entrySet()) {
-                        ctx._source[entry.getKey()] = entry.getValue();
-                    }
-                    """,
-                    "params": {
-                        "updates": update_doc
-                    }
-                }
-            }
-            
-            result = self.es.update_by_query(
-                index="incidentiq-incidents",
-                body=query
-            )
-            
-            if result.get("updated", 0) > 0:
-                if self.verbose:
-                    self.console.print(f"✅ [green]Incident {incident_id} updated successfully[/green]")
-                return True
-            else:
+            # Partial-doc update by _id (as resolved by load_incident), written
+            # by the background writer together with other pending updates
+            doc_id = self._doc_ids.pop(incident_id, incident_id)
+            if not await self._queue_update(doc_id, update_doc):
                 self.console.print(f"⚠️  [yellow]No incident updated for {incident_id}[/yellow]")
                 return False
+            
+            if self.verbose:
+                self.console.print(f"✅ [green]Incident {incident_id} updated successfully[/green]")
+            return True
                 
         except Exception as e:
             self.console.print(f"❌ [red]Error updating incident: {e}[/red]")
             return False
     
-    def analyze_incident(self, incident_id: str) -> Optional[Dict[str, Any]]:
+    def _queue_update(self, doc_id: str, update_doc: Dict[str, Any]) -> "asyncio.Future[bool]":
+        """
+        Queue a partial-doc update for the background bulk writer
+        
+        Returns:
+            Future resolving to True once the update is written, False if it failed
+        """
+        if self._update_queue is None:
+            self._update_queue = asyncio.Queue()
+        if self._update_task is None or self._update_task.done():
+            self._update_task = asyncio.ensure_future(self._update_writer())
+        
+        written = asyncio.get_running_loop().create_future()
+        self._update_queue.put_nowait((doc_id, update_doc, written))
+        return written
+    
+    async def _update_writer(self):
+        """
+        Write queued updates with one bulk request per batch
+        
+        Updates queued while a batch is in flight go out together in the next
+        one, so concurrent analyses share round-trips.
+        """
+        while True:
+            batch = [await self._update_queue.get()]
+            while len(batch) < self.UPDATE_BATCH_SIZE and not self._update_queue.empty():
+                batch.append(self._update_queue.get_nowait())
+            
+            try:
+                _, errors = await helpers.async_bulk(
+                    self.es,
+                    (
+                        {"_op_type": "update", "_index": "incidentiq-incidents", "_id": doc_id,
+                         "doc": update_doc, "retry_on_conflict": 3}
+                        for doc_id, update_doc, _ in batch
+                    ),
+                    raise_on_error=False
+                )
+                failed = {error.get("update", {}).get("_id") for error in errors}
+                for doc_id, _, written in batch:
+                    if not written.done():
+                        written.set_result(doc_id not in failed)
+            except Exception as e:
+                self.console.print(f"❌ [red]Error writing incident updates: {e}[/red]")
+                for _, _, written in batch:
+                    if not written.done():
+                        written.set_result(False)
+            finally:
+                for _ in batch:
+                    self._update_queue.task_done()
+    
+    async def flush(self):
+        """Wait until every queued incident update has been written"""
+        if self._update_queue is not None and self._update_task is not None and not self._update_task.done():
+            await self._update_queue.join()
+    
+    async def analyze_incident(self, incident_id: str) -> Optional[Dict[str, Any]]:
         """
         Complete incident analysis workflow
         
@@ -500,35 +1076,40 @@ Determine root cause and recommend workflow. Respond in JSON with: root_cause, r
         try:
             self.analyses_performed += 1
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=self.console
-            ) as progress:
+            # The spinner's render thread only earns its keep on an interactive terminal
+            progress = None
+            if self.verbose and self.console.is_terminal:
+                progress = Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    console=self.console
+                )
+            
+            with progress or nullcontext():
+                task = progress.add_task("Loading incident...", total=None) if progress else None
+                
+                def step(description: str):
+                    if progress:
+                        progress.update(task, description=description)
                 
                 # Step 1: Load incident
-                task = progress.add_task("Loading incident...", total=None)
-                incident = self.load_incident(incident_id)
+                incident = await self.load_incident(incident_id)
                 if not incident:
                     return None
                 
-                # Step 2: Find similar incidents
-                progress.update(task, description="Finding similar incidents...")
-                similar_incidents = self.find_similar_incidents(incident)
-                
-                # Step 3: Correlate root causes
-                progress.update(task, description="Correlating root causes...")
-                correlation_data = self.correlate_root_causes(incident)
+                # Steps 2-3: Find similar incidents and correlate root causes
+                step("Finding similar incidents and correlating root causes...")
+                similar_incidents, correlation_data = await self.gather_context(incident)
                 
                 # Step 4: Generate analysis
-                progress.update(task, description="Generating AI analysis...")
-                analysis = self.generate_analysis(incident, similar_incidents, correlation_data)
+                step("Generating AI analysis...")
+                analysis = await self.generate_analysis(incident, similar_incidents, correlation_data)
                 
                 # Step 5: Update incident
-                progress.update(task, description="Updating incident...")
-                success = self.update_incident(incident, analysis)
+                step("Updating incident...")
+                success = await self.update_incident(incident, analysis)
                 
-                progress.update(task, description="✅ Analysis complete!")
+                step("✅ Analysis complete!")
             
             if success:
                 self.successful_analyses += 1
@@ -540,6 +1121,81 @@ Determine root cause and recommend workflow. Respond in JSON with: root_cause, r
             self.console.print(f"❌ [red]Analysis workflow failed: {e}[/red]")
             return None
     
+    async def analyze_incidents(self, incident_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Analyze several incidents, loading and updating them in bulk
+        
+        Incidents are fetched with one mget and all updates are written by
+        the bulk update writer; similarity search, correlation and the LLM call
+        run per incident, for all incidents concurrently.
+        
+        Args:
+            incident_ids: IDs of incidents to analyze
+            
+        Returns:
+            incident_id -> analysis results (None if that incident failed)
+        """
+        results: Dict[str, Optional[Dict[str, Any]]] = {iid: None for iid in incident_ids}
+        if not incident_ids:
+            return results
+        
+        self.analyses_performed += len(results)
+        
+        try:
+            # Step 1: Load incidents in one round-trip (_id == incident_id)
+            response = await self.es.mget(index="incidentiq-incidents", ids=list(results),
+                                          source_includes=self.INCIDENT_FIELDS)
+            incidents = {}
+            for doc in response["docs"]:
+                if doc.get("found"):
+                    incidents[doc["_id"]] = doc["_source"]
+                else:
+                    # Older documents without _id == incident_id
+                    incident = await self.load_incident(doc["_id"])
+                    if incident:
+                        incidents[doc["_id"]] = incident
+            
+            # Steps 2-4: Similar incidents (scored locally for the whole batch
+            # when possible), correlation and AI analysis
+            similar_by_id = await self.find_similar_incidents_batch(incidents)
+            
+            async def analyze(incident_id: str, incident: Dict[str, Any]) -> Dict[str, Any]:
+                if similar_by_id is None:
+                    similar_incidents, correlation_data = await self.gather_context(incident)
+                else:
+                    similar_incidents = similar_by_id[incident_id]
+                    correlation_data = await self.correlate_root_causes(incident)
+                return await self.generate_analysis(incident, similar_incidents, correlation_data)
+            
+            analyses = dict(zip(
+                incidents,
+                await asyncio.gather(*(analyze(iid, incident) for iid, incident in incidents.items()))
+            ))
+            
+            # Step 5: Queue every update; the writer sends them as one bulk request
+            if self.verbose:
+                self.console.print(f"💾 Updating {len(analyses)} incidents with analysis...")
+            
+            written = await asyncio.gather(*(
+                self._queue_update(self._doc_ids.pop(incident_id, incident_id), self._build_update_doc(analysis))
+                for incident_id, analysis in analyses.items()
+            ))
+            
+            for (incident_id, analysis), ok in zip(analyses.items(), written):
+                if not ok:
+                    self.console.print(f"⚠️  [yellow]No incident updated for {incident_id}[/yellow]")
+                    continue
+                results[incident_id] = analysis
+                self.successful_analyses += 1
+            
+            if self.verbose:
+                self.console.print(f"✅ [green]Updated {sum(written)} incident(s)[/green]")
+            
+        except Exception as e:
+            self.console.print(f"❌ [red]Batch analysis failed: {e}[/red]")
+        
+        return results
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get agent statistics"""
         return {
@@ -549,6 +1205,15 @@ Determine root cause and recommend workflow. Respond in JSON with: root_cause, r
         }
 
 
+async def _analyze(agent: AnalystAgent, incident_id: str) -> Optional[Dict[str, Any]]:
+    """Connect, analyze one incident and release the connection pool"""
+    await agent.connect()
+    try:
+        return await agent.analyze_incident(incident_id)
+    finally:
+        await agent.close()
+
+
 def main():
     """Main function for testing and demonstration"""
     parser = argparse.ArgumentParser(description="IncidentIQ Analyst Agent")
@@ -570,7 +1235,7 @@ def main():
         
         # Analyze incident
         console.print(f"\n🎯 Analyzing incident: {args.incident}")
-        analysis = agent.analyze_incident(args.incident)
+        analysis = asyncio.run(_analyze(agent, args.incident))
         
         if analysis:
             # Display results
@@ -595,7 +1260,7 @@ def main():
             # Show full JSON if verbose
             if not args.quiet:
                 console.print(f"\n📄 [bold cyan]Full Analysis (JSON):[/bold cyan]")
-                console.print(JSON(json.dumps(analysis, indent=2)))
+                console.print(JSON(_dumps(analysis)))
         
         # Show stats
         stats = agent.get_stats()
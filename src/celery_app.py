@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+IncidentIQ - Celery Task Queue
+Runs orchestrate_incident on worker processes so the pipeline scales out
+
+Usage:
+    celery -A celery_app worker --loglevel=info        # from src/
+    python src/agent_orchestrator.py --monitor --queue  # enqueue instead of running inline
+"""
+
+import os
+import sys
+import asyncio
+from pathlib import Path
+from typing import Optional
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Add src to path for imports
+sys.path.append(str(Path(__file__).parent))
+
+from celery import Celery
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+app = Celery("incidentiq", broker=REDIS_URL, backend=REDIS_URL)
+app.conf.update(
+    task_acks_late=True,              # Re-deliver if a worker dies mid-pipeline
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=1      # Pipelines are long; don't hoard tasks
+)
+
+# One orchestrator and event loop per worker process; the async
+# Elasticsearch client is bound to the loop it was first used on
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_orchestrator = None
+
+
+def _get_orchestrator():
+    """Create this worker's orchestrator on first task (agents load lazily)"""
+    global _loop, _orchestrator
+    if _orchestrator is None:
+        from agent_orchestrator import AgentOrchestrator
+
+        _loop = asyncio.new_event_loop()
+        orchestrator = AgentOrchestrator(verbose=False)
+        _loop.run_until_complete(orchestrator.connect())
+        _orchestrator = orchestrator
+    return _orchestrator
+
+
+async def _orchestrate(orchestrator, incident_id: str) -> str:
+    """Run the pipeline and send its Slack posts before the loop goes idle"""
+    result = await orchestrator.orchestrate_incident(incident_id)
+    await orchestrator.wait_for_notifications()
+    return result
+
+
+@app.task(bind=True, max_retries=3, default_retry_delay=60)
+def run_orchestration(self, incident_id: str) -> str:
+    """
+    Run the full incident pipeline for one incident
+
+    Args:
+        incident_id: Incident ID to process
+
+    Returns:
+        Final status ("complete", "escalated", "failed")
+    """
+    try:
+        orchestrator = _get_orchestrator()
+        return _loop.run_until_complete(_orchestrate(orchestrator, incident_id))
+    except Exception as e:
+        # Pipeline failures escalate inside orchestrate_incident; anything
+        # raised here is infrastructure (ES/agent setup) and worth retrying
+        raise self.retry(exc=e)
@@ -13,22 +13,47 @@ import sys
 import time
 import hashlib
 import argparse
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any, Optional, Tuple
 from dotenv import load_dotenv
-from elasticsearch import Elasticsearch
-from rich.console import Console
-from rich.live import Live
-from rich.table import Table
-from rich.panel import Panel
+from elasticsearch import Elasticsearch, helpers
 
 load_dotenv()
-console = Console()
+
+
+@lru_cache(maxsize=4096)
+def _error_signature(service: str, error_type: str) -> str:
+    """16-hex-char signature; stable across restarts, unlike hash()"""
+    signature_str = f"{service}:{error_type}"
+    return hashlib.blake2b(signature_str.encode(), digest_size=8).hexdigest()
 
 
 class DetectiveAgent:
     """Detective Agent - Detects anomalies and creates incidents"""
     
+    # Template variables in detect_anomalies.esql and their defaults
+    DEFAULT_QUERY_PARAMS = {
+        "time_window": "2m",
+        "anomaly_threshold": "3.0"
+    }
+    MAX_PARALLEL_QUERIES = 8
+    
+    # Fields every incident shares; copied per document, then filled in
+    _INCIDENT_TEMPLATE = {
+        "status": "active",
+        "environment": "production",
+        "detection_agent": "detective_agent",
+        "auto_resolved": False
+    }
+    # Shared, never mutated: documents are only serialized for the bulk write
+    _SEVERITY_TAGS = {
+        severity: ["auto-detected", f"severity-{severity.lower()}"]
+        for severity in ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+    }
+    
     def __init__(self, interval_seconds: int = 60, verbose: bool = True):
         """
         Initialize Detective Agent
@@ -41,23 +66,80 @@ class DetectiveAgent:
         self.verbose = verbose
         self.running = False
         
+        # rich is only imported for verbose runs; quiet runs print plain text
+        self.console = None
+        if self.verbose:
+            from rich.console import Console
+            self.console = Console()
+        
+        # The detection query is invariant at runtime; read and fill it once
+        self._raw_query = self.load_query()
+        self._rendered_queries: Dict[Tuple, str] = {}
+        self._query = self._render_query({})
+        self._columns: Optional[List[str]] = None
+        
         # Connect to Elasticsearch
+        # Long-lived client making many small requests: keep enough pooled
+        # connections for parallel detection queries and compress bodies
         self.es = Elasticsearch(
             cloud_id=os.getenv("ELASTIC_CLOUD_ID"),
-            api_key=os.getenv("ELASTIC_API_KEY")
+            api_key=os.getenv("ELASTIC_API_KEY"),
+            http_compress=True,
+            connections_per_node=self.MAX_PARALLEL_QUERIES,
+            request_timeout=15,
+            max_retries=3,
+            retry_on_timeout=True,
+            sniff_on_start=False
         )
         
-        # Track recent incidents (for deduplication)
-        self.recent_incidents = {}  # {error_signature: incident_id}
+        # Track recent incidents (for deduplication), oldest first; bounded
+        # so a long-running agent doesn't accumulate every signature it saw
+        # {error_signature: (incident_id, time.monotonic() when written)}
+        self.recent_incidents: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
         self.dedup_window = 300  # 5 minutes in seconds
+        self.max_dedup_entries = int(os.getenv("DETECTIVE_DEDUP_CACHE_SIZE", "1024"))
+        
+        # Next incident number, seeded from the index on first use
+        self._next_incident_num: Optional[int] = None
         
         # Statistics
         self.checks_performed = 0
         self.incidents_created = 0
+        self.duplicates_skipped = 0
         self.last_check_time = None
         
         if self.verbose:
-            console.print("[green]✅ Detective Agent initialized[/green]")
+            self._log("✅ Detective Agent initialized", "green")
+    
+    def _log(self, message: str, style: Optional[str] = None, always: bool = False):
+        """
+        Print a status line
+        
+        Args:
+            message: Text to print (may carry rich markup when verbose-only)
+            style: rich style applied in verbose mode
+            always: Also print, as plain text, when running quiet
+        """
+        if self.console is not None:
+            # Markup is explicit; skip rich's regex highlighting on every line
+            self.console.print(
+                f"[{style}]{message}[/{style}]" if style else message,
+                highlight=False
+            )
+        elif always:
+            print(message)
+    
+    def _panel(self, title: str, lines: List[str], border_style: str):
+        """Print a boxed summary, or plain lines when running quiet"""
+        if self.console is None:
+            print("\n".join([title, *lines]))
+            return
+        
+        from rich.panel import Panel
+        self.console.print(Panel.fit(
+            "\n".join([f"[bold]{title}[/bold]", *lines]),
+            border_style=border_style
+        ))
     
     def load_query(self) -> str:
         """Load the anomaly detection ES|QL query"""
@@ -69,119 +151,178 @@ class DetectiveAgent:
         with open(query_path, 'r') as f:
             return f.read()
     
-    def execute_detection_query(self) -> List[Dict[str, Any]]:
-        """
-        Execute anomaly detection query
-        
-        Returns:
-            List of anomaly dictionaries
-        """
-        query = self.load_query()
-        
-        # Replace template variables
-        query = query.replace("$time_window", "2m")
-        query = query.replace("$anomaly_threshold", "3.0")
+    def _render_query(self, params: Dict[str, str]) -> str:
+        """Fill the query's template variables, caching each distinct result"""
+        values = {**self.DEFAULT_QUERY_PARAMS, **params}
+        key = tuple(sorted(values.items()))
         
+        query = self._rendered_queries.get(key)
+        if query is None:
+            query = self._raw_query
+            for name, value in values.items():
+                query = query.replace(f"${name}", value)
+            self._rendered_queries[key] = query
+        return query
+    
+    def _run_detection_query(self, query: str) -> List[Dict[str, Any]]:
+        """Run one filled-in detection query and return its rows as dicts"""
         try:
             result = self.es.esql.query(query=query)
             
-            # Convert to list of dicts
-            columns = [col['name'] for col in result.get('columns', [])]
+            # Convert to list of dicts; the output schema is fixed by the
+            # query file, so column names are read from the first response
+            columns = self._columns
+            if columns is None or len(columns) != len(result.get('columns', [])):
+                columns = self._columns = [col['name'] for col in result.get('columns', [])]
             rows = result.get('values', [])
             
-            anomalies = []
-            for row in rows:
-                anomaly = dict(zip(columns, row))
-                anomalies.append(anomaly)
-            
-            return anomalies
+            # The query ends in LIMIT 10, so per-row dicts stay cheap
+            return [dict(zip(columns, row)) for row in rows]
             
         except Exception as e:
-            console.print(f"[red]❌ Query execution failed: {e}[/red]")
+            self._log(f"❌ Query execution failed: {e}", "red", always=True)
             return []
     
+    def execute_detection_queries(
+        self, queries: List[Tuple[str, Dict[str, str]]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Execute several detection queries concurrently
+        
+        Args:
+            queries: (name, template params) pairs; params override
+                     DEFAULT_QUERY_PARAMS
+        
+        Returns:
+            Anomaly lists keyed by query name
+        """
+        rendered = [(name, self._render_query(params)) for name, params in queries]
+        
+        if len(rendered) == 1:
+            name, query = rendered[0]
+            return {name: self._run_detection_query(query)}
+        
+        # Each query is its own HTTP request on the client's connection
+        # pool, so running them side by side costs one round-trip overall
+        workers = min(len(rendered), self.MAX_PARALLEL_QUERIES)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(self._run_detection_query, [query for _, query in rendered])
+            return {name: anomalies for (name, _), anomalies in zip(rendered, results)}
+    
+    def execute_detection_query(self) -> List[Dict[str, Any]]:
+        """
+        Execute anomaly detection query
+        
+        Returns:
+            List of anomaly dictionaries
+        """
+        return self.execute_detection_queries([("default", {})])["default"]
+    
+    def _expire_dedup(self, now: float):
+        """Drop dedup entries older than the window (they cluster at the head)"""
+        cutoff = now - self.dedup_window
+        recent = self.recent_incidents
+        while recent and next(iter(recent.values()))[1] < cutoff:
+            recent.popitem(last=False)
+    
+    def _put_dedup(self, signature: str, payload: Tuple[str, float]):
+        """Record a signature, evicting the least recently used past the cap"""
+        if signature in self.recent_incidents:
+            self.recent_incidents.move_to_end(signature)
+        else:
+            while len(self.recent_incidents) >= self.max_dedup_entries:
+                self.recent_incidents.popitem(last=False)
+        self.recent_incidents[signature] = payload
+    
     def generate_error_signature(self, service: str, error_type: str) -> str:
         """Generate unique error signature (hash)"""
-        signature_str = f"{service}:{error_type}"
-        return hashlib.md5(signature_str.encode()).hexdigest()[:16]
+        return _error_signature(service, error_type)
     
-    def calculate_severity(self, max_anomaly_score: float) -> str:
-        """Calculate incident severity based on anomaly score"""
-        if max_anomaly_score >= 5.0:
-            return "CRITICAL"
-        elif max_anomaly_score >= 3.0:
-            return "HIGH"
-        elif max_anomaly_score >= 2.0:
-            return "MEDIUM"
-        else:
-            return "LOW"
+    def _seed_incident_counter(self) -> int:
+        """Find the number after the latest incident ID in Elasticsearch"""
+        result = self.es.search(
+            index="incidents-*",
+            body={
+                "size": 1,
+                "sort": [{"@timestamp": "desc"}],
+                "_source": ["incident_id"]
+            }
+        )
+        
+        if result['hits']['hits']:
+            last_id = result['hits']['hits'][0]['_source'].get('incident_id', 'INC-000')
+            # Extract number and increment
+            return int(last_id.split('-')[1]) + 1
+        return 1
     
     def generate_incident_id(self) -> str:
         """Generate next incident ID"""
-        # Query for latest incident
-        try:
-            result = self.es.search(
-                index="incidents-*",
-                body={
-                    "size": 1,
-                    "sort": [{"@timestamp": "desc"}],
-                    "_source": ["incident_id"]
-                }
-            )
-            
-            if result['hits']['hits']:
-                last_id = result['hits']['hits'][0]['_source'].get('incident_id', 'INC-000')
-                # Extract number and increment
-                num = int(last_id.split('-')[1]) + 1
-            else:
-                num = 1
-            
-            return f"INC-{num:03d}"
-            
-        except:
-            # Fallback to timestamp-based ID
-            return f"INC-{int(time.time()) % 1000:03d}"
+        # Seed once from the index, then count locally; a failed write
+        # clears the counter so the next ID is re-read from Elasticsearch
+        if self._next_incident_num is None:
+            try:
+                self._next_incident_num = self._seed_incident_counter()
+            except:
+                # Fallback to timestamp-based ID
+                return f"INC-{int(time.time()) % 1000:03d}"
+        
+        num = self._next_incident_num
+        self._next_incident_num += 1
+        return f"INC-{num:03d}"
     
-    def create_incident(self, anomaly: Dict[str, Any]) -> Optional[str]:
+    def _build_incident(self, anomaly: Dict[str, Any],
+                        pending: Optional[set] = None) -> Optional[Dict[str, Any]]:
         """
-        Create incident document in Elasticsearch
+        Build an incident document for an anomaly
+        
+        Args:
+            anomaly: Row from the detection query
+            pending: Error signatures already queued in this cycle
         
         Returns:
-            Incident ID if created, None if duplicate
+            Incident document, None if duplicate
         """
+        pending = pending if pending is not None else set()
         service = anomaly.get('service', 'unknown')
         error_type = anomaly.get('error_type', 'UnknownError')
-        max_anomaly_score = anomaly.get('max_anomaly_score', 0)
         
-        # Generate error signature
+        # Signature and dedup come first: a duplicate must not consume an
+        # incident number or pay for building the document
         error_signature = self.generate_error_signature(service, error_type)
         
         # Check for recent duplicate
-        if error_signature in self.recent_incidents:
-            last_incident_time = self.recent_incidents[error_signature]['time']
-            if (datetime.now() - last_incident_time).total_seconds() < self.dedup_window:
-                if self.verbose:
-                    console.print(f"  ⏩ Skipping duplicate: {service} - {error_type}")
-                return None
+        now = time.monotonic()
+        self._expire_dedup(now)
+        duplicate = error_signature in pending
+        if not duplicate and error_signature in self.recent_incidents:
+            if now - self.recent_incidents[error_signature][1] < self.dedup_window:
+                self.recent_incidents.move_to_end(error_signature)
+                duplicate = True
+        if duplicate:
+            self.duplicates_skipped += 1
+            if self.verbose:
+                self._log(f"  ⏩ Skipping duplicate: {service} - {error_type}")
+            return None
         
         # Generate incident ID
         incident_id = self.generate_incident_id()
         
-        # Calculate severity
-        severity = self.calculate_severity(max_anomaly_score)
+        max_anomaly_score = anomaly.get('max_anomaly_score', 0)
+        
+        # Severity is classified server-side by the detection query
+        severity = anomaly.get('incident_severity', 'LOW')
         
         # Create incident document
-        incident = {
-            "@timestamp": datetime.utcnow().isoformat(),
+        timestamp = datetime.now(timezone.utc).isoformat()
+        incident = self._INCIDENT_TEMPLATE.copy()
+        incident.update({
+            "@timestamp": timestamp,
             "incident_id": incident_id,
-            "status": "active",
             "severity": severity,
             "service": service,
-            "environment": "production",
             "error_type": error_type,
             "error_signature": error_signature,
-            "detected_at": datetime.utcnow().isoformat(),
-            "detection_agent": "detective_agent",
+            "detected_at": timestamp,
             "anomaly_scores": {
                 "error": anomaly.get('error_anomaly_score', 0),
                 "latency": anomaly.get('latency_anomaly_score', 0),
@@ -198,38 +339,85 @@ class DetectiveAgent:
                 "latency_mean": anomaly.get('baseline_latency_mean', 0),
                 "cpu_mean": anomaly.get('baseline_cpu_mean', 0)
             },
-            "auto_resolved": False,
-            "tags": ["auto-detected", f"severity-{severity.lower()}"]
-        }
+            "tags": (
+                self._SEVERITY_TAGS.get(severity)
+                or ["auto-detected", f"severity-{severity.lower()}"]
+            )
+        })
+        
+        pending.add(error_signature)
+        return incident
+    
+    def _flush_incidents(self, docs: List[Dict[str, Any]]) -> List[str]:
+        """
+        Write incident documents in a single bulk request
+        
+        Args:
+            docs: Incident documents from _build_incident
+        
+        Returns:
+            IDs of the incidents that were indexed
+        """
+        if not docs:
+            return []
+        
+        actions = ({"_index": "incidents-active", "_source": doc} for doc in docs)
+        created = []
+        written_at = time.monotonic()
         
-        # Insert into Elasticsearch
         try:
-            self.es.index(
-                index="incidents-active",
-                document=incident
+            results = helpers.streaming_bulk(
+                self.es.options(request_timeout=30),
+                actions,
+                chunk_size=500,
+                raise_on_error=False
             )
             
-            # Track for deduplication
-            self.recent_incidents[error_signature] = {
-                'incident_id': incident_id,
-                'time': datetime.now()
-            }
-            
-            # Update statistics
-            self.incidents_created += 1
-            
-            if self.verbose:
-                console.print(
-                    f"[bold red]🚨 INCIDENT CREATED:[/bold red] "
-                    f"{incident_id} - {service} - {error_type} "
-                    f"(severity: {severity}, score: {max_anomaly_score:.2f}σ)"
+            for incident, (ok, item) in zip(docs, results):
+                if not ok:
+                    self._next_incident_num = None
+                    error = item.get("index", {}).get("error")
+                    self._log(
+                        f"❌ Failed to create incident {incident['incident_id']}: {error}",
+                        "red", always=True
+                    )
+                    continue
+                
+                # Track for deduplication
+                self._put_dedup(
+                    incident['error_signature'], (incident['incident_id'], written_at)
                 )
-            
-            return incident_id
+                
+                # Update statistics
+                self.incidents_created += 1
+                created.append(incident['incident_id'])
+                
+                if self.verbose:
+                    self._log(
+                        f"[bold red]🚨 INCIDENT CREATED:[/bold red] "
+                        f"{incident['incident_id']} - {incident['service']} - {incident['error_type']} "
+                        f"(severity: {incident['severity']}, score: {incident['anomaly_scores']['max']:.2f}σ)"
+                    )
             
         except Exception as e:
-            console.print(f"[red]❌ Failed to create incident: {e}[/red]")
+            self._next_incident_num = None
+            self._log(f"❌ Failed to create incidents: {e}", "red", always=True)
+        
+        return created
+    
+    def create_incident(self, anomaly: Dict[str, Any]) -> Optional[str]:
+        """
+        Create incident document in Elasticsearch
+        
+        Returns:
+            Incident ID if created, None if duplicate
+        """
+        incident = self._build_incident(anomaly)
+        if incident is None:
             return None
+        
+        created = self._flush_incidents([incident])
+        return created[0] if created else None
     
     def check_for_anomalies(self):
         """Run one detection cycle"""
@@ -237,68 +425,94 @@ class DetectiveAgent:
         self.last_check_time = datetime.now()
         
         if self.verbose:
-            console.print(f"\n[cyan]🔍 Running anomaly detection check #{self.checks_performed}...[/cyan]")
+            self._log(f"\n🔍 Running anomaly detection check #{self.checks_performed}...", "cyan")
         
         # Execute query
         anomalies = self.execute_detection_query()
         
         if not anomalies:
             if self.verbose:
-                console.print("[green]  ✓ No anomalies detected - all systems healthy[/green]")
+                self._log("  ✓ No anomalies detected - all systems healthy", "green")
             return
         
         # Process each anomaly
-        console.print(f"[yellow]  ⚠️  Detected {len(anomalies)} anomalies[/yellow]")
+        self._log(f"  ⚠️  Detected {len(anomalies)} anomalies", "yellow", always=True)
         
+        # Build every new incident first, then write them in one request
+        pending = set()
+        incidents = []
         for anomaly in anomalies:
-            incident_id = self.create_incident(anomaly)
-            if incident_id:
-                # Could trigger Analyst Agent here in future
-                pass
+            incident = self._build_incident(anomaly, pending)
+            if incident:
+                incidents.append(incident)
+        
+        for incident_id in self._flush_incidents(incidents):
+            # Could trigger Analyst Agent here in future
+            pass
     
     def run_continuous(self):
         """Run continuously until stopped"""
         self.running = True
         
-        console.print(Panel.fit(
-            f"[bold]🕵️  Detective Agent Running[/bold]\n"
-            f"Checking every {self.interval} seconds\n"
-            f"Press Ctrl+C to stop",
-            border_style="cyan"
-        ))
+        self._panel(
+            "🕵️  Detective Agent Running",
+            [f"Checking every {self.interval} seconds", "Press Ctrl+C to stop"],
+            "cyan"
+        )
         
         try:
+            # Checks land on a fixed grid so query time doesn't stretch the period
+            next_tick = time.monotonic()
             while self.running:
                 self.check_for_anomalies()
                 
+                next_tick += self.interval
+                delay = next_tick - time.monotonic()
+                if delay < -self.interval:
+                    # Overran by more than a period; resync rather than
+                    # firing a burst of back-to-back catch-up checks
+                    self._log(
+                        f"⚠️  Check overran the {self.interval}s interval by "
+                        f"{-delay:.0f}s - resyncing schedule",
+                        "yellow", always=True
+                    )
+                    next_tick = time.monotonic() + self.interval
+                    delay = self.interval
+                
                 # Show status
                 if self.verbose:
-                    console.print(
-                        f"[dim]Next check in {self.interval}s "
-                        f"(Checks: {self.checks_performed}, Incidents: {self.incidents_created})[/dim]"
+                    self._log(
+                        f"Next check in {max(0, delay):.0f}s "
+                        f"(Checks: {self.checks_performed}, Incidents: {self.incidents_created})",
+                        "dim"
                     )
                 
                 # Wait for next interval
-                time.sleep(self.interval)
+                time.sleep(max(0, delay))
                 
         except KeyboardInterrupt:
-            console.print("\n[yellow]⏹️  Stopping Detective Agent...[/yellow]")
+            self._log("\n⏹️  Stopping Detective Agent...", "yellow", always=True)
             self.running = False
         
         # Final statistics
-        console.print(Panel.fit(
-            f"[bold]Detective Agent Statistics[/bold]\n"
-            f"Checks performed: {self.checks_performed}\n"
-            f"Incidents created: {self.incidents_created}\n"
-            f"Runtime: {(datetime.now() - self.last_check_time).total_seconds() if self.last_check_time else 0:.0f}s",
-            border_style="green"
-        ))
+        if not self.verbose:
+            return
+        self._panel(
+            "Detective Agent Statistics",
+            [
+                f"Checks performed: {self.checks_performed}",
+                f"Incidents created: {self.incidents_created}",
+                f"Duplicates skipped: {self.duplicates_skipped}",
+                f"Runtime: {(datetime.now() - self.last_check_time).total_seconds() if self.last_check_time else 0:.0f}s"
+            ],
+            "green"
+        )
     
     def run_once(self):
         """Run detection once and exit"""
-        console.print("[cyan]🔍 Running single detection check...[/cyan]")
+        self._log("🔍 Running single detection check...", "cyan", always=True)
         self.check_for_anomalies()
-        console.print("[green]✅ Check complete[/green]")
+        self._log("✅ Check complete", "green", always=True)
 
 
 def main():
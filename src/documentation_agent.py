@@ -7,7 +7,11 @@ Generates post-incident reports and runbook updates
 import os
 import sys
 import json
+import asyncio
+import re
 import argparse
+from contextlib import nullcontext
+from functools import lru_cache
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any
 from pathlib import Path
@@ -19,7 +23,7 @@ load_dotenv()
 # Add src to path for imports
 sys.path.append(str(Path(__file__).parent))
 
-from elasticsearch import Elasticsearch
+from elasticsearch import AsyncElasticsearch
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -29,6 +33,48 @@ from rich import print as rprint
 
 from utils.llm_client import LLMClient
 
+# Root-cause keyword rules for runbook categories, checked in order; each
+# is one case-insensitive substring alternation
+CATEGORY_RULES = [
+    (re.compile("|".join(map(re.escape, terms)), re.IGNORECASE), category)
+    for terms, category in (
+        (("memory", "leak", "cpu", "high load"), "Performance Issues"),
+        (("connection", "timeout", "network"), "Connection Issues"),
+        (("deploy", "deployment", "version"), "Deployment Issues"),
+        (("database", "db", "query"), "Database Issues"),
+        (("service", "down", "unavailable"), "Service Unavailability"),
+    )
+]
+
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp(timestamp_str: str) -> datetime:
+    """Parse an ISO-8601 timestamp (trailing Z allowed); the same few repeat per report"""
+    return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+
+
+@lru_cache(maxsize=1024)
+def _format_timestamp(timestamp_str: str) -> str:
+    """Timeline display form of a timestamp"""
+    if not timestamp_str:
+        return "Not available"
+    try:
+        return _parse_timestamp(timestamp_str).strftime("%Y-%m-%d %H:%M:%S UTC")
+    except:
+        return timestamp_str
+
+
+@lru_cache(maxsize=1024)
+def _format_date(timestamp_str: str) -> str:
+    """Date-only display form of a timestamp"""
+    if not timestamp_str:
+        return "Unknown"
+    try:
+        return _parse_timestamp(timestamp_str).strftime("%Y-%m-%d")
+    except:
+        return timestamp_str
+
+
 class DocumentationAgent:
     """
     Autonomous agent for incident documentation and runbook management
@@ -41,6 +87,9 @@ class DocumentationAgent:
     - Future: Update Elasticsearch runbook index
     """
     
+    # Incidents documented at once by generate_documentation_for_incidents
+    MAX_CONCURRENT_DOCS = 5
+    
     def __init__(self, verbose: bool = True):
         self.console = Console()
         self.verbose = verbose
@@ -61,15 +110,17 @@ class DocumentationAgent:
             self.console.print("📚 [bold green]Documentation Agent initialized[/bold green]")
     
     def _setup_elasticsearch(self):
-        """Setup Elasticsearch connection"""
+        """Setup Elasticsearch client (connection is verified in connect())"""
+        self.es = AsyncElasticsearch(
+            cloud_id=os.getenv("ELASTIC_CLOUD_ID"),
+            api_key=os.getenv("ELASTIC_API_KEY")
+        )
+    
+    async def connect(self):
+        """Verify the Elasticsearch connection; call once inside the event loop"""
         try:
-            self.es = Elasticsearch(
-                cloud_id=os.getenv("ELASTIC_CLOUD_ID"),
-                api_key=os.getenv("ELASTIC_API_KEY")
-            )
-            
             # Test connection
-            if self.es.ping():
+            if await self.es.ping():
                 if self.verbose:
                     self.console.print("✅ [green]Elasticsearch connected[/green]")
             else:
@@ -77,8 +128,13 @@ class DocumentationAgent:
                 
         except Exception as e:
             self.console.print(f"❌ [red]Elasticsearch setup failed: {e}[/red]")
+            await self.close()
             raise
     
+    async def close(self):
+        """Release the Elasticsearch connection pool"""
+        await self.es.close()
+    
     def _setup_llm(self):
         """Setup LLM client"""
         try:
@@ -89,7 +145,58 @@ class DocumentationAgent:
             self.console.print(f"❌ [red]LLM setup failed: {e}[/red]")
             raise
     
-    def load_complete_incident_data(self, incident_id: str) -> Optional[Dict[str, Any]]:
+    def _incident_query(self, incident_id: str) -> Dict[str, Any]:
+        """Term query matching one incident by ID"""
+        return {
+            "query": {
+                "term": {
+                    "incident_id.keyword": incident_id
+                }
+            }
+        }
+    
+    def _check_complete(self, incident_id: str, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Extract an incident from a search response and check its lifecycle data
+        
+        Args:
+            incident_id: Incident ID the search was for
+            result: Search response (or one msearch sub-response)
+            
+        Returns:
+            Complete incident data or None if not found or incomplete
+        """
+        if result["hits"]["total"]["value"] > 0:
+            incident = result["hits"]["hits"][0]["_source"]
+            
+            # Check if incident has complete lifecycle data
+            required_fields = ["status", "root_cause", "remediation_plan"]
+            missing_fields = [field for field in required_fields if not incident.get(field)]
+            
+            if missing_fields:
+                self.console.print(f"⚠️  [yellow]Incident {incident_id} incomplete - missing: {missing_fields}[/yellow]")
+                self.console.print("   Use Analyst and Remediation agents to complete the incident first")
+                return None
+            
+            if self.verbose:
+                self.console.print(f"✅ [green]Complete incident data found[/green]")
+                status = incident.get("status", "unknown")
+                self.console.print(f"   Status: {status}")
+                if incident.get("root_cause"):
+                    self.console.print(f"   Root cause: {incident.get('root_cause', 'Unknown')[:50]}...")
+                if incident.get("remediation_plan"):
+                    plan = incident.get("remediation_plan", {})
+                    workflow = plan.get("workflow_name", "Unknown")
+                    auto_approved = plan.get("auto_approved", False)
+                    approval_status = "auto-approved" if auto_approved else "manual approval"
+                    self.console.print(f"   Remediation: {workflow} ({approval_status})")
+            
+            return incident
+        else:
+            self.console.print(f"❌ [red]Incident {incident_id} not found[/red]")
+            return None
+    
+    async def load_complete_incident_data(self, incident_id: str) -> Optional[Dict[str, Any]]:
         """
         Load complete incident data including detection, analysis, and remediation
         
@@ -104,53 +211,55 @@ class DocumentationAgent:
                 self.console.print(f"📥 Loading complete incident data: {incident_id}")
             
             # Search for incident by ID
-            query = {
-                "query": {
-                    "term": {
-                        "incident_id.keyword": incident_id
-                    }
-                }
-            }
-            
-            result = self.es.search(
+            result = await self.es.search(
                 index="incidentiq-incidents",
-                body=query
+                body=self._incident_query(incident_id)
             )
             
-            if result["hits"]["total"]["value"] > 0:
-                incident = result["hits"]["hits"][0]["_source"]
-                
-                # Check if incident has complete lifecycle data
-                required_fields = ["status", "root_cause", "remediation_plan"]
-                missing_fields = [field for field in required_fields if not incident.get(field)]
-                
-                if missing_fields:
-                    self.console.print(f"⚠️  [yellow]Incident {incident_id} incomplete - missing: {missing_fields}[/yellow]")
-                    self.console.print("   Use Analyst and Remediation agents to complete the incident first")
-                    return None
-                
-                if self.verbose:
-                    self.console.print(f"✅ [green]Complete incident data found[/green]")
-                    status = incident.get("status", "unknown")
-                    self.console.print(f"   Status: {status}")
-                    if incident.get("root_cause"):
-                        self.console.print(f"   Root cause: {incident.get('root_cause', 'Unknown')[:50]}...")
-                    if incident.get("remediation_plan"):
-                        plan = incident.get("remediation_plan", {})
-                        workflow = plan.get("workflow_name", "Unknown")
-                        auto_approved = plan.get("auto_approved", False)
-                        approval_status = "auto-approved" if auto_approved else "manual approval"
-                        self.console.print(f"   Remediation: {workflow} ({approval_status})")
-                
-                return incident
-            else:
-                self.console.print(f"❌ [red]Incident {incident_id} not found[/red]")
-                return None
+            return self._check_complete(incident_id, result)
                 
         except Exception as e:
             self.console.print(f"❌ [red]Error loading incident: {e}[/red]")
             return None
     
+    async def load_complete_incident_data_batch(self, incident_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Load complete incident data for several incidents in one request
+        
+        Args:
+            incident_ids: Incident IDs to load
+            
+        Returns:
+            Incident data (or None if not found/incomplete) keyed by incident ID
+        """
+        incidents: Dict[str, Optional[Dict[str, Any]]] = {incident_id: None for incident_id in incident_ids}
+        if not incident_ids:
+            return incidents
+        
+        try:
+            if self.verbose:
+                self.console.print(f"📥 Loading complete incident data: {', '.join(incident_ids)}")
+            
+            # One msearch body: empty header (index comes from the request)
+            # followed by the term query, per incident
+            searches = []
+            for incident_id in incident_ids:
+                searches.append({})
+                searches.append({**self._incident_query(incident_id), "size": 1})
+            
+            result = await self.es.msearch(index="incidentiq-incidents", searches=searches)
+            
+            for incident_id, response in zip(incident_ids, result["responses"]):
+                if "error" in response:
+                    self.console.print(f"❌ [red]Error loading incident {incident_id}: {response['error']}[/red]")
+                    continue
+                incidents[incident_id] = self._check_complete(incident_id, response)
+                
+        except Exception as e:
+            self.console.print(f"❌ [red]Error loading incidents: {e}[/red]")
+        
+        return incidents
+    
     def generate_post_incident_report(self, incident: Dict[str, Any]) -> str:
         """
         Generate comprehensive post-incident report
@@ -181,8 +290,8 @@ class DocumentationAgent:
             mttr_text = "Not calculated"
             if detected_time and plan_time:
                 try:
-                    detected_dt = datetime.fromisoformat(detected_time.replace('Z', '+00:00'))
-                    plan_dt = datetime.fromisoformat(plan_time.replace('Z', '+00:00'))
+                    detected_dt = _parse_timestamp(detected_time)
+                    plan_dt = _parse_timestamp(plan_time)
                     mttr_seconds = (plan_dt - detected_dt).total_seconds()
                     mttr_minutes = int(mttr_seconds / 60)
                     mttr_text = f"~{mttr_minutes} minutes"
@@ -194,21 +303,13 @@ class DocumentationAgent:
             workflow_name = remediation_plan.get("workflow_name", "Unknown")
             execution_steps = remediation_plan.get("execution_steps", [])
             auto_approved = remediation_plan.get("auto_approved", False)
-            
-            # Format timeline
-            def format_timestamp(timestamp_str):
-                if not timestamp_str:
-                    return "Not available"
-                try:
-                    dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                    return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
-                except:
-                    return timestamp_str
+            confidence = incident.get("confidence", 0)
             
             # Generate report
-            report = f"""# Post-Incident Report: {incident_id}
+            parts: List[str] = []
+            parts.append(f"""# Post-Incident Report: {incident_id}
 
-**Date:** {format_timestamp(detected_time)}  
+**Date:** {_format_timestamp(detected_time)}  
 **Severity:** {severity.upper()}  
 **Status:** {incident.get("status", "Unknown").title()}
 
@@ -220,9 +321,9 @@ The incident was detected through automated monitoring and processed through our
 
 ## Timeline
 
-- **Detected:** {format_timestamp(detected_time)}
-- **Analyzed:** {format_timestamp(analyzed_time)}
-- **Plan Generated:** {format_timestamp(plan_time)}
+- **Detected:** {_format_timestamp(detected_time)}
+- **Analyzed:** {_format_timestamp(analyzed_time)}
+- **Plan Generated:** {_format_timestamp(plan_time)}
 - **Status:** {"Auto-approved" if auto_approved else "Manual approval required"}
 
 ## Root Cause
@@ -231,30 +332,28 @@ The incident was detected through automated monitoring and processed through our
 
 **Detailed Reasoning:** {reasoning}
 
-**Confidence Level:** {incident.get("confidence", 0):.1%}
+**Confidence Level:** {confidence:.1%}
 
 ## Resolution
 
 **Recommended Workflow:** `{workflow_name}`
 
-**Execution Plan:**"""
+**Execution Plan:**""")
             
             # Add execution steps
             if execution_steps:
-                for i, step in enumerate(execution_steps, 1):
-                    report += f"\n{i}. {step}"
+                parts.extend(f"\n{i}. {step}" for i, step in enumerate(execution_steps, 1))
             else:
-                report += "\n1. Manual intervention required - refer to runbook"
+                parts.append("\n1. Manual intervention required - refer to runbook")
             
             # Add rollback plan
             rollback_plan = remediation_plan.get("rollback_plan", [])
             if rollback_plan:
-                report += f"\n\n**Rollback Procedures:**"
-                for i, step in enumerate(rollback_plan, 1):
-                    report += f"\n{i}. {step}"
+                parts.append("\n\n**Rollback Procedures:**")
+                parts.extend(f"\n{i}. {step}" for i, step in enumerate(rollback_plan, 1))
             
             # Add impact and MTTR
-            report += f"""
+            parts.append(f"""
 
 ## Impact
 
@@ -264,22 +363,21 @@ The incident was detected through automated monitoring and processed through our
 
 ## Similar Incidents
 
-"""
+""")
             
             # Add similar incidents if available
             similar_incidents = incident.get("similar_incidents", [])
             if similar_incidents:
-                for sim_id in similar_incidents:
-                    report += f"- {sim_id} (identified during analysis)\n"
+                parts.extend(f"- {sim_id} (identified during analysis)\n" for sim_id in similar_incidents)
             else:
-                report += "No similar incidents identified during analysis\n"
+                parts.append("No similar incidents identified during analysis\n")
             
             # Add lessons learned and prevention
-            report += f"""
+            parts.append(f"""
 ## Lessons Learned
 
 - Automated detection successfully identified the issue
-- Root cause analysis provided {incident.get("confidence", 0):.0%} confidence in findings
+- Root cause analysis provided {confidence:.0%} confidence in findings
 - {"Workflow auto-approved for quick resolution" if auto_approved else "Manual approval ensures safety for high-risk operations"}
 
 ## Prevention
@@ -291,7 +389,8 @@ Future similar incidents can be prevented by:
 
 ---
 *Report generated by IncidentIQ Documentation Agent on {datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")}*
-"""
+""")
+            report = "".join(parts)
             
             if self.verbose:
                 lines = len(report.split('\n'))
@@ -333,32 +432,22 @@ Future similar incidents can be prevented by:
             workflow_name = remediation_plan.get("workflow_name", "manual_intervention")
             execution_steps = remediation_plan.get("execution_steps", [])
             
-            # Format date
-            def format_date(timestamp_str):
-                if not timestamp_str:
-                    return "Unknown"
-                try:
-                    dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                    return dt.strftime("%Y-%m-%d")
-                except:
-                    return timestamp_str
-            
             # Generate runbook update
-            runbook = f"""## {error_type}
+            parts: List[str] = []
+            parts.append(f"""## {error_type}
 
-**Last Occurred:** {format_date(detected_time)}  
+**Last Occurred:** {_format_date(detected_time)}  
 **Incident ID:** {incident_id}  
 **Severity:** {incident.get("severity", "Unknown").upper()}
 
 ### Symptoms
 
-"""
+""")
             
             # Add symptoms
-            for symptom in symptoms:
-                runbook += f"- {symptom}\n"
+            parts.extend(f"- {symptom}\n" for symptom in symptoms)
             
-            runbook += f"""
+            parts.append(f"""
 ### Root Cause
 
 {root_cause}
@@ -368,43 +457,40 @@ Future similar incidents can be prevented by:
 **Workflow:** `{workflow_name}`
 
 **Steps:**
-"""
+""")
             
             # Add resolution steps
             if execution_steps:
-                for i, step in enumerate(execution_steps, 1):
-                    runbook += f"{i}. {step}\n"
+                parts.extend(f"{i}. {step}\n" for i, step in enumerate(execution_steps, 1))
             else:
-                runbook += "1. Manual investigation required\n2. Follow escalation procedures\n"
+                parts.append("1. Manual investigation required\n2. Follow escalation procedures\n")
             
             # Add validation steps
             validation_steps = remediation_plan.get("validation_steps", [])
             if validation_steps:
-                runbook += f"\n**Validation:**\n"
-                for i, step in enumerate(validation_steps, 1):
-                    runbook += f"{i}. {step}\n"
+                parts.append("\n**Validation:**\n")
+                parts.extend(f"{i}. {step}\n" for i, step in enumerate(validation_steps, 1))
             
             # Add rollback information
             rollback_plan = remediation_plan.get("rollback_plan", [])
             if rollback_plan:
-                runbook += f"\n**Rollback (if needed):**\n"
-                for i, step in enumerate(rollback_plan, 1):
-                    runbook += f"{i}. {step}\n"
+                parts.append("\n**Rollback (if needed):**\n")
+                parts.extend(f"{i}. {step}\n" for i, step in enumerate(rollback_plan, 1))
             
             # Add related incidents
             similar_incidents = incident.get("similar_incidents", [])
-            runbook += f"\n### Related Incidents\n\n"
+            parts.append("\n### Related Incidents\n\n")
             
             if similar_incidents:
                 # Calculate similarity scores (placeholder - would need actual similarity calculation)
                 for sim_id in similar_incidents:
                     similarity = 85 + (hash(sim_id) % 15)  # Fake similarity 85-99%
-                    runbook += f"- {sim_id} (similarity: {similarity}%)\n"
+                    parts.append(f"- {sim_id} (similarity: {similarity}%)\n")
             else:
-                runbook += "- No related incidents identified\n"
+                parts.append("- No related incidents identified\n")
             
             # Add prevention notes
-            runbook += f"""
+            parts.append(f"""
 ### Prevention
 
 - Monitor for symptoms listed above
@@ -419,7 +505,8 @@ Future similar incidents can be prevented by:
 
 ---
 *Updated by IncidentIQ Documentation Agent on {datetime.now(timezone.utc).strftime("%Y-%m-%d")}*
-"""
+""")
+            runbook = "".join(parts)
             
             if self.verbose:
                 lines = len(runbook.split('\n'))
@@ -431,22 +518,14 @@ Future similar incidents can be prevented by:
             self.console.print(f"❌ [red]Error generating runbook update: {e}[/red]")
             return f"## Error\n\nFailed to generate runbook update: {e}"
     
-    def _categorize_error_type(self, root_cause: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _categorize_error_type(root_cause: str) -> str:
         """Categorize error type from root cause"""
-        root_cause_lower = root_cause.lower()
-        
-        if any(term in root_cause_lower for term in ["memory", "leak", "cpu", "high load"]):
-            return "Performance Issues"
-        elif any(term in root_cause_lower for term in ["connection", "timeout", "network"]):
-            return "Connection Issues"
-        elif any(term in root_cause_lower for term in ["deploy", "deployment", "version"]):
-            return "Deployment Issues"
-        elif any(term in root_cause_lower for term in ["database", "db", "query"]):
-            return "Database Issues"
-        elif any(term in root_cause_lower for term in ["service", "down", "unavailable"]):
-            return "Service Unavailability"
-        else:
-            return "General Service Issues"
+        for pattern, category in CATEGORY_RULES:
+            if pattern.search(root_cause):
+                return category
+        return "General Service Issues"
     
     def _extract_symptoms(self, incident: Dict[str, Any]) -> List[str]:
         """Extract symptoms from incident data"""
@@ -482,7 +561,23 @@ Future similar incidents can be prevented by:
         
         return symptoms
     
-    def save_documentation(self, incident_id: str, report: str, runbook: str) -> Dict[str, bool]:
+    def _write_file(self, path: Path, content: str):
+        """Write one documentation file (blocking)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+    
+    async def _save_file(self, path: Path, content: str, label: str) -> bool:
+        """Write a documentation file off the event loop, reporting the outcome"""
+        try:
+            await asyncio.to_thread(self._write_file, path, content)
+            if self.verbose:
+                self.console.print(f"✅ [green]{label.title()} saved: {path}[/green]")
+            return True
+        except Exception as e:
+            self.console.print(f"❌ [red]Error saving {label}: {e}[/red]")
+            return False
+    
+    async def save_documentation(self, incident_id: str, report: str, runbook: str) -> Dict[str, bool]:
         """
         Save post-incident report and runbook update as markdown files
         
@@ -498,50 +593,29 @@ Future similar incidents can be prevented by:
             if self.verbose:
                 self.console.print("💾 Saving documentation files...")
             
-            results = {"report": False, "runbook": False}
-            
-            # Save post-incident report
-            try:
-                report_filename = f"post_incident_report_{incident_id.lower()}.md"
-                report_path = self.docs_dir / report_filename
-                
-                with open(report_path, 'w', encoding='utf-8') as f:
-                    f.write(report)
-                
-                results["report"] = True
-                if self.verbose:
-                    self.console.print(f"✅ [green]Report saved: {report_path}[/green]")
-                
-            except Exception as e:
-                self.console.print(f"❌ [red]Error saving report: {e}[/red]")
-            
-            # Save runbook update
-            try:
-                runbook_filename = f"runbook_update_{incident_id.lower()}.md"
-                runbook_path = self.docs_dir / runbook_filename
-                
-                with open(runbook_path, 'w', encoding='utf-8') as f:
-                    f.write(runbook)
-                
-                results["runbook"] = True
-                if self.verbose:
-                    self.console.print(f"✅ [green]Runbook saved: {runbook_path}[/green]")
-                
-            except Exception as e:
-                self.console.print(f"❌ [red]Error saving runbook: {e}[/red]")
+            # Both files are written concurrently
+            report_saved, runbook_saved = await asyncio.gather(
+                self._save_file(self.docs_dir / f"post_incident_report_{incident_id.lower()}.md", report, "report"),
+                self._save_file(self.docs_dir / f"runbook_update_{incident_id.lower()}.md", runbook, "runbook")
+            )
             
-            return results
+            return {"report": report_saved, "runbook": runbook_saved}
             
         except Exception as e:
             self.console.print(f"❌ [red]Error in save_documentation: {e}[/red]")
             return {"report": False, "runbook": False}
     
-    def generate_documentation_for_incident(self, incident_id: str) -> Optional[Dict[str, Any]]:
+    async def generate_documentation_for_incident(self, incident_id: str,
+                                                  incident: Optional[Dict[str, Any]] = None,
+                                                  show_progress: bool = True) -> Optional[Dict[str, Any]]:
         """
         Complete documentation generation workflow
         
         Args:
             incident_id: ID of incident to document
+            incident: Already-loaded incident data (skips the Elasticsearch fetch)
+            show_progress: Show a spinner (verbose mode on a terminal only;
+                           rich allows one live display at a time)
             
         Returns:
             Documentation results or None if failed
@@ -549,31 +623,40 @@ Future similar incidents can be prevented by:
         try:
             self.reports_generated += 1
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=self.console
-            ) as progress:
+            progress = None
+            if show_progress and self.verbose and self.console.is_terminal:
+                progress = Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    console=self.console
+                )
+            
+            with progress or nullcontext():
+                task = progress.add_task("Loading incident data...", total=None) if progress else None
+                
+                def step(description: str):
+                    if progress:
+                        progress.update(task, description=description)
                 
                 # Step 1: Load complete incident data
-                task = progress.add_task("Loading incident data...", total=None)
-                incident = self.load_complete_incident_data(incident_id)
+                if incident is None:
+                    incident = await self.load_complete_incident_data(incident_id)
                 if not incident:
                     return None
                 
                 # Step 2: Generate post-incident report
-                progress.update(task, description="Generating post-incident report...")
+                step("Generating post-incident report...")
                 report = self.generate_post_incident_report(incident)
                 
                 # Step 3: Generate runbook update
-                progress.update(task, description="Generating runbook update...")
+                step("Generating runbook update...")
                 runbook = self.generate_runbook_update(incident)
                 
                 # Step 4: Save documentation
-                progress.update(task, description="Saving documentation...")
-                save_results = self.save_documentation(incident_id, report, runbook)
+                step("Saving documentation...")
+                save_results = await self.save_documentation(incident_id, report, runbook)
                 
-                progress.update(task, description="✅ Documentation complete!")
+                step("✅ Documentation complete!")
             
             if save_results["report"] or save_results["runbook"]:
                 if save_results["report"] and save_results["runbook"]:
@@ -594,6 +677,35 @@ Future similar incidents can be prevented by:
             self.console.print(f"❌ [red]Documentation workflow failed: {e}[/red]")
             return None
     
+    async def generate_documentation_for_incidents(self, incident_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Document several incidents from a single prefetch
+        
+        Incidents are loaded with one msearch, then documented concurrently,
+        at most MAX_CONCURRENT_DOCS at a time.
+        
+        Args:
+            incident_ids: IDs of incidents to document
+            
+        Returns:
+            Documentation results (or None if failed) keyed by incident ID
+        """
+        incidents = await self.load_complete_incident_data_batch(incident_ids)
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_DOCS)
+        
+        async def document(incident_id: str, incident: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+            if not incident:
+                return None
+            async with semaphore:
+                return await self.generate_documentation_for_incident(
+                    incident_id, incident, show_progress=False
+                )
+        
+        results = await asyncio.gather(
+            *(document(incident_id, incident) for incident_id, incident in incidents.items())
+        )
+        return dict(zip(incidents, results))
+    
     def list_generated_docs(self) -> List[Dict[str, Any]]:
         """List all generated documentation files"""
         try:
@@ -629,6 +741,15 @@ Future similar incidents can be prevented by:
         }
 
 
+async def _document(agent: DocumentationAgent, incident_id: str) -> Optional[Dict[str, Any]]:
+    """Connect, document one incident and release the connection pool"""
+    await agent.connect()
+    try:
+        return await agent.generate_documentation_for_incident(incident_id)
+    finally:
+        await agent.close()
+
+
 def main():
     """Main function for testing and demonstration"""
     parser = argparse.ArgumentParser(description="IncidentIQ Documentation Agent")
@@ -681,7 +802,7 @@ def main():
         
         # Generate documentation
         console.print(f"\n🎯 Generating documentation for: {args.incident}")
-        result = agent.generate_documentation_for_incident(args.incident)
+        result = asyncio.run(_document(agent, args.incident))
         
         if result:
             # Display results
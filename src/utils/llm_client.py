@@ -3,7 +3,7 @@
 import os
 import time
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -229,15 +229,86 @@ class LLMClient:
         
         raise Exception("LLM generation failed: max retries exceeded")
     
-    def _generate_gemini(
+    def stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+        response_format: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream a text response from the LLM as it is generated
+        
+        Unlike generate(), there are no retries or provider fallback: text
+        may already have been consumed when an error occurs. Closing the
+        iterator early stops generation.
+        
+        Args:
+            prompt: User prompt/question
+            system_prompt: System instructions (optional)
+            temperature: Randomness (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+            response_format: "json" to force JSON output
+        
+        Yields:
+            Response text chunks
+        """
+        self.rate_limiter.wait_if_needed()
+        
+        # Counted even if the caller closes the stream early: the request
+        # was made and counts against the rate limit
+        try:
+            if self.provider == "gemini":
+                contents, config = self._gemini_request(prompt, system_prompt, temperature, max_tokens, response_format)
+                usage = None
+                for chunk in self.client.models.generate_content_stream(
+                    model="gemini-2.5-flash",
+                    contents=contents,
+                    config=config
+                ):
+                    if chunk.candidates and chunk.candidates[0].finish_reason == types.FinishReason.SAFETY:
+                        raise Exception("Response blocked by safety filters")
+                    if getattr(chunk, 'usage_metadata', None):
+                        usage = chunk.usage_metadata
+                    if chunk.text:
+                        yield chunk.text
+                
+                # Usage is cumulative; the last chunk carries the total
+                if usage and usage.total_token_count:
+                    self.total_tokens += usage.total_token_count
+                    self.total_cost += (usage.total_token_count / 1_000_000) * 0.15
+            else:
+                content = prompt
+                if response_format == "json":
+                    content += "\n\nIMPORTANT: Respond with valid JSON only, no markdown, no other text."
+                
+                with self.client.messages.stream(
+                    model="claude-3-5-sonnet-20241022",
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    system=system_prompt or "You are a helpful assistant.",
+                    messages=[{"role": "user", "content": content}]
+                ) as response:
+                    yield from response.text_stream
+                    usage = response.get_final_message().usage
+                
+                tokens = usage.input_tokens + usage.output_tokens
+                self.total_tokens += tokens
+                self.total_cost += (tokens / 1_000_000) * 9.0
+        finally:
+            self.rate_limiter.record_call()
+            self.api_calls += 1
+    
+    def _gemini_request(
         self,
         prompt: str,
         system_prompt: Optional[str],
         temperature: float,
         max_tokens: int,
         response_format: Optional[str]
-    ) -> str:
-        """Generate response using Gemini with new google.genai SDK"""
+    ) -> Tuple[List[Dict[str, Any]], Any]:
+        """Build Gemini contents and generation config"""
         
         # Build content list
         contents = []
@@ -277,6 +348,20 @@ class LLMClient:
             ]
         )
         
+        return contents, config
+    
+    def _generate_gemini(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[str]
+    ) -> str:
+        """Generate response using Gemini with new google.genai SDK"""
+        
+        contents, config = self._gemini_request(prompt, system_prompt, temperature, max_tokens, response_format)
+        
         # Call new API
         response = self.client.models.generate_content(
             model="gemini-2.5-flash",